@@ -0,0 +1,60 @@
+"""
+Benchmark clean_dataframe on a synthetic full-day Statcast chunk.
+
+Compares the current column-wise cleaner with the previous implementation
+(copy + select_dtypes + per-row date parsing + replace-to-None) and prints
+rows/sec for each.
+
+Usage:
+    python -m benchmarks.bench_clean_dataframe [--rows 4500] [--repeat 20]
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from benchmarks.synthetic import synthetic_day_csv
+from src.statcast_fetch import _parse_csv, clean_dataframe
+
+
+def legacy_clean_dataframe(df_chunk):
+    """The cleaner as it was before the column-wise rewrite."""
+    df_chunk = df_chunk.copy()
+    for col in df_chunk.select_dtypes(include=["datetime64"]).columns:
+        df_chunk[col] = df_chunk[col].astype(str)
+    if "game_date" in df_chunk.columns:
+        df_chunk["game_date"] = pd.to_datetime(df_chunk["game_date"], errors="coerce").dt.strftime("%Y-%m-%d")
+    return df_chunk.replace({np.nan: None, pd.NA: None, None: None})
+
+
+def rows_per_second(clean, df, repeat):
+    clean(df)  # warm-up
+    start = time.perf_counter()
+    for _ in range(repeat):
+        clean(df)
+    elapsed = time.perf_counter() - start
+    return len(df) * repeat / elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark clean_dataframe")
+    parser.add_argument("--rows", type=int, default=4500, help="Rows in the synthetic day (about 15 games)")
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    df = _parse_csv(synthetic_day_csv(args.rows), "2024-06-15", "2024-06-15")
+    print(f"Synthetic day: {len(df)} rows x {len(df.columns)} columns")
+
+    before = rows_per_second(legacy_clean_dataframe, df, args.repeat)
+    after = rows_per_second(clean_dataframe, df, args.repeat)
+    print(f"before: {before:12,.0f} rows/sec")
+    print(f"after:  {after:12,.0f} rows/sec  ({after / before:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
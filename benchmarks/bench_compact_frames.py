@@ -0,0 +1,61 @@
+"""
+Benchmark memory per chunk with and without --compact_frames.
+
+Parses the same synthetic full-day chunk both ways, cleans it, and reports
+the frame's deep memory footprint (Python string objects and Arrow buffers
+included) and parse + clean throughput.
+
+Usage:
+    python -m benchmarks.bench_compact_frames [--rows 4500] [--repeat 10] [--object_strings]
+
+--object_strings reproduces pandas 2.x, where default string columns are
+Python objects; pandas 3 already stores them in Arrow buffers.
+"""
+import argparse
+import os
+import sys
+import time
+
+import pandas as pd
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from benchmarks.synthetic import synthetic_day_csv
+from src.statcast_fetch import _parse_csv, clean_dataframe
+
+
+def measure(content, compact, repeat):
+    df = clean_dataframe(_parse_csv(content, "2024-06-15", "2024-06-15", compact=compact), inplace=True)
+    size = int(df.memory_usage(deep=True).sum())
+
+    start = time.perf_counter()
+    for _ in range(repeat):
+        clean_dataframe(_parse_csv(content, "2024-06-15", "2024-06-15", compact=compact), inplace=True)
+    rate = len(df) * repeat / (time.perf_counter() - start)
+    return df, size, rate
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark compact frames")
+    parser.add_argument("--rows", type=int, default=4500, help="Rows in the synthetic day (about 15 games)")
+    parser.add_argument("--repeat", type=int, default=10)
+    parser.add_argument("--object_strings", action="store_true",
+        help="Hold default string columns as Python objects, as pandas 2.x does")
+    args = parser.parse_args()
+
+    if args.object_strings:
+        pd.set_option("future.infer_string", False)
+
+    content = synthetic_day_csv(args.rows)
+    default_df, default_size, default_rate = measure(content, False, args.repeat)
+    compact_df, compact_size, compact_rate = measure(content, True, args.repeat)
+
+    print(f"Synthetic day: {len(default_df)} rows x {len(default_df.columns)} columns, "
+          f"{len(content) / 1024 ** 2:.1f} MB CSV")
+    print(f"default: {default_size / 1024 ** 2:8.2f} MB per chunk  {default_rate:12,.0f} rows/sec")
+    print(f"compact: {compact_size / 1024 ** 2:8.2f} MB per chunk  {compact_rate:12,.0f} rows/sec  "
+          f"({default_size / compact_size:.1f}x smaller)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,179 @@
+"""
+Offline benchmark suite for the download path.
+
+Starts a SavantStub on localhost and reports throughput (rows/sec and MB/sec)
+for each stage on its own and for the whole download:
+
+    fetch_chunk        _fetch_chunk over one-day windows, one at a time
+    clean_dataframe    clean_dataframe on the fetched chunks
+    csv_writer         CSVWriter, one file per chunk
+    csv_writer_gzip    CSVWriter with gzip compression
+    parquet_writer     ParquetWriter, hive-partitioned by day
+    bq_parquet_buffer  df_to_parquet_buffer, the BigQuery load payload (no upload)
+    run_statcast_download  both leagues end to end into a CSVWriter
+
+Usage:
+    python -m benchmarks.run_benchmarks [--days 7] [--latency 0.05] [--max_concurrent 8]
+        [--tail_every 10 --tail_latency 10]
+        [--output results.json] [--baseline results.json --tolerance 0.2]
+
+With --baseline the run exits with status 1 when any benchmark's rows/sec
+falls more than --tolerance below the baseline's.
+"""
+import argparse
+import datetime
+import json
+import logging
+import os
+import shutil
+import sys
+import tempfile
+import time
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from benchmarks.savant_stub import SavantStub
+from src.config.config import PARAMS_DICT
+from src.statcast_fetch import _fetch_chunk, clean_dataframe, run_statcast_download
+from src.utils.bq_schema_helper import df_to_parquet_buffer
+from src.writers.csv_writer import CSVWriter
+from src.writers.parquet_writer import ParquetWriter
+
+
+def _timed(rows, size, func):
+    start = time.perf_counter()
+    func()
+    seconds = time.perf_counter() - start
+    return {"rows": rows, "seconds": round(seconds, 4),
+            "rows_per_sec": round(rows / seconds, 1) if seconds else 0.0,
+            "mb_per_sec": round(size / 1024 ** 2 / seconds, 2) if seconds else 0.0}
+
+
+def _days(start_date, days):
+    first = datetime.date.fromisoformat(start_date)
+    return [(first + datetime.timedelta(days=n)).isoformat() for n in range(days)]
+
+
+def run_suite(stub, start_date="2024-06-03", days=7, max_workers=4, engine="thread"):
+    """
+    Runs every benchmark against a started stub.
+
+    Returns:
+        dict: Benchmark name -> {"rows", "seconds", "rows_per_sec", "mb_per_sec"}.
+    """
+    results = {}
+    dates = _days(start_date, days)
+    raw_bytes = sum(len(stub.body("mlb", day, day)[0]) for day in dates)
+
+    chunks = []
+    results["fetch_chunk"] = _timed(
+        stub.expected_rows("mlb", dates[0], dates[-1]), raw_bytes,
+        lambda: chunks.extend(_fetch_chunk(day, day, stub.mlb_url, {}, PARAMS_DICT) for day in dates))
+
+    rows = sum(len(chunk) for chunk in chunks)
+    frame_bytes = sum(int(chunk.memory_usage(deep=True).sum()) for chunk in chunks)
+    cleaned = []
+    results["clean_dataframe"] = _timed(
+        rows, frame_bytes, lambda: cleaned.extend(clean_dataframe(chunk) for chunk in chunks))
+
+    tmp = tempfile.mkdtemp(prefix="statcast_bench_")
+    try:
+        def write_csv(compression):
+            writer = CSVWriter(os.path.join(tmp, f"csv_{compression}"), compression=compression)
+            for day, chunk in zip(dates, cleaned):
+                writer.write(chunk, "statcast_mlb.csv", day, day)
+
+        results["csv_writer"] = _timed(rows, frame_bytes, lambda: write_csv(None))
+        results["csv_writer_gzip"] = _timed(rows, frame_bytes, lambda: write_csv("gzip"))
+
+        def write_parquet():
+            writer = ParquetWriter(os.path.join(tmp, "parquet"))
+            for chunk in cleaned:
+                writer.write(chunk, "mlb")
+
+        results["parquet_writer"] = _timed(rows, frame_bytes, write_parquet)
+
+        fields = ParquetWriter.schema_fields(cleaned[0].columns)
+        results["bq_parquet_buffer"] = _timed(
+            rows, frame_bytes, lambda: [df_to_parquet_buffer(chunk, fields) for chunk in cleaned])
+
+        end_to_end_rows = (stub.expected_rows("mlb", dates[0], dates[-1])
+                           + stub.expected_rows("milb", dates[0], dates[-1]))
+        served_before = stub.stats["bytes"]
+        csv_writer = CSVWriter(os.path.join(tmp, "download"))
+        with patch("src.statcast_fetch.BASE_MLB_URL", stub.mlb_url), \
+                patch("src.statcast_fetch.BASE_MiLB_URL", stub.milb_url):
+            results["run_statcast_download"] = _timed(
+                end_to_end_rows, 0,
+                lambda: run_statcast_download(dates[0], dates[-1], csv_writer=csv_writer, league="both",
+                                              chunk_size=2, max_workers=max_workers, engine=engine,
+                                              progress=False))
+        download = results["run_statcast_download"]
+        download["mb_per_sec"] = round((stub.stats["bytes"] - served_before) / 1024 ** 2 / download["seconds"], 2)
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+
+    return results
+
+
+def compare(results, baseline, tolerance):
+    """Names of benchmarks whose rows/sec fell more than tolerance below the baseline."""
+    regressions = []
+    for name, result in results.items():
+        expected = baseline.get(name, {}).get("rows_per_sec")
+        if expected and result["rows_per_sec"] < expected * (1 - tolerance):
+            regressions.append(name)
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the offline Statcast benchmark suite")
+    parser.add_argument("--start_date", default="2024-06-03", help="First day to benchmark (in season)")
+    parser.add_argument("--days", type=int, default=7, help="Days to fetch")
+    parser.add_argument("--latency", type=float, default=0.05, help="Stub latency per request in seconds")
+    parser.add_argument("--latency_per_mb", type=float, default=0.0, help="Extra stub latency per MB")
+    parser.add_argument("--max_concurrent", type=int, default=None,
+        help="Requests the stub serves at once before answering 429")
+    parser.add_argument("--row_cap", type=int, default=25000, help="Rows per response before truncation")
+    parser.add_argument("--tail_every", type=int, help="Make every Nth stub response a straggler")
+    parser.add_argument("--tail_latency", type=float, default=10.0, help="Extra seconds for a straggler")
+    parser.add_argument("--max_workers", type=int, default=4)
+    parser.add_argument("--engine", choices=["thread", "async"], default="thread")
+    parser.add_argument("--output", help="Write results as JSON to this path")
+    parser.add_argument("--baseline", help="JSON results from an earlier run to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.2,
+        help="Allowed fractional drop in rows/sec before a benchmark counts as a regression")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+
+    with SavantStub(latency=args.latency, latency_per_mb=args.latency_per_mb,
+                    max_concurrent=args.max_concurrent, row_cap=args.row_cap,
+                    tail_every=args.tail_every, tail_latency=args.tail_latency) as stub:
+        results = run_suite(stub, args.start_date, args.days, args.max_workers, args.engine)
+        stats = dict(stub.stats)
+
+    print(f"{'benchmark':<24}{'rows':>10}{'seconds':>10}{'rows/sec':>14}{'MB/sec':>10}")
+    for name, result in results.items():
+        print(f"{name:<24}{result['rows']:>10}{result['seconds']:>10.2f}"
+              f"{result['rows_per_sec']:>14,.0f}{result['mb_per_sec']:>10.1f}")
+    print(f"stub: {stats['requests']} requests, {stats['throttled']} throttled, {stats['truncated']} truncated")
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump({"results": results, "stub": stats}, f, indent=2)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)["results"]
+        regressions = compare(results, baseline, args.tolerance)
+        for name in regressions:
+            print(f"REGRESSION {name}: {results[name]['rows_per_sec']:,.0f} rows/sec "
+                  f"vs baseline {baseline[name]['rows_per_sec']:,.0f}")
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,220 @@
+"""
+Local stand-in for the Baseball Savant CSV endpoints.
+
+Serves /statcast_search/csv (MLB) and /statcast-search-minors/csv (MiLB) with
+synthetic pitches shaped like the real exports: every column in
+column_types.yaml, realistic rows per day (none in the offseason, fewer on the
+usual light days), Savant's row cap, plus configurable latency and throttling.
+/api/v1/schedule answers like the MLB Stats API with the matching game dates.
+
+Usage:
+    with SavantStub(latency=0.05, max_concurrent=8) as stub:
+        _fetch_chunk("2024-06-01", "2024-06-05", stub.mlb_url, {}, PARAMS_DICT)
+"""
+import datetime
+import json
+import threading
+import time
+from functools import lru_cache
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
+
+from benchmarks.synthetic import synthetic_day
+
+MLB_PATH = "/statcast_search/csv"
+MILB_PATH = "/statcast-search-minors/csv"
+SCHEDULE_PATH = "/api/v1/schedule"
+
+# Pitches on a full slate: 15 MLB games, about 20 tracked minor league games
+FULL_SLATE_ROWS = {"mlb": 4500, "milb": 3000}
+SEASONS = {"mlb": ((3, 20), (10, 31)), "milb": ((4, 1), (9, 30))}
+LIGHT_DAYS = (0, 3)  # Mondays and Thursdays carry fewer games
+FULL_SLATE_GAMES = {"mlb": 15, "milb": 20}
+MLB_SPORT_ID = "1"
+
+_PLACEHOLDER_DATE = "2000-01-01"
+
+
+def rows_for_day(league: str, day: datetime.date, full_slate: int = None) -> int:
+    """Rows the stub serves for one league and day."""
+    (start_month, start_day), (end_month, end_day) = SEASONS[league]
+    if not datetime.date(day.year, start_month, start_day) <= day <= datetime.date(day.year, end_month, end_day):
+        return 0
+    full_slate = full_slate or FULL_SLATE_ROWS[league]
+    return full_slate * 6 // 10 if day.weekday() in LIGHT_DAYS else full_slate
+
+
+def games_for_day(league: str, day: datetime.date) -> int:
+    """Games the stub's schedule lists for one league and day."""
+    return rows_for_day(league, day, FULL_SLATE_GAMES[league] * 10) // 10
+
+
+@lru_cache(maxsize=4)
+def _template(rows: int):
+    """(header, data lines) for a day of rows, dated with a placeholder."""
+    lines = synthetic_day(rows, game_date=_PLACEHOLDER_DATE).to_csv(index=False).encode("utf-8").splitlines(True)
+    return lines[0], lines[1:]
+
+
+class SavantStub:
+    """
+    Threaded HTTP server mimicking Savant's CSV search.
+
+    Args:
+        rows_per_day (dict, optional): Full-slate rows per league, e.g. {"mlb": 4500}.
+        latency (float): Seconds to wait before answering each request.
+        latency_per_mb (float): Extra seconds per MB of response body.
+        max_concurrent (int, optional): Requests served at once; extra requests
+            get 429 Too Many Requests, the way Savant throttles.
+        row_cap (int): Rows returned at most per request; larger windows are
+            silently truncated like the real export.
+        tail_every (int, optional): Every tail_every-th request is a straggler...
+        tail_latency (float): ...answered this many seconds late.
+    """
+
+    def __init__(self, rows_per_day: dict = None, latency: float = 0.0, latency_per_mb: float = 0.0,
+                 max_concurrent: int = None, row_cap: int = 25000, tail_every: int = None,
+                 tail_latency: float = 0.0):
+        self.rows_per_day = {**FULL_SLATE_ROWS, **(rows_per_day or {})}
+        self.latency = latency
+        self.latency_per_mb = latency_per_mb
+        self.row_cap = row_cap
+        self.tail_every = tail_every
+        self.tail_latency = tail_latency
+        self._slots = threading.BoundedSemaphore(max_concurrent) if max_concurrent else None
+        self._stats_lock = threading.Lock()
+        self.stats = {"requests": 0, "throttled": 0, "truncated": 0, "rows": 0, "bytes": 0,
+                      "schedule_requests": 0}
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler())
+        self._server.daemon_threads = True
+        self._thread = None
+
+    @property
+    def base_url(self) -> str:
+        return f"http://127.0.0.1:{self._server.server_address[1]}"
+
+    @property
+    def mlb_url(self) -> str:
+        return self.base_url + MLB_PATH
+
+    @property
+    def milb_url(self) -> str:
+        return self.base_url + MILB_PATH
+
+    @property
+    def schedule_url(self) -> str:
+        return self.base_url + SCHEDULE_PATH
+
+    def start(self):
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def expected_rows(self, league: str, start: str, end: str) -> int:
+        """Rows a complete download of the window holds (before any truncation)."""
+        day = datetime.date.fromisoformat(start)
+        last = datetime.date.fromisoformat(end)
+        total = 0
+        while day <= last:
+            total += rows_for_day(league, day, self.rows_per_day[league])
+            day += datetime.timedelta(days=1)
+        return total
+
+    def _count(self, **increments):
+        with self._stats_lock:
+            for key, value in increments.items():
+                self.stats[key] += value
+            return self.stats["requests"]
+
+    def body(self, league: str, start: str, end: str):
+        """(CSV payload, truncated, rows served) for a window, capped at row_cap rows."""
+        header, lines = _template(self.rows_per_day[league])
+        chunks = [header]
+        remaining = self.row_cap
+        day = datetime.date.fromisoformat(start)
+        last = datetime.date.fromisoformat(end)
+        while day <= last and remaining > 0:
+            rows = min(rows_for_day(league, day, self.rows_per_day[league]), remaining)
+            if rows:
+                day_lines = b"".join(lines[:rows])
+                chunks.append(day_lines.replace(_PLACEHOLDER_DATE.encode(), day.isoformat().encode()))
+                remaining -= rows
+            day += datetime.timedelta(days=1)
+        served = self.row_cap - remaining
+        return b"".join(chunks), served < self.expected_rows(league, start, end), served
+
+    def schedule(self, sport_ids, start: str, end: str) -> bytes:
+        """Stats API style schedule: dates with one entry per game."""
+        league = "mlb" if MLB_SPORT_ID in sport_ids else "milb"
+        day = datetime.date.fromisoformat(start)
+        last = datetime.date.fromisoformat(end)
+        dates = []
+        while day <= last:
+            games = games_for_day(league, day)
+            if games:
+                dates.append({"date": day.isoformat(), "totalGames": games,
+                              "games": [{"gameType": "R", "status": {"detailedState": "Final"}}] * games})
+            day += datetime.timedelta(days=1)
+        return json.dumps({"dates": dates}).encode("utf-8")
+
+    def _handler(self):
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                path = urlparse(self.path).path
+                if path == SCHEDULE_PATH:
+                    stub._count(schedule_requests=1)
+                    query = parse_qs(urlparse(self.path).query)
+                    payload = stub.schedule(query["sportId"], query["startDate"][0], query["endDate"][0])
+                    self._reply(200, payload, {"Content-Type": "application/json"})
+                    return
+                request_number = stub._count(requests=1)
+                league = {MLB_PATH: "mlb", MILB_PATH: "milb"}.get(path)
+                if league is None:
+                    self._reply(404, b"not found")
+                    return
+
+                if stub._slots and not stub._slots.acquire(blocking=False):
+                    stub._count(throttled=1)
+                    self._reply(429, b"Too Many Requests", {"Retry-After": "1"})
+                    return
+                try:
+                    query = parse_qs(urlparse(self.path).query)
+                    start = query["game_date_gt"][0]
+                    end = query["game_date_lt"][0]
+                    payload, truncated, rows = stub.body(league, start, end)
+                    delay = stub.latency + stub.latency_per_mb * len(payload) / 1024 ** 2
+                    if stub.tail_every and request_number % stub.tail_every == 0:
+                        delay += stub.tail_latency
+                    time.sleep(delay)
+                    stub._count(truncated=int(truncated), rows=rows, bytes=len(payload))
+                    self._reply(200, payload, {"Content-Type": "text/csv"})
+                finally:
+                    if stub._slots:
+                        stub._slots.release()
+
+            def _reply(self, status, payload, headers=None):
+                self.send_response(status)
+                for name, value in (headers or {}).items():
+                    self.send_header(name, value)
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, *args):
+                pass
+
+        return Handler
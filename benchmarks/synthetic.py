@@ -0,0 +1,55 @@
+"""
+Synthetic Savant payloads for the benchmarks.
+"""
+import numpy as np
+import pandas as pd
+
+from src.config.config import KNOWN_COLUMN_TYPES, COMPACT_COLUMN_TYPES
+
+# Distinct values per day for columns Savant repeats heavily
+_CARDINALITY = {
+    "pitch_type": 12, "pitch_name": 12, "player_name": 300, "events": 20, "description": 15,
+    "type": 3, "bb_type": 4, "game_type": 1, "game_year": 1, "game_pk": 15, "stand": 2,
+    "p_throws": 2, "home_team": 15, "away_team": 15, "inning": 9, "inning_topbot": 2,
+    "balls": 4, "strikes": 3, "outs_when_up": 3, "at_bat_number": 80, "pitch_number": 12,
+    "umpire": 15, "if_fielding_alignment": 3, "of_fielding_alignment": 3,
+}
+
+
+def synthetic_day(rows: int = 4500, game_date: str = "2024-06-15", seed: int = 7) -> pd.DataFrame:
+    """
+    One day of pitches shaped like a Savant export: every known column plus the
+    enumerated columns from compact_col_types, with about 15% nulls.
+    """
+    rng = np.random.default_rng(seed)
+    columns = {}
+    for col, bq_type in KNOWN_COLUMN_TYPES.items():
+        bq_type = bq_type.upper()
+        if col == "game_date":
+            values = np.full(rows, game_date, dtype=object)
+        elif bq_type in ("INT64", "INTEGER"):
+            values = rng.integers(0, 700000, rows).astype(object)
+        elif bq_type in ("FLOAT64", "FLOAT", "NUMERIC"):
+            values = np.round(rng.normal(0, 50, rows), 3).astype(object)
+        else:
+            pool = [f"{col}_{i}" for i in range(_CARDINALITY.get(col, 50))]
+            values = rng.choice(pool, rows).astype(object)
+        columns[col] = values
+
+    for col in COMPACT_COLUMN_TYPES:
+        if col not in columns:
+            pool = [f"{col}_{i}" for i in range(_CARDINALITY.get(col, 30))]
+            columns[col] = rng.choice(pool, rows).astype(object)
+
+    columns["des"] = np.array([f"Batter {i} grounds out, shortstop to first baseman." for i in range(rows)],
+                              dtype=object)
+
+    for col, values in columns.items():
+        if col != "game_date":
+            values[rng.random(rows) < 0.15] = None
+    return pd.DataFrame(columns)
+
+
+def synthetic_day_csv(rows: int = 4500, game_date: str = "2024-06-15", seed: int = 7) -> bytes:
+    """synthetic_day() serialized the way Savant serves it."""
+    return synthetic_day(rows, game_date, seed).to_csv(index=False).encode("utf-8")
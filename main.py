@@ -1,9 +1,15 @@
 # main.py
 from flask import Request
 from src.statcast_fetch import run_statcast_download
+from src.utils.run_metrics import prometheus_text
 
 def run_statcast(request: Request):
-    """HTTP Cloud Function entry point."""
+    """
+    HTTP Cloud Function entry point.
+
+    Returns the run summary (per-stage timing percentiles, counters, rows per
+    league) as JSON, or as Prometheus text when called with ?format=prometheus.
+    """
     request_json = request.get_json(silent=True)
     request_args = request.args
 
@@ -16,7 +22,7 @@ def run_statcast(request: Request):
     if not start_date or not end_date:
         return "Missing required parameters: start_date and end_date", 400
 
-    run_statcast_download(
+    summary = run_statcast_download(
         start_date=start_date,
         end_date=end_date,
         league=league,
@@ -25,4 +31,8 @@ def run_statcast(request: Request):
         log_level="INFO"
     )
 
-    return f"✅ Statcast data for {league} from {start_date} to {end_date} fetched successfully."
+    if request_args.get("format") == "prometheus":
+        return prometheus_text(summary), 200, {"Content-Type": "text/plain; version=0.0.4"}
+
+    summary["message"] = f"✅ Statcast data for {league} from {start_date} to {end_date} fetched successfully."
+    return summary, 200
@@ -17,10 +17,61 @@ MiLB_HEADERS = CONFIG["statcast"]["headers"]["milb"]
 # Statcast Params
 PARAMS_DICT = CONFIG["statcast"]["params"]
 
+# Pipeline Settings
+PIPELINE_CLEAN_WORKERS = CONFIG["pipeline"]["clean_workers"]
+PIPELINE_WRITE_WORKERS = CONFIG["pipeline"]["write_workers"]
+PIPELINE_QUEUE_SIZE = CONFIG["pipeline"]["queue_size"]
+
+# Response cache Settings
+CACHE_DIR = CONFIG["cache"]["dir"]
+CACHE_TTL_SECONDS = CONFIG["cache"]["ttl_seconds"]
+CACHE_MAX_BYTES = CONFIG["cache"]["max_size_mb"] * 1024 * 1024
+
+# Chunk manifest Settings
+MANIFEST_PATH = CONFIG["manifest"]["path"]
+
+# Chunking Settings
+ROW_CAP = CONFIG["statcast"]["chunking"]["row_cap"]
+ADAPTIVE_MIN_ROWS = CONFIG["statcast"]["chunking"]["min_rows"]
+MAX_CHUNK_DAYS = CONFIG["statcast"]["chunking"]["max_chunk_days"]
+
+# Season calendar Settings
+CALENDAR_PATH = CONFIG["statcast"]["calendar"]["path"]
+SCHEDULE_URL = CONFIG["statcast"]["calendar"]["schedule_url"]
+CALENDAR_TTL_SECONDS = CONFIG["statcast"]["calendar"]["ttl_seconds"]
+CALENDAR_TARGET_ROWS = CONFIG["statcast"]["calendar"]["target_rows"]
+CALENDAR_GAME_TYPES = CONFIG["statcast"]["calendar"]["game_types"]
+CALENDAR_SPORT_IDS = CONFIG["statcast"]["calendar"]["sport_ids"]
+CALENDAR_ROWS_PER_GAME = CONFIG["statcast"]["calendar"]["rows_per_game"]
+CALENDAR_FULL_SLATE_GAMES = CONFIG["statcast"]["calendar"]["full_slate_games"]
+
+# Date index Settings
+DATE_INDEX_PATH = CONFIG["statcast"]["date_index"]["path"]
+DATE_INDEX_BYTES_PER_ROW = CONFIG["statcast"]["date_index"]["default_bytes_per_row"]
+DATE_INDEX_SECONDS_PER_ROW = CONFIG["statcast"]["date_index"]["default_seconds_per_row"]
+
+# Throttle Settings
+THROTTLE_MIN_WORKERS = CONFIG["statcast"]["throttle"]["min_workers"]
+THROTTLE_MAX_WORKERS = CONFIG["statcast"]["throttle"]["max_workers"]
+THROTTLE_RATE_PER_SEC = CONFIG["statcast"]["throttle"]["rate_per_sec"]
+THROTTLE_BURST = CONFIG["statcast"]["throttle"]["burst"]
+RETRY_BACKOFF_CAP = CONFIG["statcast"]["throttle"]["retry_backoff_cap"]
+
+# Hedging Settings
+HEDGE_PERCENTILE = CONFIG["statcast"]["hedging"]["percentile"]
+HEDGE_BUDGET = CONFIG["statcast"]["hedging"]["budget"]
+HEDGE_MIN_SAMPLES = CONFIG["statcast"]["hedging"]["min_samples"]
+HEDGE_MIN_DELAY_SECONDS = CONFIG["statcast"]["hedging"]["min_delay_seconds"]
+HEDGE_DRAIN_SECONDS = CONFIG["statcast"]["hedging"]["drain_seconds"]
+
 # GCP Settings
 GCP_PROJECT_ID = CONFIG["gcp"]["project_id"]
 GCP_DATASET_ID = CONFIG["gcp"]["dataset_id"]
 GCP_TABLE_PREFIX = CONFIG["gcp"]["table_prefix"]
+INCREMENTAL_LOOKBACK_DAYS = CONFIG["gcp"]["incremental_lookback_days"]
+BQ_BATCH_MAX_ROWS = CONFIG["gcp"]["load_batch"]["max_rows"]
+BQ_BATCH_MAX_BYTES = CONFIG["gcp"]["load_batch"]["max_mb"] * 1024 * 1024
+BQ_BATCH_MAX_SECONDS = CONFIG["gcp"]["load_batch"]["max_seconds"]
 
 # Logging Settings
 LOG_LEVEL = CONFIG["logging"]["level"]
@@ -35,6 +86,7 @@ with open(KNOWN_COLUMN_PATH, "r") as f:
     KNOWN_COLUMNS = yaml.safe_load(f)
 
 KNOWN_COLUMN_TYPES = KNOWN_COLUMNS["known_col_types"]
+COMPACT_COLUMN_TYPES = KNOWN_COLUMNS.get("compact_col_types") or {}
 #print(f"KNOWN_COLUMN_TYPES: {KNOWN_COLUMN_TYPES}")
 
 
@@ -6,15 +6,33 @@ import logging
 import sys
 import time
 import csv
-import os
+import threading
+import functools
+from contextlib import nullcontext
 from time import sleep
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 import requests
 from tqdm import tqdm
 import numpy as np
 from src.writers.bq_writer import BQWriter
 from src.writers.csv_writer import CSVWriter
-from src.utils.bq_schema_helper import align_df_to_bq_schema, get_field_type
+from src.writers.parquet_writer import ParquetWriter
+from src.writers.batching_writer import BatchingBQWriter
+from src.utils.bq_schema_helper import get_field_type, coercion_failures, reset_coercion_failures
+from src.utils.http_session import SessionPool
+from src.utils.async_fetch import iter_chunks_async
+from src.utils.response_cache import ResponseCache
+from src.utils.chunk_planner import ChunkPlanner
+from src.utils.season_calendar import SeasonCalendar
+from src.utils.date_index import DateIndex
+from src.utils.pipeline import StagedPipeline
+from src.utils.memory import MemoryBudget, peak_rss
+from src.utils.bq_client import get_bigquery_client, TABLE_METADATA
+from src.utils.watermark import WatermarkState, read_table_watermark, incremental_start
+from src.utils.chunk_manifest import ChunkManifest, STATUS_FETCHED, STATUS_LOADED, STATUS_FAILED
+from src.utils.run_metrics import RunMetrics, log_summary, write_json_report, prometheus_text
+from src.utils.throttle import AdaptiveThrottle, decorrelated_jitter, retry_after_seconds
+from src.utils.hedging import HedgePolicy, RequestHedger, HEDGE_MODES
 from itertools import islice
 import json
 import re
@@ -26,7 +44,18 @@ from google.api_core.exceptions import (Conflict, BadRequest, Forbidden, NotFoun
 
 from src.config.config import (
     BASE_MLB_URL, BASE_MiLB_URL,
-    MLB_HEADERS, MiLB_HEADERS, PARAMS_DICT, GCP_PROJECT_ID, GCP_DATASET_ID, GCP_TABLE_PREFIX, KNOWN_COLUMN_TYPES
+    MLB_HEADERS, MiLB_HEADERS, PARAMS_DICT, GCP_PROJECT_ID, GCP_DATASET_ID, GCP_TABLE_PREFIX, KNOWN_COLUMN_TYPES,
+    COMPACT_COLUMN_TYPES,
+    CACHE_DIR, CACHE_TTL_SECONDS, CACHE_MAX_BYTES, MANIFEST_PATH,
+    BQ_BATCH_MAX_ROWS, BQ_BATCH_MAX_BYTES, BQ_BATCH_MAX_SECONDS,
+    PIPELINE_CLEAN_WORKERS, PIPELINE_WRITE_WORKERS, PIPELINE_QUEUE_SIZE,
+    INCREMENTAL_LOOKBACK_DAYS,
+    THROTTLE_MIN_WORKERS, THROTTLE_MAX_WORKERS, THROTTLE_RATE_PER_SEC, THROTTLE_BURST, RETRY_BACKOFF_CAP,
+    HEDGE_PERCENTILE, HEDGE_BUDGET, HEDGE_MIN_SAMPLES, HEDGE_MIN_DELAY_SECONDS, HEDGE_DRAIN_SECONDS,
+    ROW_CAP, ADAPTIVE_MIN_ROWS, MAX_CHUNK_DAYS,
+    CALENDAR_PATH, SCHEDULE_URL, CALENDAR_TTL_SECONDS, CALENDAR_TARGET_ROWS, CALENDAR_GAME_TYPES,
+    CALENDAR_SPORT_IDS, CALENDAR_ROWS_PER_GAME, CALENDAR_FULL_SLATE_GAMES,
+    DATE_INDEX_PATH, DATE_INDEX_BYTES_PER_ROW, DATE_INDEX_SECONDS_PER_ROW
 )
 from src.config.logging_config import setup_logging
 
@@ -34,6 +63,24 @@ logger = logging.getLogger(__name__)
 
 GLOBAL_SCHEMA = []
 
+CLUSTERING_FIELDS = ["pitcher", "batter"]
+
+LEAGUE_LABELS = {"mlb": "MLB", "milb": "MiLB"}
+
+NUMERIC_BQ_TYPES = {"FLOAT", "FLOAT64", "NUMERIC", "BIGNUMERIC", "INTEGER", "INT64"}
+INTEGER_BQ_TYPES = {"INTEGER", "INT64"}
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+    CSV_ENGINE = "pyarrow"
+    COMPACT_STRING_DTYPE = "string[pyarrow]"
+except ImportError:
+    CSV_ENGINE = "c"
+    COMPACT_STRING_DTYPE = "string"
+
+INT_DOWNCASTS = [("Int8", np.int8), ("Int16", np.int16), ("Int32", np.int32)]
+
 def _daterange(start_date, end_date, chunk_size, step_days=None):
 
     """
@@ -65,6 +112,23 @@ def _daterange(start_date, end_date, chunk_size, step_days=None):
         chunk_num += 1
         current += step
 
+def _plan_windows(league, start_date, end_date, chunk_size, step_days=None, calendar=None):
+    """
+        Seed date windows for one league.
+
+        A DateIndex only affects sizing through the calendar (SeasonCalendar(index=...)),
+        which prefers its observed rows; without a calendar, windows are chunk_size days.
+
+        Returns:
+            list: (window_start, window_end) dates from the season calendar when one
+                is given (and step_days isn't), otherwise from _daterange.
+    """
+    if calendar is not None and not step_days:
+        return calendar.windows(league, start_date, end_date, target_rows=CALENDAR_TARGET_ROWS,
+                                max_days=MAX_CHUNK_DAYS)
+    return [(chunk_start, chunk_end) for _, chunk_start, chunk_end in
+            _daterange(start_date, end_date, chunk_size, step_days)]
+
 # Recursive function to find all hit_location values
 def find_key(d, key):
     if isinstance(d, dict):
@@ -77,79 +141,445 @@ def find_key(d, key):
         for item in d:
             yield from find_key(item, key)
 
-def _fetch_chunk(start_date_str, end_date_str, base_url, headers, parameters, max_retries=3, backoff_factor=2):
-    params_copy = parameters.copy()
-    params_copy["game_date_gt"] = start_date_str
-    params_copy["game_date_lt"] = end_date_str
+def _csv_dtypes(columns, compact=False):
+    """
+        Maps CSV columns to read_csv dtypes using KNOWN_COLUMN_TYPES.
 
-    attempt = 0
-    while attempt <= max_retries:
-        try:
-            
-            response = requests.get(base_url, headers=headers, params=params_copy, timeout=180)
-            response.raise_for_status()
-            
-
-            #vvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvv
-            logging.debug(f"===============================================")
-            logging.debug(f"Checking for field in response")
-            # Use csv.DictReader to preserve raw values as strings
-            reader = csv.DictReader(io.StringIO(response.text))
-            # Print the first 10 raw values 
-            for i, row in enumerate(reader):
-                if i >= 10:
+        Numeric columns (INT64 included) are read straight into float64 so missing
+        values need no object fallback; everything else, unknown columns included,
+        is read as strings. In compact mode, columns marked "category" in
+        compact_col_types are dictionary-encoded while parsing and the remaining
+        strings are Arrow-backed instead of Python objects.
+    """
+    dtypes = {}
+    for col in columns:
+        if KNOWN_COLUMN_TYPES.get(col, "STRING").upper() in NUMERIC_BQ_TYPES:
+            dtypes[col] = "float64"
+        elif compact:
+            dtypes[col] = "category" if COMPACT_COLUMN_TYPES.get(col) == "category" else COMPACT_STRING_DTYPE
+        else:
+            dtypes[col] = str
+    return dtypes
+
+
+def _read_csv_compact(content, dtypes):
+    """
+        Arrow-native parse for compact mode.
+
+        The Arrow CSV reader dictionary-encodes category columns itself, so
+        repeated values are never materialized as separate strings; to_pandas
+        turns them into Categoricals and keeps other strings in Arrow buffers.
+    """
+    column_types = {
+        col: pa.float64() if dtype == "float64"
+        else pa.dictionary(pa.int32(), pa.string()) if dtype == "category"
+        else pa.string()
+        for col, dtype in dtypes.items()
+    }
+    table = pa_csv.read_csv(io.BytesIO(content), convert_options=pa_csv.ConvertOptions(
+        column_types=column_types, strings_can_be_null=True))
+    return table.to_pandas(types_mapper={pa.string(): pd.StringDtype("pyarrow")}.get)
+
+
+def _downcast_numeric(df):
+    """
+        Shrinks numeric columns in place for compact mode.
+
+        Nullable Int64 columns move to the smallest nullable integer type that holds
+        their range, which is lossless. Float columns are only narrowed when
+        compact_col_types marks them float32, since that changes their values.
+    """
+    for col, dtype in df.dtypes.items():
+        if dtype == "Int64":
+            values = df[col]
+            low, high = values.min(), values.max()
+            if pd.isna(low):
+                df[col] = values.astype("Int8")
+                continue
+            for name, numpy_type in INT_DOWNCASTS:
+                info = np.iinfo(numpy_type)
+                if info.min <= low and high <= info.max:
+                    df[col] = values.astype(name)
                     break
-                logging.debug(row.get("game_date"))
+        elif dtype == "float64" and COMPACT_COLUMN_TYPES.get(col) == "float32":
+            df[col] = df[col].astype("float32")
+    return df
+
+
+def _csv_header(content):
+    """Returns the column names from the first line of a CSV payload."""
+    first_line = content.split(b"\n", 1)[0].decode("utf-8-sig", errors="replace")
+    return next(csv.reader([first_line]), [])
 
-            logging.debug(f"===============================================")                 
 
-            #^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^
+def _parse_csv(content, start_date_str, end_date_str, compact=False, metrics=None):
+    """
+        Parses a raw Savant CSV payload into a typed DataFrame in a single pass.
+
+        Columns typed FLOAT64/INT64 in column_types.yaml are parsed directly into
+        float64, and INT64 columns holding only whole numbers are then narrowed to
+        nullable Int64. The Arrow-backed multithreaded parser is used when pyarrow
+        is installed. Shared by the threaded and async engines so both produce
+        identical frames.
+
+        Args:
+            content (bytes): Raw CSV response body.
+            start_date_str (str): Window start, for logging.
+            end_date_str (str): Window end, for logging.
+            compact (bool): Categorical, Arrow-string and downcast numeric columns
+                (see _csv_dtypes and _downcast_numeric).
+            metrics (RunMetrics, optional): Records the parse time under "parse".
+
+        Returns:
+            pd.DataFrame: Parsed rows, or an empty DataFrame when the payload holds
+                no data or cannot be parsed.
+    """
+    with metrics.timer("parse") if metrics is not None else nullcontext():
+        return _parse_payload(content, start_date_str, end_date_str, compact)
 
-            df = pd.read_csv(io.BytesIO(response.content), dtype=str)
 
-            #vvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvv
-            logging.debug(f"===============================================")  
-            logging.debug(f"Checking for field in dataframe")
-            # Check if column exists
+def _parse_payload(content, start_date_str, end_date_str, compact):
+    try:
+        if not content or not content.strip():
+            raise pd.errors.EmptyDataError("No columns to parse from file")
+
+        dtypes = _csv_dtypes(_csv_header(content), compact=compact)
+        try:
+            if compact and CSV_ENGINE == "pyarrow":
+                df = _read_csv_compact(content, dtypes)
+            else:
+                df = pd.read_csv(io.BytesIO(content), dtype=dtypes, engine=CSV_ENGINE)
+        except ValueError as e:
+            logging.warning(f"⚠️ Typed parse failed from {start_date_str} to {end_date_str} ({e}); reading as strings")
+            df = pd.read_csv(io.BytesIO(content), dtype=str, engine=CSV_ENGINE)
+            dtypes = {}
+
+        for col, dtype in dtypes.items():
+            if dtype != "float64" or KNOWN_COLUMN_TYPES.get(col, "").upper() not in INTEGER_BQ_TYPES:
+                continue
+            values = df[col].to_numpy()
+            if np.all(np.isnan(values) | (np.mod(values, 1) == 0)):
+                df[col] = df[col].astype("Int64")
+            else:
+                logging.debug(f"Column '{col}' is typed INT64 but holds fractions; keeping float64")
+
+        if compact and dtypes:
+            _downcast_numeric(df)
+
+        if logging.getLogger().isEnabledFor(logging.DEBUG):
             if "game_date" in df.columns:
-                # Print first 10 values
                 logging.debug(df["game_date"].head(10).tolist())
             else:
                 logging.debug("Column 'game_date' not found in DataFrame")
 
-            logging.debug(f"===============================================")  
-            #vvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvvv
+        logging.debug(f"✅ Downloaded data from {start_date_str} to {end_date_str} ({len(df)} rows)")
+        df.attrs["response_bytes"] = len(content)
+        return df
+
+    except pd.errors.EmptyDataError:
+        logging.error(f"⚠️ No data returned from {start_date_str} to {end_date_str}", exc_info=True)
+        return pd.DataFrame()
+
+    except Exception as e:
+        logging.error(f"❌ Unexpected error: {e}", exc_info=True)
+        return pd.DataFrame()
+
+
+def _fetch_chunk(start_date_str, end_date_str, base_url, headers, parameters, max_retries=3, backoff_factor=2,
+                 session=None, cache=None, compact=False, metrics=None, throttle=None, cancelled=None,
+                 hedge=False):
+    """
+        Downloads one date window from Savant and parses it into a DataFrame.
+
+        Retries wait a decorrelated-jitter delay between backoff_factor and
+        RETRY_BACKOFF_CAP seconds (at least as long as any Retry-After header).
+
+        Args:
+            session (requests.Session, optional): Shared keep-alive session from a
+                SessionPool. Falls back to a one-off requests.get when omitted.
+            cache (ResponseCache, optional): Raw response cache consulted before the
+                request and filled after it.
+            compact (bool): Parse into a compact frame (see _parse_csv).
+            metrics (RunMetrics, optional): Records HTTP wait, parse time, bytes,
+                requests, retries and 429s.
+            throttle (AdaptiveThrottle, optional): Shared rate limit applied before
+                each request, told about every response so it can resize concurrency.
+            cancelled (threading.Event, optional): Set once the answer is no longer
+                needed (a losing hedge request). The fetch then stops retrying and its
+                errors, e.g. from the session being closed, are not reported to the
+                throttle or metrics.
+            hedge (bool): A hedge request: it is still paced by the throttle's rate
+                limit but skips its concurrency slots, which the slow requests it backs
+                up are holding. The hedge budget bounds how many run at once.
+    """
+    params_copy = parameters.copy()
+    params_copy["game_date_gt"] = start_date_str
+    params_copy["game_date_lt"] = end_date_str
 
+    if cache is not None:
+        content = cache.get(base_url, params_copy)
+        if content is not None:
+            if metrics is not None:
+                metrics.add("cache_hits")
+            return _parse_csv(content, start_date_str, end_date_str, compact=compact, metrics=metrics)
+        if cache.offline:
+            logging.warning(f"⚠️ Offline cache miss from {start_date_str} to {end_date_str}; skipping chunk")
+            return None
 
-            logging.debug(f"✅ Downloaded data from {start_date_str} to {end_date_str} ({len(df)} rows)")
+    attempt = 0
+    delay = backoff_factor
+    while attempt <= max_retries:
+        if cancelled is not None and cancelled.is_set():
+            return None
+        try:
+            if throttle is not None:
+                sleep(throttle.reserve())
+            with throttle.slot(base_url) if throttle is not None and not hedge else nullcontext():
+                request_start = time.perf_counter()
+                if session is not None:
+                    response = session.get(base_url, params=params_copy, timeout=180)
+                else:
+                    response = requests.get(base_url, headers=headers, params=params_copy, timeout=180)
+            seconds = time.perf_counter() - request_start
+            if metrics is not None:
+                metrics.observe("http", seconds)
+                metrics.add("requests")
+            response.raise_for_status()
+            if metrics is not None:
+                metrics.add("bytes_downloaded", len(response.content))
+            if throttle is not None:
+                throttle.on_success(seconds, len(response.content))
+
+            if cache is not None:
+                cache.put(base_url, params_copy, response.content)
+
+            df = _parse_csv(response.content, start_date_str, end_date_str, compact=compact, metrics=metrics)
+            df.attrs["fetch_seconds"] = seconds
             return df
 
         except requests.exceptions.RequestException as e:
+            if cancelled is not None and cancelled.is_set():
+                logging.debug(f"Cancelled request from {start_date_str} to {end_date_str} ended: {e}")
+                return None
+            status = getattr(e.response, "status_code", None)
+            if metrics is not None:
+                metrics.add("retries")
+                if status == 429:
+                    metrics.add("throttled")
+            timed_out = isinstance(e, (requests.exceptions.Timeout, requests.exceptions.ConnectionError))
+            if throttle is not None and AdaptiveThrottle.is_congestion(status, timed_out):
+                throttle.on_congestion(f"HTTP {status}" if status else type(e).__name__)
             #logging.error(f"❌ Request error ({attempt + 1}/{max_retries}) from {start_date_str} to {end_date_str}: {e}")
             logging.error(f"❌ Request error ({attempt}/{max_retries}) from {start_date_str} to {end_date_str}: {e}")
             attempt += 1
             if attempt > max_retries:
                 logging.error(f"❌ All retries failed for {start_date_str} to {end_date_str}", exc_info=True)
                 break
-            sleep(backoff_factor ** attempt)
-
-        except pd.errors.EmptyDataError:
-            logging.error(f"⚠️ No data returned from {start_date_str} to {end_date_str}", exc_info=True)
-            return pd.DataFrame()
+            delay = decorrelated_jitter(delay, backoff_factor, RETRY_BACKOFF_CAP)
+            retry_after = retry_after_seconds(getattr(e.response, "headers", None))
+            sleep(max(delay, retry_after or 0))
 
         except Exception as e:
+            if cancelled is not None and cancelled.is_set():
+                return None
             logging.error(f"❌ Unexpected error: {e}", exc_info=True)
             return pd.DataFrame()
 
 
+def _iter_chunks_threaded(planner, base_url, headers, parameters, max_workers=4, cache=None, compact=False,
+                          metrics=None, throttle=None, hedge_policy=None):
+    """
+        Fetches date windows on a ThreadPoolExecutor, yielding results as they complete.
+
+        Windows are pulled from the planner as workers free up, so windows split
+        after a truncated response are fetched in the same run.
+
+        Args:
+            planner (ChunkPlanner): Source of (chunk_start_str, chunk_end_str) windows.
+            max_workers (int): Number of download threads.
+            throttle (AdaptiveThrottle, optional): Replaces max_workers with its
+                adaptive limit; the pool is sized to throttle.max_limit.
+            hedge_policy (HedgePolicy, optional): Sends backup requests for windows
+                running past the policy's latency percentile; the first complete
+                answer wins. The pool gets as many spare threads for hedges, which
+                skip the throttle's concurrency slots (see _fetch_chunk). Losing
+                requests are cancelled, and the session is only closed once they end
+                (or after HEDGE_DRAIN_SECONDS).
+
+        Yields:
+            tuple: (chunk_start_str, chunk_end_str, df_chunk). df_chunk is None when
+                every retry failed.
+    """
+    hedger = RequestHedger(hedge_policy) if hedge_policy is not None else None
+    pool_size = throttle.max_limit if throttle is not None else max_workers
+    threads = pool_size * 2 if hedger else pool_size
+    session_pool = SessionPool(pool_size=threads)
+    session = session_pool.get(base_url, headers)
+    executor = ThreadPoolExecutor(max_workers=threads)
+    with session_pool:
+        in_flight = {}
+        cancel_events = {}
+        losers = {}  # Cancelled requests that may still be running
+        try:
+            def submit(chunk_start_str, chunk_end_str, hedge=False):
+                cancelled = threading.Event()
+                future = executor.submit(
+                    _fetch_chunk, chunk_start_str, chunk_end_str,
+                    base_url, headers, parameters, session=session, cache=cache, compact=compact,
+                    metrics=metrics, throttle=throttle, cancelled=cancelled, hedge=hedge
+                )
+                in_flight[future] = (chunk_start_str, chunk_end_str)
+                cancel_events[future] = cancelled
+                return future
+
+            while True:
+                open_windows = hedger.open if hedger else len(in_flight)
+                while open_windows < (throttle.limit_for(base_url) if throttle is not None else max_workers):
+                    window = planner.next_window()
+                    if window is None:
+                        break
+                    future = submit(*window)
+                    if hedger:
+                        hedger.track(window, future)
+                    open_windows += 1
+
+                if not in_flight:
+                    break
+
+                for loser in [loser for loser in losers if loser.done()]:
+                    del losers[loser]
+                done, _ = wait(in_flight, timeout=hedger.next_check() if hedger else None,
+                               return_when=FIRST_COMPLETED)
+
+                if hedger:
+                    for window, parts in hedger.due():
+                        if metrics is not None:
+                            metrics.add("hedged_chunks")
+                        for part in parts:
+                            hedger.add(window, part, submit(*part, hedge=True))
+
+                for future in done:
+                    cancel_events.pop(future, None)
+                    window = in_flight.pop(future, None)
+                    if window is None:
+                        continue  # A redundant request whose window was already answered
+                    try:
+                        df_chunk = future.result()
+                    except Exception as e:
+                        logging.error(f"💥 Exception in chunk {window[0]} to {window[1]}: {e}", exc_info=True)
+                        df_chunk = None
+
+                    if hedger:
+                        answered, redundant = hedger.complete(future, df_chunk)
+                        for other in redundant:
+                            in_flight.pop(other, None)
+                            if other in cancel_events:
+                                losers[other] = cancel_events.pop(other)
+                                losers[other].set()
+                            other.cancel()
+                        if answered is None:
+                            continue
+                        window, df_chunk = answered
+
+                    chunk_start_str, chunk_end_str = window
+                    if planner.record(chunk_start_str, chunk_end_str, df_chunk):
+                        yield chunk_start_str, chunk_end_str, df_chunk
+        finally:
+            # Cancelled requests stop retrying and don't report to the throttle or metrics;
+            # those mid-request are joined, within a bound, before the session pool closes
+            for cancelled in cancel_events.values():
+                cancelled.set()
+            executor.shutdown(wait=hedger is None, cancel_futures=True)
+            stragglers = list(cancel_events) + list(losers)
+            if stragglers:
+                _, running = wait(stragglers, timeout=HEDGE_DRAIN_SECONDS)
+                if running:
+                    logging.warning(f"⚠️ {len(running)} cancelled requests still running after "
+                                    f"{HEDGE_DRAIN_SECONDS}s; closing their session")
+
+
 def _fetch_data_in_parallel(start_date, end_date, base_url, headers, parameters,
                             file_name, league, chunk_size=5, step_days=None, max_workers=4,
-                            bqwriter=None,  csvwriter=None, progress=True):
+                            bqwriter=None,  csvwriter=None, progress=True, engine="thread", cache=None,
+                            adaptive_chunks=False, clean_workers=2, write_workers=2, queue_size=4,
+                            memory_budget=None, manifest=None, resume=False, parquetwriter=None,
+                            compact_frames=False, metrics=None, throttle=None, hedge_policy=None,
+                            progress_position=None, calendar=None, date_index=None):
+    """
+        Fetches every chunk in the date range and feeds it through clean/write.
+
+        Args:
+            max_workers (int): Download threads for the "thread" engine, or the
+                number of in-flight requests for the "async" engine.
+            engine (str): "thread" (default) uses a ThreadPoolExecutor; "async"
+                uses an asyncio HTTP client bounded by a semaphore.
+            cache (ResponseCache, optional): On-disk cache of raw responses.
+            adaptive_chunks (bool): Grow windows that return small payloads. Windows
+                that hit the Savant row cap are always bisected.
+            clean_workers (int): Threads in the clean/convert stage.
+            write_workers (int): Threads in the write stage.
+            queue_size (int): Bound on each stage's input queue; a full queue
+                pauses the stage before it.
+            memory_budget (MemoryBudget, optional): Streaming mode. Chunks are
+                never accumulated; while RSS is over the budget, buffered writes
+                are flushed and new chunks wait for in-flight ones to drain.
+            manifest (ChunkManifest, optional): Records each window's status, row
+                count, response size and load job IDs.
+            resume (bool): Skip windows the manifest already has as loaded. Without
+                it the league's manifest entries are reset at the start.
+            parquetwriter (ParquetWriter, optional): Local hive-partitioned Parquet copy.
+            compact_frames (bool): Parse chunks with categorical, Arrow-string and
+                downcast numeric columns to cut memory per chunk.
+            metrics (RunMetrics, optional): Collects per-stage timings and counters.
+            throttle (AdaptiveThrottle, optional): Shared request rate and adaptive
+                in-flight limit used instead of a fixed max_workers.
+            hedge_policy (HedgePolicy, optional): Backup requests for slow windows
+                ("thread" engine only).
+            progress_position (int, optional): tqdm line for this league's bar when
+                several leagues download at once.
+            calendar (SeasonCalendar, optional): Plan windows from the league's game
+                dates instead of chunk_size: days without games are skipped and each
+                window holds about CALENDAR_TARGET_ROWS expected rows.
+            date_index (DateIndex, optional): Updated with every fetched window's
+                per-date rows, bytes and latency. When it (or the calendar) knows every
+                day's expected rows, the progress bar counts rows instead of days.
+                Window sizing only uses it through the calendar (see _plan_windows).
+
+        Returns:
+            dict: {"league", "rows", "max_game_date"}: rows handed to the writers, and
+            the latest game date before the first window whose load was not confirmed.
+    """
     start_dt = datetime.datetime.strptime(start_date, "%Y-%m-%d").date()
     end_dt = datetime.datetime.strptime(end_date, "%Y-%m-%d").date()
 
-    all_data = []
-    chunks = list(_daterange(start_dt, end_dt, chunk_size, step_days))
+    rows_written = 0
+    max_game_date = None
+    rows_lock = threading.Lock()
+    # Window starts that were not loaded: failed fetches, and chunks handed on but not yet confirmed
+    failed_starts = []
+    unconfirmed = set()
+    windows = _plan_windows(league, start_dt, end_dt, chunk_size, step_days, calendar)
+    if manifest is not None:
+        if resume:
+            windows = manifest.pending_windows(league, windows)
+        else:
+            manifest.reset(league)
+    planner = ChunkPlanner(
+        windows,
+        row_cap=ROW_CAP, grow=adaptive_chunks and not step_days,
+        min_rows=ADAPTIVE_MIN_ROWS, max_days=MAX_CHUNK_DAYS,
+    )
+    expected = date_index.expected_rows(
+        league, windows, calendar.expected_rows if calendar is not None else None) if date_index is not None else None
+
+    def progress_for(chunk_start, chunk_end):
+        days = [chunk_start + datetime.timedelta(days=n) for n in range((chunk_end - chunk_start).days + 1)]
+        return sum(expected.get(day, 0) for day in days) if expected else len(days)
+
+    progress_total = sum(progress_for(chunk_start, chunk_end) for chunk_start, chunk_end in windows)
+    if expected and not progress_total:
+        expected = None
+        progress_total = sum(progress_for(chunk_start, chunk_end) for chunk_start, chunk_end in windows)
 
     tqdm_func = tqdm if progress else lambda *args, **kwargs: DummyTqdm()
 
@@ -158,97 +588,229 @@ def _fetch_data_in_parallel(start_date, end_date, base_url, headers, parameters,
     #client = bigquery.Client("crzzpy")
     table_ref = f"{GCP_PROJECT_ID}.{GCP_DATASET_ID}.{prefix}"
 
-    truncate_table=True
-    schema_generation_count = 0
-    with ThreadPoolExecutor(max_workers=max_workers) as executor:
-        futures = []
-        with tqdm_func(total=len(chunks), desc="Submitting chunks", unit="chunk", file=sys.stdout) as submit_bar:
-            for _, chunk_start, chunk_end in chunks:
-                chunk_start_str = chunk_start.strftime("%Y-%m-%d")
-                chunk_end_str = chunk_end.strftime("%Y-%m-%d")
-                future = executor.submit(
-                    _fetch_chunk, chunk_start_str, chunk_end_str,
-                    base_url, headers, parameters
-                )
-                future.chunk_info = (chunk_start_str, chunk_end_str)
-                futures.append(future)
-                submit_bar.update(1)
-
-        with tqdm_func(total=len(futures), desc="Downloading chunks", unit="chunk", file=sys.stdout) as download_bar:
-            for future in as_completed(futures):
-                chunk_start_str, chunk_end_str = future.chunk_info
-                try:
-                    df_chunk = future.result()
-                    logging.debug(f"📥 Raw chunk: {chunk_start_str} to {chunk_end_str}, rows={len(df_chunk)}")
-                    
-                    if not table_exists(GCP_PROJECT_ID, GCP_DATASET_ID, prefix):
-                        logging.debug(f"🧼 Table does NOT exist: {table_ref}......................")
-                        #bq_schema = generate_schema(KNOWN_COLUMN_TYPES, df_chunk.columns, target="bigquery")
-                        GLOBAL_SCHEMA = generate_schema(KNOWN_COLUMN_TYPES, df_chunk.columns, target="bigquery")
-                        table = create_bigquery_table(GCP_PROJECT_ID, GCP_DATASET_ID, GCP_TABLE_PREFIX, league,  GLOBAL_SCHEMA)
+    if engine == "async":
+        if hedge_policy is not None:
+            raise ValueError("request hedging needs the 'thread' engine")
+        results = iter_chunks_async(planner, base_url, headers, parameters,
+                                    functools.partial(_parse_csv, compact=compact_frames, metrics=metrics),
+                                    max_in_flight=max_workers, cache=cache, metrics=metrics,
+                                    throttle=throttle, backoff_cap=RETRY_BACKOFF_CAP)
+    elif engine == "thread":
+        results = _iter_chunks_threaded(planner, base_url, headers, parameters,
+                                        max_workers=max_workers, cache=cache, compact=compact_frames,
+                                        metrics=metrics, throttle=throttle, hedge_policy=hedge_policy)
+    else:
+        raise ValueError("engine must be either 'thread' or 'async'")
 
-                        logging.debug(get_field_type(GLOBAL_SCHEMA, "arm_angle"))
+    if metrics is None:
+        metrics = RunMetrics()
 
-                        # Loop through schema fields
-                        for field in table.schema:
-                            if field.name == "arm_angle":
-                                logging.debug(f"DEBUG - Column: {field.name}, Type: {field.field_type} after table creation")
+    def clean_stage(item):
+        chunk_start_str, chunk_end_str, df_chunk, schema, truncate = item
+        try:
+            logging.debug(f"🧼 Before cleaning: {df_chunk.shape}")
+            with metrics.timer("clean"):
+                df_chunk = clean_dataframe(df_chunk, inplace=True)
+            logging.debug(f"🧼 After cleaning: {df_chunk.shape}")  
+            return chunk_start_str, chunk_end_str, df_chunk, schema, truncate
+        except Exception as e:
+            logging.error(f"💥 Exception cleaning chunk {chunk_start_str} to {chunk_end_str}: {e}", exc_info=True)
+
+    def mark_loaded(chunk_start_str, chunk_end_str, chunk_max):
+        def on_loaded(job_ids):
+            nonlocal max_game_date
+            if manifest is not None:
+                manifest.record(league, chunk_start_str, chunk_end_str, STATUS_LOADED, load_job_ids=job_ids)
+            # The watermark only moves past game dates whose load was confirmed
+            with rows_lock:
+                unconfirmed.discard((chunk_start_str, chunk_end_str))
+                if isinstance(chunk_max, str) and (max_game_date is None or chunk_max > max_game_date):
+                    max_game_date = chunk_max
+        return on_loaded
+
+    def write_stage(item):
+        nonlocal rows_written
+        chunk_start_str, chunk_end_str, df_chunk, schema, truncate = item
+        try:
+            chunk_max = df_chunk["game_date"].dropna().max() if "game_date" in df_chunk.columns else None
+            on_loaded = mark_loaded(chunk_start_str, chunk_end_str, chunk_max)
+            # The manifest and watermark follow BigQuery when it is written, otherwise the first local copy
+            loaded_by = bqwriter or csvwriter or parquetwriter
+
+            def loaded_kwargs(writer):
+                return {"on_loaded": on_loaded} if writer is loaded_by else {}
+
+            if csvwriter:
+                logging.debug(f"📤 Writing chunk {chunk_start_str} to {chunk_end_str} to CSV...")
+                with metrics.timer("csv_write"):
+                    csvwriter.write(df_chunk, file_name, chunk_start_str, chunk_end_str, **loaded_kwargs(csvwriter))
+            if parquetwriter:
+                logging.debug(f"📤 Writing chunk {chunk_start_str} to {chunk_end_str} to Parquet...")
+                with metrics.timer("parquet_write"):
+                    parquetwriter.write(df_chunk, league, **loaded_kwargs(parquetwriter))
+            if bqwriter:
+                logging.debug(f"📤 Writing chunk {chunk_start_str} to {chunk_end_str} to BigQuery...")
+                with metrics.timer("bq_write"):
+                    bqwriter.write(df_chunk, league, schema, truncate, **loaded_kwargs(bqwriter))
+            elif loaded_by is None:
+                on_loaded([])
+
+            metrics.add("rows_written", len(df_chunk))
+            with rows_lock:
+                rows_written += len(df_chunk)
+        except Exception as e:
+            logging.error(f"💥 Exception writing chunk {chunk_start_str} to {chunk_end_str}: {e}", exc_info=True)
 
+    pipeline = StagedPipeline(
+        [("clean", clean_stage, clean_workers), ("write", write_stage, write_workers)],
+        queue_size=queue_size,
+    )
+
+    truncate_table=True
+    schema_generation_count = 0
+    with pipeline, tqdm_func(total=progress_total, desc=f"Downloading {LEAGUE_LABELS[league]} chunks",
+                             unit="row" if expected else "day", unit_scale=bool(expected),
+                             file=sys.stdout, position=progress_position) as download_bar:
+        for chunk_start_str, chunk_end_str, df_chunk in results:
+            try:
+                if df_chunk is None:
+                    metrics.add("chunks_failed")
+                    failed_starts.append(chunk_start_str)
+                    if manifest is not None:
+                        manifest.record(league, chunk_start_str, chunk_end_str, STATUS_FAILED)
+                    continue
+
+                logging.debug(f"📥 Raw chunk: {chunk_start_str} to {chunk_end_str}, rows={len(df_chunk)}")
+                metrics.add("chunks")
+                metrics.add("rows_fetched", len(df_chunk))
+                if date_index is not None:
+                    short = date_index.record(league, chunk_start_str, chunk_end_str, df_chunk,
+                                              seconds=df_chunk.attrs.get("fetch_seconds"))
+                    if short:
+                        metrics.add("short_dates", len(short))
+                if manifest is not None:
+                    # Empty windows have nothing to load, so they are complete as soon as they are fetched
+                    manifest.record(league, chunk_start_str, chunk_end_str,
+                                    STATUS_LOADED if df_chunk.empty else STATUS_FETCHED,
+                                    rows=len(df_chunk), byte_size=df_chunk.attrs.get("response_bytes"))
+                
+                if bqwriter and not table_exists(GCP_PROJECT_ID, GCP_DATASET_ID, prefix):
+                    logging.debug(f"🧼 Table does NOT exist: {table_ref}......................")
+                    #bq_schema = generate_schema(KNOWN_COLUMN_TYPES, df_chunk.columns, target="bigquery")
+                    GLOBAL_SCHEMA = generate_schema(KNOWN_COLUMN_TYPES, df_chunk.columns, target="bigquery")
+                    table = create_bigquery_table(GCP_PROJECT_ID, GCP_DATASET_ID, GCP_TABLE_PREFIX, league,  GLOBAL_SCHEMA)
+
+                    logging.debug(get_field_type(GLOBAL_SCHEMA, "arm_angle"))
+
+                    # Loop through schema fields
+                    for field in table.schema:
+                        if field.name == "arm_angle":
+                            logging.debug(f"DEBUG - Column: {field.name}, Type: {field.field_type} after table creation")
+
+                    schema_generation_count+=1
+                   
+                else:
+                    if schema_generation_count <= 0:
+                        GLOBAL_SCHEMA = generate_schema(KNOWN_COLUMN_TYPES, df_chunk.columns, target="bigquery")
                         schema_generation_count+=1
-                       
-                    else:
-                        if schema_generation_count <= 0:
-                            GLOBAL_SCHEMA = generate_schema(KNOWN_COLUMN_TYPES, df_chunk.columns, target="bigquery")
-                            schema_generation_count+=1
-                    
-
-                    if not df_chunk.empty:                    
-                        logging.debug(f"🧼 Before cleaning: {df_chunk.shape}")
-                        df_chunk = clean_dataframe(df_chunk)
-                        logging.debug(f"🧼 After cleaning: {df_chunk.shape}")  
-
-                        if bqwriter:
-                                logging.debug(f"📤 Writing chunk {chunk_start_str} to {chunk_end_str} to BigQuery...")
-                                bqwriter.write(df_chunk, league, GLOBAL_SCHEMA, truncate_table)
-                                truncate_table=False
-
-                        all_data.append(df_chunk)
-                except Exception as e:
-                    logging.error(f"💥 Exception in chunk {chunk_start_str} to {chunk_end_str}: {e}", exc_info=True)
-                finally:
-                    download_bar.update(1)
-
-    if all_data:
-        '''
-        final_df = pd.concat(all_data, ignore_index=True)
-        with open(file_name, mode="w", newline="", encoding="utf-8") as f:
-            csv_writer = writer or csv.writer(f)
-            csv_writer.writerow(final_df.columns)
-            for row in tqdm_func(final_df.itertuples(index=False, name=None),
-                                 total=len(final_df), desc="Saving to CSV", unit="row"):
-           
-                # logging.debug(f"💾 row saved: {row}")
-                csv_writer.writerow(row)        
-        logging.debug(f"💾 Data saved to {file_name} ({len(final_df)} rows)")
-        '''
+                
+
+                if not df_chunk.empty:
+                    if memory_budget:
+                        memory_budget.wait(lambda: pipeline.pending,
+                                           on_exceeded=lambda: bqwriter and bqwriter.flush(league))
+                    with rows_lock:
+                        unconfirmed.add((chunk_start_str, chunk_end_str))
+                    # Blocks while the clean stage is backed up, which in turn stops new downloads
+                    pipeline.put((chunk_start_str, chunk_end_str, df_chunk, GLOBAL_SCHEMA, truncate_table))
+                    df_chunk = None
+                    truncate_table=False
+                    logging.debug(f"📊 Stage queue depths: {pipeline.depths()}")
+            except Exception as e:
+                logging.error(f"💥 Exception in chunk {chunk_start_str} to {chunk_end_str}: {e}", exc_info=True)
+            finally:
+                download_bar.update(progress_for(datetime.datetime.strptime(chunk_start_str, "%Y-%m-%d").date(),
+                                                 datetime.datetime.strptime(chunk_end_str, "%Y-%m-%d").date()))
+
+    if bqwriter:
+        bqwriter.flush(league)
+    if csvwriter:
+        csvwriter.flush(file_name)
+
+    # A later chunk's rows don't cover an earlier window that failed, so stop the watermark short of it
+    gaps = failed_starts + [chunk_start_str for chunk_start_str, _ in unconfirmed]
+    if gaps and max_game_date is not None:
+        first_gap = min(gaps)
+        cap = (datetime.datetime.strptime(first_gap, "%Y-%m-%d") - datetime.timedelta(days=1)).strftime("%Y-%m-%d")
+        if max_game_date > cap:
+            logging.warning(f"⚠️ {league}: windows from {first_gap} were not loaded; "
+                            f"holding the watermark at {cap}")
+            max_game_date = cap
+
+    logging.info(f"📊 {league}: peak stage queue depths {pipeline.max_depths} (queue_size={queue_size})")
+
+    if throttle is not None and throttle.adaptive:
+        logging.info(f"🚦 {league}: concurrency ranged {throttle.low_water}–{throttle.high_water}, "
+                     f"ending at {throttle.limit}")
+
+    if planner.splits:
+        logging.info(f"✂️ {league}: {planner.splits} truncated windows were split; {planner.issued} requests issued")
+
+    if manifest is not None:
+        incomplete = manifest.incomplete_windows(league)
+        if incomplete:
+            logging.warning(f"⚠️ {league}: {len(incomplete)} windows were not loaded; rerun with --resume to retry them")
+
+    if rows_written:
+        logging.info(f"💾 {league}: wrote {rows_written} rows")
     else:
         logging.warning("⚠️ No data fetched")
 
+    return {"league": league, "rows": rows_written, "max_game_date": max_game_date}
 
-def clean_dataframe(df_chunk):
-    """Cleans DataFrame for BigQuery insertion: handles NaN, None, and timestamps."""
-    df_chunk = df_chunk.copy()  # Avoid modifying the original DataFrame
-    
-    # ✅ Convert timestamps to string format
-    for col in df_chunk.select_dtypes(include=["datetime64"]).columns:
-        df_chunk[col] = df_chunk[col].astype(str)  # Converts to 'YYYY-MM-DD HH:MM:SS'
-    
-    # ✅ Convert game_date to YYYY-MM-DD format
-    if "game_date" in df_chunk.columns:
-        df_chunk["game_date"] = pd.to_datetime(df_chunk["game_date"], errors="coerce").dt.strftime("%Y-%m-%d")
 
-    # ✅ Convert all NaN-like values to None
-    df_chunk = df_chunk.replace({np.nan: None, pd.NA: None, None: None})
+def _normalize_dates(series):
+    """
+        Formats a date column as YYYY-MM-DD strings, parsing each distinct value once.
+
+        A chunk holds a handful of distinct game dates, so factorizing first turns
+        thousands of per-row parses into a few. Unparseable values become missing.
+    """
+    codes, uniques = pd.factorize(series)
+    formatted = pd.to_datetime(pd.Index(uniques), errors="coerce", format="mixed").strftime("%Y-%m-%d").to_numpy(dtype=object)
+    values = formatted.take(codes)
+    values[codes < 0] = np.nan
+    values[pd.isna(values)] = np.nan
+    return pd.Series(values, index=series.index, name=series.name)
+
+
+def clean_dataframe(df_chunk, inplace=False):
+    """
+        Cleans a parsed chunk for the writers, column by column on typed arrays.
+
+        Timestamp columns become 'YYYY-MM-DD HH:MM:SS' strings and game_date is
+        normalized to 'YYYY-MM-DD'. Nulls are left as the columns' own missing
+        values (NaN in float columns, the mask of nullable Int64 columns) rather
+        than boxed into None objects; writers that need None, such as the JSON
+        load path, convert at the point of serialization.
+
+        Args:
+            df_chunk (pd.DataFrame): Chunk from _parse_csv.
+            inplace (bool): Replace columns on df_chunk itself. Otherwise a shallow
+                copy is cleaned, so the input is untouched but no data is copied.
+
+        Returns:
+            pd.DataFrame: The cleaned chunk.
+    """
+    if not inplace:
+        df_chunk = df_chunk.copy(deep=False)
+
+    for col, dtype in df_chunk.dtypes.items():
+        if pd.api.types.is_datetime64_any_dtype(dtype):
+            df_chunk[col] = df_chunk[col].dt.strftime("%Y-%m-%d %H:%M:%S")
+
+    if "game_date" in df_chunk.columns:
+        df_chunk["game_date"] = _normalize_dates(df_chunk["game_date"])
 
     return df_chunk
 
@@ -260,19 +822,18 @@ def count_rows_in_csv(file_name):
     return row_count
 
 def table_exists(project_id: str, dataset_id: str, table_id: str) -> bool:
+    """Checks table existence through the shared client and the per-run table metadata cache."""
 
-    client = bigquery.Client(project=project_id)
+    client = get_bigquery_client(project_id)
     table_ref = f"{project_id}.{dataset_id}.{table_id}"
     logging.debug(f"🧼 table_ref: {table_ref}......................")
 
-    try:
-        client.get_table(table_ref)
+    if TABLE_METADATA.exists(client, table_ref):
         logging.debug(f"🧼 Table does exist: {table_ref}......................")
         return True
-    
-    except NotFound:
-        logging.error(f"🧼 Table does NOT exist: {table_ref}......................", exc_info=True)
-        return False 
+
+    logging.debug(f"🧼 Table does NOT exist: {table_ref}......................")
+    return False 
     
 def generate_schema(known_column_types: dict, table_headers: list,
                     target: str = "bigtable", column_family: str = "cf1"):
@@ -331,7 +892,7 @@ def generate_schema(known_column_types: dict, table_headers: list,
     
 def create_bigquery_table(project_id: str, dataset_id: str, table_id: str, league:str,  schema_fields: list):
     """
-    Creates a BigQuery table.
+    Creates a BigQuery table partitioned on game_date and clustered on pitcher/batter.
 
     Args:
         project_id (str): Google Cloud project ID.
@@ -346,18 +907,28 @@ def create_bigquery_table(project_id: str, dataset_id: str, table_id: str, leagu
 
     current_year = datetime.datetime.now().year
 
-    client = bigquery.Client(project=project_id)
+    client = get_bigquery_client(project_id)
     table_ref = f"{project_id}.{dataset_id}.{table_id}_{current_year}_{league}"
 
     logging.debug(f"arm_angle:")
     logging.debug(get_field_type(schema_fields, "arm_angle"))
 
-    # Define and create table
+    # Define and create table, partitioned by day on game_date so date ranges can be
+    # overwritten partition by partition and queries prune by date
     table = bigquery.Table(table_ref, schema=schema_fields)
+    field_names = {field.name for field in schema_fields}
+    if "game_date" in field_names:
+        table.time_partitioning = bigquery.TimePartitioning(
+            type_=bigquery.TimePartitioningType.DAY, field="game_date"
+        )
+    clustering_fields = [name for name in CLUSTERING_FIELDS if name in field_names]
+    if clustering_fields:
+        table.clustering_fields = clustering_fields
 
     try:
 
         table = client.create_table(table)
+        TABLE_METADATA.put(table)
         logging.debug(f"✅ Table created: {table.full_table_id}")
 
         # Loop through schema fields
@@ -368,6 +939,7 @@ def create_bigquery_table(project_id: str, dataset_id: str, table_id: str, leagu
         return table
     
     except Conflict:
+        TABLE_METADATA.invalidate(table_ref)
         logging.error(f"⚠ Table already exists: {table_ref}", exc_info=True)
     except NotFound:
         logging.error(f"❌ Dataset not found: {dataset_id}", exc_info=True)
@@ -379,40 +951,243 @@ def create_bigquery_table(project_id: str, dataset_id: str, table_id: str, leagu
         logging.error(f"❌ Unexpected error: {e}", exc_info=True)
 
 
+def _incremental_start(league, start_date, end_date, bq_writer, watermark_state, lookback_days):
+    """
+        Works out where an incremental run for a league should start.
+
+        The watermark comes from the local state file when one is given, otherwise
+        from max(game_date) in the league's table. Rows from the chosen start
+        onward are deleted before the league's first append.
+
+        Returns:
+            str or None: Start date (YYYY-MM-DD), or None when the league is up to date.
+    """
+    start_dt = datetime.datetime.strptime(start_date, "%Y-%m-%d").date()
+    end_dt = datetime.datetime.strptime(end_date, "%Y-%m-%d").date()
+
+    if watermark_state is not None:
+        watermark = watermark_state.get(league)
+        source = watermark_state.path
+    elif bq_writer is None:
+        logging.warning(f"⚠️ Incremental mode needs a BigQuery writer or a state file; fetching all of {league}")
+        return start_date
+    else:
+        table_ref = bq_writer.table_id(league)
+        watermark = read_table_watermark(get_bigquery_client(GCP_PROJECT_ID), table_ref)
+        source = table_ref
+
+    start = incremental_start(start_dt, end_dt, watermark, lookback_days)
+    logging.info(f"🔖 {league} watermark {watermark or 'none'} from {source}; "
+                 f"fetching {start or 'nothing'} to {end_date}")
+    if start is None:
+        return None
+
+    if bq_writer:
+        bq_writer.replace_from(league, start)
+    return start.strftime("%Y-%m-%d")
+
+
 def run_statcast_download(start_date, end_date, bq_writer=None, csv_writer=None, league="mlb", file_name=None,
                           chunk_size=5, step_days=None, max_workers=4,
-                          log_level="INFO", progress=True):
-    #setup_logging(log_level)
+                          log_level="INFO", progress=True, engine="thread", cache=None,
+                          adaptive_chunks=False, clean_workers=2, write_workers=2, queue_size=4,
+                          memory_budget=None, incremental=False, lookback_days=3, watermark_state=None,
+                          manifest=None, resume=False, parquet_writer=None, compact_parquet=False,
+                          compact_frames=False, metrics=None, throttle=None, hedge_policy=None,
+                          concurrent_leagues=True, league_workers=None, calendar=None, date_index=None):
+    """
+        Downloads Statcast data for one or both leagues and hands it to the writers.
 
-    start_time = time.time()
-    if league in ("mlb", "both"):
-        logging.info("📦 Fetching MLB data...")
-        file = file_name or "statcast_mlb.csv"
-        _fetch_data_in_parallel(
-            start_date, end_date, BASE_MLB_URL, MLB_HEADERS, PARAMS_DICT,
-            file, "mlb", chunk_size, step_days, max_workers, bq_writer, csv_writer, progress=progress
-        )
+        With league="both" the two leagues download at the same time and share one
+        budget of max_workers in-flight requests (the throttle's limit), so the
+        run takes about as long as the slower league instead of the sum of both.
 
-        if os.path.exists(file):
-            count = count_rows_in_csv(file)
+        Args:
+            incremental (bool): Fetch only from each league's watermark (minus
+                lookback_days) to end_date and append, instead of reloading the range.
+                A bq_writer must then use the "append" or "partition" write mode.
+            lookback_days (int): Days before the watermark to re-fetch in incremental mode.
+            watermark_state (WatermarkState, optional): Local watermark file; when
+                omitted the watermark is read from the league's table.
+            manifest (ChunkManifest, optional): Per-chunk status record.
+            resume (bool): Only fetch windows the manifest doesn't have as loaded.
+                Like incremental, it needs a bq_writer that doesn't truncate.
+            parquet_writer (ParquetWriter, optional): Local Parquet copy of each league.
+            compact_parquet (bool): Merge multi-file Parquet partitions after the download.
+            compact_frames (bool): Hold chunks in compact frames (see _parse_csv).
+            metrics (RunMetrics, optional): Collector for stage timings and counters;
+                pass the one given to the BQWriter so load jobs are included.
+            throttle (AdaptiveThrottle, optional): Global in-flight budget shared by
+                both leagues; a fixed limit of max_workers when omitted.
+            hedge_policy (HedgePolicy, optional): Backup requests for slow windows.
+            concurrent_leagues (bool): Download both leagues at once (default) rather
+                than MLB first, then MiLB.
+            league_workers (dict, optional): League -> most in-flight requests that
+                league's endpoint may hold within the global budget. These are written
+                into throttle.endpoint_limits, so a throttle passed in keeps them after
+                the run (pass a fresh throttle per run to avoid that).
+            calendar (SeasonCalendar, optional): Plan windows from game dates,
+                skipping days without games (see _fetch_data_in_parallel).
+            date_index (DateIndex, optional): Per-date rows, bytes and latency,
+                updated with every window fetched. It sizes windows only through
+                a calendar built with index=date_index.
+
+        Returns:
+            dict: Run summary from RunMetrics.summary(), with a "leagues" entry
+                holding each league's rows and max game_date.
+
+        Raises:
+            ValueError: When incremental or resume is set and bq_writer would truncate the table.
+    """
+    #setup_logging(log_level)
 
+    # The first chunk of a truncating writer replaces the whole table, which would leave
+    # only the re-fetched days (incremental) or drop the chunks a resume skipped
+    if (incremental or resume) and getattr(bq_writer, "write_mode", None) == "truncate":
+        raise ValueError(f"{'incremental' if incremental else 'resumed'} runs need a BQWriter with "
+                         "write_mode 'append' or 'partition', not 'truncate'")
 
+    start_time = time.time()
+    # Table metadata is cached for one run only; a warm process must not reuse stale schemas
+    TABLE_METADATA.invalidate()
+    reset_coercion_failures()
+    if bq_writer is not None and hasattr(bq_writer, "start_run"):
+        bq_writer.start_run()
+    if metrics is None:
+        metrics = RunMetrics()
+    if throttle is None:
+        # Both leagues draw from one budget of max_workers in-flight requests
+        throttle = AdaptiveThrottle(initial=max_workers, max_limit=max_workers, adaptive=False)
+    jobs = []
+    if league in ("mlb", "both"):
+        jobs.append(("mlb", BASE_MLB_URL, MLB_HEADERS, PARAMS_DICT, file_name or "statcast_mlb.csv"))
     if league in ("milb", "both"):
-        logging.info("📦 Fetching MiLB data...")
         milb_params = PARAMS_DICT.copy()
         milb_params["minors"] = "true"
         file = (file_name.replace(".csv", "_milb.csv")
                 if file_name else "statcast_milb.csv")
-        _fetch_data_in_parallel(
-            start_date, end_date, BASE_MiLB_URL, MiLB_HEADERS, milb_params,
-            file, "milb", chunk_size, step_days, max_workers, bq_writer, csv_writer, progress=progress
+        jobs.append(("milb", BASE_MiLB_URL, MiLB_HEADERS, milb_params, file))
+    # Deliberately stored on the (possibly caller-owned) throttle; see league_workers above
+    for league_name, base_url, *_ in jobs:
+        if (league_workers or {}).get(league_name):
+            throttle.endpoint_limits[base_url] = league_workers[league_name]
+    concurrent = concurrent_leagues and len(jobs) > 1
+
+    def fetch_league(position, job):
+        league_name, base_url, headers, parameters, file = job
+        logging.info(f"📦 Fetching {LEAGUE_LABELS[league_name]} data...")
+        league_start = start_date
+        if incremental:
+            league_start = _incremental_start(league_name, start_date, end_date, bq_writer, watermark_state, lookback_days)
+        result = league_start and _fetch_data_in_parallel(
+            league_start, end_date, base_url, headers, parameters,
+            file, league_name, chunk_size, step_days, max_workers, bq_writer, csv_writer, progress=progress,
+            engine=engine, cache=cache, adaptive_chunks=adaptive_chunks,
+            clean_workers=clean_workers, write_workers=write_workers, queue_size=queue_size,
+            memory_budget=memory_budget, manifest=manifest, resume=resume,
+            parquetwriter=parquet_writer, compact_frames=compact_frames, metrics=metrics,
+            throttle=throttle, hedge_policy=hedge_policy,
+            progress_position=position if concurrent else None, calendar=calendar,
+            date_index=date_index
         )
+        return result
+
+    if concurrent:
+        # Both leagues share the throttle's slots, so a league that finishes early
+        # hands its share of the budget to the other
+        with ThreadPoolExecutor(max_workers=len(jobs)) as league_executor:
+            results = list(league_executor.map(fetch_league, range(len(jobs)), jobs))
+    else:
+        results = [fetch_league(position, job) for position, job in enumerate(jobs)]
 
-        if os.path.exists(file):
-            count = count_rows_in_csv(file)
+    league_results = {}
+    for result in results:
+        if result:
+            league_results[result["league"]] = result
+        if result and watermark_state is not None and result["max_game_date"]:
+            watermark_state.set(result["league"], datetime.datetime.strptime(result["max_game_date"], "%Y-%m-%d").date())
+
+    if parquet_writer and compact_parquet:
+        parquet_writer.compact(None if league == "both" else league)
+
+    if hedge_policy is not None and hedge_policy.hedged:
+        logging.info(f"🪁 Hedged {hedge_policy.hedged} of {hedge_policy.requested} chunks; "
+                     f"the hedge answered first {hedge_policy.won} times")
+
+    failures = coercion_failures()
+    if failures:
+        logging.warning(f"⚠️ Values loaded as NULL after failed type coercion, by column: {dict(failures)}")
 
     elapsed = (time.time() - start_time) / 60
-    logging.info(f"⏱️ Completed in {elapsed:.2f} minutes")
+    peak = peak_rss()
+    peak_text = f", peak memory {peak / 1024 ** 2:.0f} MB" if peak else ""
+    logging.info(f"⏱️ Completed in {elapsed:.2f} minutes{peak_text}")
+
+    summary = metrics.summary(peak_rss_bytes=peak)
+    summary["leagues"] = league_results
+    log_summary(summary)
+    return summary
+
+
+def plan_statcast_download(start_date, end_date, league="mlb", chunk_size=5, step_days=None, max_workers=4,
+                           calendar=None, date_index=None, manifest=None, resume=False, out=None):
+    """
+        Prints the chunk schedule a download would use, with expected rows, bytes
+        and an ETA, without any network calls.
+
+        Days the date index has seen use their recorded rows, bytes and fetch
+        time; other days use the season calendar's estimate (a full slate every
+        day without one) and the league's average bytes and seconds per row.
+
+        Args:
+            calendar (SeasonCalendar, optional): Offline calendar; plans windows as
+                run_statcast_download(calendar=...) would.
+            date_index (DateIndex): Per-date history from earlier runs.
+            manifest (ChunkManifest, optional): With resume, loaded windows are left out.
+            out (file, optional): Where the plan is printed; defaults to stdout.
+
+        Returns:
+            dict: {"leagues": {league: [window estimates]}, "rows", "bytes", "eta_seconds"}
+    """
+    out = out or sys.stdout
+    start_dt = datetime.datetime.strptime(start_date, "%Y-%m-%d").date()
+    end_dt = datetime.datetime.strptime(end_date, "%Y-%m-%d").date()
+
+    def full_slate(league_name, day):
+        return CALENDAR_FULL_SLATE_GAMES[league_name] * CALENDAR_ROWS_PER_GAME[league_name]
+
+    plan = {"leagues": {}, "rows": 0, "bytes": 0.0, "eta_seconds": 0.0}
+    fetch_seconds = 0.0
+    window_count = 0
+    for league_name in (["mlb", "milb"] if league == "both" else [league]):
+        windows = _plan_windows(league_name, start_dt, end_dt, chunk_size, step_days, calendar)
+        if manifest is not None and resume:
+            windows = manifest.pending_windows(league_name, windows)
+        estimates = date_index.estimate(league_name, windows,
+                                        calendar.expected_rows if calendar is not None else full_slate)
+        plan["leagues"][league_name] = estimates
+
+        rows = sum(e["rows"] for e in estimates)
+        nbytes = sum(e["bytes"] for e in estimates)
+        indexed = sum(e["indexed"] for e in estimates)
+        days = sum(e["days"] for e in estimates)
+        print(f"📋 {LEAGUE_LABELS[league_name]}: {len(estimates)} windows, {rows:,.0f} rows, "
+              f"{nbytes / 1024 ** 2:,.1f} MB ({indexed}/{days} days indexed)", file=out)
+        print(f"{'start':>12}{'end':>12}{'days':>6}{'rows':>10}{'MB':>9}{'seconds':>9}", file=out)
+        for e in estimates:
+            print(f"{e['start'].isoformat():>12}{e['end'].isoformat():>12}{e['days']:>6}{e['rows']:>10,.0f}"
+                  f"{e['bytes'] / 1024 ** 2:>9.1f}{e['seconds']:>9.1f}", file=out)
+
+        plan["rows"] += rows
+        plan["bytes"] += nbytes
+        fetch_seconds += sum(e["seconds"] for e in estimates)
+        window_count += len(estimates)
+
+    # Both leagues share the max_workers budget, so the fetch time spreads over it
+    plan["eta_seconds"] = fetch_seconds / max(1, min(max_workers, window_count))
+    print(f"⏱️ Plan: {window_count} requests, {plan['rows']:,.0f} rows, {plan['bytes'] / 1024 ** 2:,.1f} MB, "
+          f"ETA about {plan['eta_seconds'] / 60:.1f} minutes at {max_workers} workers", file=out)
+    return plan
 
 
 def main():
@@ -423,11 +1198,87 @@ def main():
     parser.add_argument("--file_name", help="Output CSV file name")
     parser.add_argument("--chunk_size", type=int, default=5)
     parser.add_argument("--step_days", type=int)
-    parser.add_argument("--max_workers", type=int, default=4)
+    parser.add_argument("--plan", action="store_true",
+        help="Print the chunk schedule with expected rows, bytes and an ETA from the date index, "
+             "then exit without any network calls")
+    parser.add_argument("--season_calendar", action="store_true",
+        help="Plan windows from the cached MLB schedule: skip days without games and size each window "
+             f"to about {CALENDAR_TARGET_ROWS} expected pitches, preferring rows the date index has seen "
+             "(replaces --chunk_size; without it the index only drives --plan and progress)")
+    parser.add_argument("--adaptive_chunks", action="store_true",
+        help="Grow date windows that return small payloads (truncated windows are always split)")
+    parser.add_argument("--max_workers", type=int, default=4,
+        help="Requests in flight at once, shared by both leagues with --league both")
+    parser.add_argument("--mlb_workers", type=int,
+        help="Most of the --max_workers budget the MLB endpoint may hold at once")
+    parser.add_argument("--milb_workers", type=int,
+        help="Most of the --max_workers budget the MiLB endpoint may hold at once")
+    parser.add_argument("--sequential_leagues", action="store_true",
+        help="With --league both, download MLB first and then MiLB instead of both at once")
+    parser.add_argument("--engine", choices=["thread", "async"], default="thread",
+        help="Fetch engine: thread pool (default) or asyncio HTTP client")
+    parser.add_argument("--adaptive_concurrency", action="store_true",
+        help=f"Start at --max_workers and let the in-flight limit grow while Savant stays fast and "
+             f"halve on 429/5xx/timeouts (between {THROTTLE_MIN_WORKERS} and {THROTTLE_MAX_WORKERS})")
+    parser.add_argument("--rate_limit", type=float, default=THROTTLE_RATE_PER_SEC,
+        help="Requests per second shared by all workers (0 disables)")
+    parser.add_argument("--hedge", choices=HEDGE_MODES,
+        help="Send a backup request for chunks slower than --hedge_percentile: the same window "
+             "(duplicate) or its two halves (split); the first complete answer wins")
+    parser.add_argument("--hedge_percentile", type=float, default=HEDGE_PERCENTILE,
+        help="Chunk latency percentile after which a chunk is hedged")
+    parser.add_argument("--hedge_budget", type=float, default=HEDGE_BUDGET,
+        help="Most hedges as a fraction of chunks requested")
+    parser.add_argument("--clean_workers", type=int, default=PIPELINE_CLEAN_WORKERS,
+        help="Threads cleaning/converting downloaded chunks")
+    parser.add_argument("--write_workers", type=int, default=PIPELINE_WRITE_WORKERS,
+        help="Threads writing cleaned chunks")
+    parser.add_argument("--queue_size", type=int, default=PIPELINE_QUEUE_SIZE,
+        help="Chunks allowed to wait in front of each pipeline stage")
+    parser.add_argument("--write_mode", choices=BQWriter.WRITE_MODES, default="truncate",
+        help="truncate: replace the table on the first write; append: add rows; "
+             "partition: overwrite only the game_date partitions that were fetched")
+    parser.add_argument("--incremental", action="store_true",
+        help="Fetch only from each league's max(game_date) watermark onward and append")
+    parser.add_argument("--lookback_days", type=int, default=INCREMENTAL_LOOKBACK_DAYS,
+        help="Days before the watermark to re-fetch in incremental mode")
+    parser.add_argument("--state_file",
+        help="Read/write watermarks from this JSON file instead of querying the table")
+    parser.add_argument("--resume", action="store_true",
+        help="Skip chunk windows the manifest records as loaded; retry failed and missing ones")
+    parser.add_argument("--manifest", metavar="PATH",
+        help=f"Record per-chunk status in this SQLite file (default with --resume: {MANIFEST_PATH})")
+    parser.add_argument("--compact_frames", action="store_true",
+        help="Hold chunks as categorical / Arrow-string / downcast columns to cut memory per chunk")
+    parser.add_argument("--memory_budget_mb", type=int,
+        help="Streaming mode: keep RSS under this many MB by flushing writes and pausing downloads")
+    parser.add_argument("--metrics_json", metavar="PATH",
+        help="Write the run report (per-stage percentiles and counters) as JSON to PATH")
+    parser.add_argument("--metrics_prom", metavar="PATH",
+        help="Write the run report in Prometheus text format to PATH (e.g. for the textfile collector)")
     parser.add_argument("--log_level", default="INFO")
     parser.add_argument("--no_progress", action="store_true", help="Disable progress bars")
-    parser.add_argument("--destination", choices=["bq", "csv", "both"], default="bq")
+    parser.add_argument("--destination", choices=["bq", "csv", "parquet", "both"], default="bq",
+        help="both: BigQuery and CSV")
     parser.add_argument("--csv_dir", default="csv_data", help="Directory to save CSV files")
+    parser.add_argument("--csv_compression", choices=["none", "gzip", "zstd"], default="none",
+        help="Compress CSV output (zstd needs the zstandard package)")
+    parser.add_argument("--csv_shard", choices=CSVWriter.SHARDS, default="chunk",
+        help="chunk: one CSV file per chunk; league: one CSV file per league")
+    parser.add_argument("--parquet_dir",
+        help="Also write a hive-partitioned Parquet copy here (default with --destination parquet: parquet_data)")
+    parser.add_argument("--parquet_mode", choices=ParquetWriter.MODES, default="replace",
+        help="replace: rewrite each fetched game_date partition; append: add files next to existing ones")
+    parser.add_argument("--compact_parquet", action="store_true",
+        help="Merge Parquet partitions holding several files into one after the download")
+    parser.add_argument("--bq_load_format", choices=BQWriter.LOAD_FORMATS, default="json",
+        help="How chunks are shipped to BigQuery: JSON rows (default) or typed Parquet buffers")
+    parser.add_argument("--bq_batch_rows", type=int, default=BQ_BATCH_MAX_ROWS,
+        help="Buffer chunks into one load job of about this many rows (0 loads every chunk separately)")
+    parser.add_argument("--bq_batch_mb", type=float, default=BQ_BATCH_MAX_BYTES / 1024 ** 2,
+        help="Flush a batch once its buffered chunks reach this many MB")
+    parser.add_argument("--bq_batch_seconds", type=float, default=BQ_BATCH_MAX_SECONDS,
+        help="Flush a batch once it has been open this long")
 
 
     '''
@@ -438,19 +1289,83 @@ def main():
     | (No `--log-to-file`)       | Console logging only       |
 
     '''
+    parser.add_argument("--cache-dir", metavar="DIR",
+        help=f"Cache raw Savant responses in DIR (default with --offline/--refresh: {CACHE_DIR})")
+    parser.add_argument("--offline", action="store_true", help="Serve chunks only from the response cache")
+    parser.add_argument("--refresh", action="store_true", help="Ignore cached responses and re-download them")
     parser.add_argument("--log-to-file", nargs="?", const="statcast.log", metavar="LOG_FILE",
         help="Enable logging to a file (default: statcast.log). Optionally provide a custom log file name.")  
 
     args = parser.parse_args()
+    if args.hedge and args.engine != "thread":
+        parser.error("--hedge needs --engine thread")
     setup_logging(args.log_level, log_file=args.log_to_file)
 
-    bq_writer = BQWriter(GCP_PROJECT_ID, GCP_DATASET_ID, GCP_TABLE_PREFIX)
+    date_index = DateIndex(DATE_INDEX_PATH, default_bytes_per_row=DATE_INDEX_BYTES_PER_ROW,
+                           default_seconds_per_row=DATE_INDEX_SECONDS_PER_ROW)
+    calendar = SeasonCalendar(
+        CALENDAR_PATH, SCHEDULE_URL, CALENDAR_SPORT_IDS, game_types=CALENDAR_GAME_TYPES,
+        rows_per_game=CALENDAR_ROWS_PER_GAME, full_slate_games=CALENDAR_FULL_SLATE_GAMES,
+        ttl_seconds=CALENDAR_TTL_SECONDS, offline=args.offline or args.plan, index=date_index,
+    ) if args.season_calendar else None
+    manifest = ChunkManifest(args.manifest or MANIFEST_PATH) if (args.manifest or args.resume) else None
+
+    if args.plan:
+        plan_statcast_download(args.start_date, args.end_date, league=args.league, chunk_size=args.chunk_size,
+                               step_days=args.step_days, max_workers=args.max_workers, calendar=calendar,
+                               date_index=date_index, manifest=manifest, resume=args.resume)
+        return
+
+    write_mode = args.write_mode
+    if (args.incremental or args.resume) and write_mode == "truncate":
+        # A resumed run must keep the chunks the earlier run already loaded
+        write_mode = "append"
+    memory_budget = MemoryBudget(args.memory_budget_mb * 1024 ** 2) if args.memory_budget_mb else None
+    metrics = RunMetrics()
+    if args.destination in ("bq", "both"):
+        bq_writer = BQWriter(GCP_PROJECT_ID, GCP_DATASET_ID, GCP_TABLE_PREFIX, load_format=args.bq_load_format,
+                             write_mode=write_mode, metrics=metrics)
+    else:
+        bq_writer = None
+    if bq_writer and args.bq_batch_rows > 0:
+        batch_bytes = int(args.bq_batch_mb * 1024 ** 2)
+        if memory_budget:
+            # Leave most of the budget to in-flight downloads and cleaning
+            batch_bytes = min(batch_bytes, memory_budget.limit_bytes // 4)
+        bq_writer = BatchingBQWriter(bq_writer, max_rows=args.bq_batch_rows,
+                                     max_bytes=batch_bytes,
+                                     max_seconds=args.bq_batch_seconds)
     if args.destination in ("csv", "both"):
-        csv_writer = CSVWriter(args.csv_dir)
+        csv_writer = CSVWriter(args.csv_dir,
+                               compression=None if args.csv_compression == "none" else args.csv_compression,
+                               shard=args.csv_shard)
     else:
         csv_writer = None
 
-    run_statcast_download(
+    if args.destination == "parquet" or args.parquet_dir:
+        parquet_writer = ParquetWriter(args.parquet_dir or "parquet_data", mode=args.parquet_mode)
+    else:
+        parquet_writer = None
+
+    if args.cache_dir or args.offline or args.refresh:
+        cache = ResponseCache(args.cache_dir or CACHE_DIR, ttl_seconds=CACHE_TTL_SECONDS,
+                              max_bytes=CACHE_MAX_BYTES, offline=args.offline, refresh=args.refresh)
+    else:
+        cache = None
+
+    throttle = AdaptiveThrottle(
+        initial=args.max_workers,
+        min_limit=THROTTLE_MIN_WORKERS,
+        max_limit=max(THROTTLE_MAX_WORKERS, args.max_workers) if args.adaptive_concurrency else args.max_workers,
+        adaptive=args.adaptive_concurrency,
+        rate_per_sec=args.rate_limit or None,
+        burst=THROTTLE_BURST,
+    )
+    hedge_policy = HedgePolicy(args.hedge, percentile=args.hedge_percentile, budget=args.hedge_budget,
+                               min_samples=HEDGE_MIN_SAMPLES,
+                               min_delay=HEDGE_MIN_DELAY_SECONDS) if args.hedge else None
+
+    summary = run_statcast_download(
         start_date=args.start_date,
         end_date=args.end_date,
         league=args.league,
@@ -461,9 +1376,37 @@ def main():
         log_level=args.log_level,
         progress=not args.no_progress,
         bq_writer=bq_writer,
-        csv_writer = csv_writer
+        csv_writer = csv_writer,
+        engine=args.engine,
+        cache=cache,
+        adaptive_chunks=args.adaptive_chunks,
+        clean_workers=args.clean_workers,
+        write_workers=args.write_workers,
+        queue_size=args.queue_size,
+        memory_budget=memory_budget,
+        incremental=args.incremental,
+        lookback_days=args.lookback_days,
+        watermark_state=WatermarkState(args.state_file) if args.state_file else None,
+        manifest=manifest,
+        resume=args.resume,
+        parquet_writer=parquet_writer,
+        compact_parquet=args.compact_parquet,
+        compact_frames=args.compact_frames,
+        metrics=metrics,
+        throttle=throttle,
+        hedge_policy=hedge_policy,
+        concurrent_leagues=not args.sequential_leagues,
+        league_workers={"mlb": args.mlb_workers, "milb": args.milb_workers},
+        calendar=calendar,
+        date_index=date_index
     )
 
+    if args.metrics_json:
+        write_json_report(summary, args.metrics_json)
+    if args.metrics_prom:
+        with open(args.metrics_prom, "w") as f:
+            f.write(prometheus_text(summary))
+
 class DummyTqdm:
     """Fallback when progress bars are disabled."""
     def __init__(self, *args, **kwargs): pass
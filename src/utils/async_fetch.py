@@ -0,0 +1,216 @@
+import asyncio
+import logging
+import os
+import queue
+import threading
+import time
+from contextlib import asynccontextmanager
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterator, Optional
+
+import pandas as pd
+
+from src.utils.throttle import AdaptiveThrottle, decorrelated_jitter, retry_after_seconds
+
+_DONE = object()
+
+
+@asynccontextmanager
+async def _no_slot():
+    yield
+
+
+def _session_headers(headers: Optional[dict]) -> dict:
+    """Copy headers for a keep-alive client, dropping any "Connection: close"."""
+    session_headers = {"Connection": "keep-alive", "Accept-Encoding": "gzip, deflate"}
+    for key, value in (headers or {}).items():
+        if key.lower() == "connection" and str(value).lower() == "close":
+            continue
+        session_headers[key] = value
+    return session_headers
+
+
+async def _fetch_one(session, semaphore, executor, parse, base_url, parameters,
+                     start_date_str, end_date_str, max_retries, backoff_factor, timeout, cache=None, metrics=None,
+                     throttle=None, backoff_cap=60):
+    import aiohttp
+
+    params_copy = parameters.copy()
+    params_copy["game_date_gt"] = start_date_str
+    params_copy["game_date_lt"] = end_date_str
+
+    loop = asyncio.get_running_loop()
+    if cache is not None:
+        content = await loop.run_in_executor(executor, cache.get, base_url, params_copy)
+        if content is not None:
+            if metrics is not None:
+                metrics.add("cache_hits")
+            return await loop.run_in_executor(executor, parse, content, start_date_str, end_date_str)
+        if cache.offline:
+            logging.warning(f"⚠️ Offline cache miss from {start_date_str} to {end_date_str}; skipping chunk")
+            return None
+
+    attempt = 0
+    delay = backoff_factor
+    while attempt <= max_retries:
+        retry_after = None
+        try:
+            if throttle is not None:
+                await asyncio.sleep(throttle.reserve())
+            async with semaphore, throttle.async_slot(base_url) if throttle is not None else _no_slot():
+                request_start = time.perf_counter()
+                async with session.get(base_url, params=params_copy,
+                                       timeout=aiohttp.ClientTimeout(total=timeout)) as response:
+                    if metrics is not None:
+                        metrics.add("requests")
+                    retry_after = retry_after_seconds(response.headers)
+                    response.raise_for_status()
+                    content = await response.read()
+                seconds = time.perf_counter() - request_start
+                if metrics is not None:
+                    metrics.observe("http", seconds)
+                    metrics.add("bytes_downloaded", len(content))
+                if throttle is not None:
+                    throttle.on_success(seconds, len(content))
+
+            if cache is not None:
+                await loop.run_in_executor(executor, cache.put, base_url, params_copy, content)
+
+            # Parse off the event loop so slow CSVs don't stall other requests
+            df = await loop.run_in_executor(executor, parse, content, start_date_str, end_date_str)
+            df.attrs["fetch_seconds"] = seconds
+            return df
+
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            status = getattr(e, "status", None)
+            if metrics is not None:
+                metrics.add("retries")
+                if status == 429:
+                    metrics.add("throttled")
+            timed_out = isinstance(e, (asyncio.TimeoutError, aiohttp.ClientConnectionError))
+            if throttle is not None and AdaptiveThrottle.is_congestion(status, timed_out):
+                throttle.on_congestion(f"HTTP {status}" if status else type(e).__name__)
+            logging.error(f"❌ Request error ({attempt}/{max_retries}) from {start_date_str} to {end_date_str}: {e}")
+            attempt += 1
+            if attempt > max_retries:
+                logging.error(f"❌ All retries failed for {start_date_str} to {end_date_str}", exc_info=True)
+                return None
+            delay = decorrelated_jitter(delay, backoff_factor, backoff_cap)
+            await asyncio.sleep(max(delay, retry_after or 0))
+
+        except Exception as e:
+            logging.error(f"❌ Unexpected error: {e}", exc_info=True)
+            return pd.DataFrame()
+
+
+async def _fetch_all(planner, base_url, headers, parameters, parse, max_in_flight,
+                     parse_workers, max_retries, backoff_factor, timeout, emit, cache=None, metrics=None,
+                     throttle=None, backoff_cap=60):
+    import aiohttp
+
+    if throttle is not None:
+        max_in_flight = throttle.max_limit
+    semaphore = asyncio.Semaphore(max_in_flight)
+    connector = aiohttp.TCPConnector(limit=max_in_flight)
+
+    with ThreadPoolExecutor(max_workers=parse_workers) as executor:
+        async with aiohttp.ClientSession(headers=_session_headers(headers), connector=connector) as session:
+            in_flight = {}
+            while True:
+                while len(in_flight) < (throttle.limit_for(base_url) if throttle is not None else max_in_flight):
+                    window = planner.next_window()
+                    if window is None:
+                        break
+                    start_date_str, end_date_str = window
+                    task = asyncio.ensure_future(_fetch_one(
+                        session, semaphore, executor, parse, base_url, parameters,
+                        start_date_str, end_date_str, max_retries, backoff_factor, timeout, cache, metrics,
+                        throttle, backoff_cap,
+                    ))
+                    in_flight[task] = window
+
+                if not in_flight:
+                    break
+
+                done, _ = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    start_date_str, end_date_str = in_flight.pop(task)
+                    df = task.result()
+                    if planner.record(start_date_str, end_date_str, df):
+                        await emit((start_date_str, end_date_str, df))
+
+
+def iter_chunks_async(planner, base_url: str, headers: dict, parameters: dict,
+                      parse: Callable[[bytes, str, str], pd.DataFrame], max_in_flight: int = 32,
+                      parse_workers: Optional[int] = None, max_retries: int = 3,
+                      backoff_factor: int = 2, timeout: int = 180, cache=None,
+                      metrics=None, throttle=None, backoff_cap: float = 60) -> Iterator[tuple]:
+    """
+    Fetch date windows with an asyncio HTTP client, yielding results as they complete.
+
+    Windows are pulled from the planner as slots free up, so windows split after
+    a truncated response are fetched in the same run.
+
+    The event loop runs on a background thread and hands finished chunks to the
+    caller through a bounded queue, so the caller's clean/write loop is the same
+    one used by the threaded engine.
+
+    Args:
+        planner (ChunkPlanner): Source of (chunk_start_str, chunk_end_str) windows.
+        base_url (str): Savant CSV endpoint.
+        headers (dict): Request headers.
+        parameters (dict): Base query parameters; the date window is added per request.
+        parse (callable): Turns (content, start, end) into a DataFrame.
+        max_in_flight (int): Semaphore bound on concurrent requests.
+        parse_workers (int, optional): Threads used for CSV parsing. Defaults to
+            min(4, cpu_count).
+        cache (ResponseCache, optional): Raw response cache consulted before each
+            request and filled after it.
+        metrics (RunMetrics, optional): Records HTTP wait, bytes, requests,
+            retries and 429s.
+        throttle (AdaptiveThrottle, optional): Shared rate limit and adaptive
+            in-flight limit; replaces max_in_flight when given.
+        backoff_cap (float): Longest jittered wait between retries, in seconds.
+
+    Yields:
+        tuple: (chunk_start_str, chunk_end_str, df_chunk). df_chunk is None when
+            every retry failed.
+    """
+    try:
+        import aiohttp  # noqa: F401
+    except ImportError as e:
+        raise ImportError("The async engine requires aiohttp: pip install aiohttp") from e
+
+    max_in_flight = max(1, int(max_in_flight))
+    parse_workers = parse_workers or min(4, os.cpu_count() or 1)
+    results = queue.Queue(maxsize=throttle.max_limit if throttle is not None else max_in_flight)
+
+    def runner():
+        loop = asyncio.new_event_loop()
+
+        async def emit(item):
+            # Blocking put runs off-loop so a slow consumer applies backpressure
+            await loop.run_in_executor(None, results.put, item)
+
+        try:
+            loop.run_until_complete(_fetch_all(
+                planner, base_url, headers, parameters, parse, max_in_flight,
+                parse_workers, max_retries, backoff_factor, timeout, emit, cache, metrics,
+                throttle, backoff_cap,
+            ))
+        except Exception as e:
+            logging.error(f"💥 Async fetch engine failed: {e}", exc_info=True)
+        finally:
+            loop.close()
+            results.put(_DONE)
+
+    thread = threading.Thread(target=runner, name="statcast-async-fetch", daemon=True)
+    thread.start()
+
+    while True:
+        item = results.get()
+        if item is _DONE:
+            break
+        yield item
+
+    thread.join()
@@ -0,0 +1,96 @@
+import logging
+import threading
+from typing import Dict, Optional
+
+from google.cloud import bigquery
+from google.api_core.exceptions import NotFound
+
+_clients: Dict[str, bigquery.Client] = {}
+_clients_lock = threading.Lock()
+
+
+def get_bigquery_client(project_id: str) -> bigquery.Client:
+    """
+    Return the process-wide BigQuery client for a project, creating it on first use.
+
+    bigquery.Client is thread-safe, so every writer, table check and query in a
+    run shares one client and its authenticated HTTP session.
+    """
+    with _clients_lock:
+        client = _clients.get(project_id)
+        if client is None:
+            client = bigquery.Client(project=project_id)
+            _clients[project_id] = client
+            logging.debug(f"🔌 Created BigQuery client for project {project_id}")
+        return client
+
+
+class TableMetadataCache:
+    """
+    Caches get_table() results (existence, schema, partitioning) per table.
+
+    A lookup hits the API once per run; later lookups, including misses, are
+    answered from memory until the entry is replaced after a create or dropped
+    with invalidate() after an alter. run_statcast_download calls invalidate()
+    at the start of every run, so a warm process never reuses an earlier run's
+    schema or "missing" answer. Lookups of different tables run in parallel;
+    only callers asking for the same table wait on each other.
+
+    Usage:
+        table = TABLE_METADATA.get(client, "crzzpy.test.statcast_2025_mlb")
+        if table is None:
+            table = client.create_table(...)
+            TABLE_METADATA.put(table)
+    """
+
+    _MISSING = object()
+
+    def __init__(self):
+        self._tables = {}
+        self._lock = threading.Lock()
+        self._table_locks = {}
+        self._generation = 0
+        self.lookups = 0
+
+    def get(self, client: bigquery.Client, table_ref: str) -> Optional[bigquery.Table]:
+        """Return the cached table, fetching it on first use; None if it doesn't exist."""
+        with self._lock:
+            cached = self._tables.get(table_ref)
+            table_lock = self._table_locks.setdefault(table_ref, threading.Lock())
+        if cached is None:
+            # The API call happens outside the cache lock so other tables aren't held up
+            with table_lock:
+                with self._lock:
+                    cached = self._tables.get(table_ref)
+                    generation = self._generation
+                if cached is None:
+                    try:
+                        cached = client.get_table(table_ref)
+                    except NotFound:
+                        cached = self._MISSING
+                    with self._lock:
+                        self.lookups += 1
+                        if generation == self._generation:
+                            self._tables[table_ref] = cached
+        return None if cached is self._MISSING else cached
+
+    def exists(self, client: bigquery.Client, table_ref: str) -> bool:
+        return self.get(client, table_ref) is not None
+
+    def put(self, table: bigquery.Table):
+        """Record a table that was just created or altered."""
+        table_ref = f"{table.project}.{table.dataset_id}.{table.table_id}"
+        with self._lock:
+            self._tables[table_ref] = table
+
+    def invalidate(self, table_ref: str = None):
+        """Forget one table, or every table when table_ref is None."""
+        with self._lock:
+            self._generation += 1
+            if table_ref is None:
+                self._tables.clear()
+            else:
+                self._tables.pop(table_ref, None)
+
+
+TABLE_METADATA = TableMetadataCache()
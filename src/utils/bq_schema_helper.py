@@ -1,59 +1,282 @@
+import io
 import pandas as pd
 import numpy as np
 import json
 from typing import List, Optional
 from google.cloud import bigquery
 import logging
+import threading
+from collections import Counter
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+# Every GoogleSQL / legacy SQL type name, mapped to the canonical name used by the converters
+SQL_TYPE_ALIASES = {
+    "STRING": "STRING",
+    "JSON": "STRING",
+    "GEOGRAPHY": "STRING",
+    "INT64": "INT64",
+    "INTEGER": "INT64",
+    "INT": "INT64",
+    "SMALLINT": "INT64",
+    "BIGINT": "INT64",
+    "TINYINT": "INT64",
+    "BYTEINT": "INT64",
+    "FLOAT64": "FLOAT64",
+    "FLOAT": "FLOAT64",
+    "NUMERIC": "NUMERIC",
+    "DECIMAL": "NUMERIC",
+    "BIGNUMERIC": "NUMERIC",
+    "BIGDECIMAL": "NUMERIC",
+    "BOOL": "BOOL",
+    "BOOLEAN": "BOOL",
+    "DATE": "DATE",
+    "DATETIME": "DATETIME",
+    "TIMESTAMP": "TIMESTAMP",
+    "TIME": "TIME",
+    "BYTES": "BYTES",
+}
+
+BQ_TO_ARROW_TYPES = {
+    "STRING": pa.string(),
+    "INT64": pa.int64(),
+    "FLOAT64": pa.float64(),
+    "NUMERIC": pa.float64(),
+    "BOOL": pa.bool_(),
+    "DATE": pa.date32(),
+    "DATETIME": pa.timestamp("us"),
+    "TIMESTAMP": pa.timestamp("us", tz="UTC"),
+    "TIME": pa.time64("us"),
+    "BYTES": pa.binary(),
+}
+
+_BOOL_STRINGS = {"true": True, "t": True, "1": True, "yes": True,
+                 "false": False, "f": False, "0": False, "no": False}
+
+
+def canonical_type(field_type: str) -> str:
+    """Canonical converter type for any SQL type name; unknown names are treated as STRING."""
+    return SQL_TYPE_ALIASES.get(field_type.upper(), "STRING")
+
+
+def _as_string(series: pd.Series) -> pd.Series:
+    if pd.api.types.is_string_dtype(series.dtype) and not pd.api.types.is_object_dtype(series.dtype):
+        return series
+    return series.astype("string")
+
+
+def _as_int(series: pd.Series) -> pd.Series:
+    if pd.api.types.is_integer_dtype(series.dtype):
+        return series.astype("Int64")
+    values = pd.to_numeric(series, errors="coerce")
+    if pd.api.types.is_bool_dtype(values.dtype):
+        return values.astype("Int64")
+    values = values.astype("float64")
+    # Fractions can't be stored as integers; they count as failed coercions
+    return values.mask(values % 1 != 0).astype("Int64")
+
+
+def _as_float(series: pd.Series) -> pd.Series:
+    if pd.api.types.is_float_dtype(series.dtype):
+        return series.astype("float64")
+    return pd.to_numeric(series, errors="coerce").astype("float64")
+
+
+def _as_bool(series: pd.Series) -> pd.Series:
+    if pd.api.types.is_bool_dtype(series.dtype):
+        return series.astype("boolean")
+    return _as_string(series).str.strip().str.lower().map(_BOOL_STRINGS).astype("boolean")
+
+
+def _as_datetime(series: pd.Series, utc: bool = False) -> pd.Series:
+    """Parse each distinct value once; a chunk repeats a handful of dates thousands of times."""
+    if pd.api.types.is_datetime64_any_dtype(series.dtype):
+        return series
+    codes, uniques = pd.factorize(series)
+    if not len(uniques):
+        return pd.Series(pd.NaT, index=series.index, name=series.name,
+                         dtype="datetime64[ns, UTC]" if utc else "datetime64[ns]")
+    strings = pd.Index(uniques).astype(str)
+    try:
+        parsed = pd.to_datetime(strings, errors="coerce", format="mixed", utc=utc)
+    except ValueError:
+        # Offsets differ between values: normalize to UTC, then drop the zone
+        parsed = pd.to_datetime(strings, errors="coerce", format="mixed", utc=True).tz_convert(None)
+    values = parsed.take(codes).where(codes >= 0)
+    return pd.Series(values, index=series.index, name=series.name)
+
+
+def _as_date(series: pd.Series) -> pd.Series:
+    values = _as_datetime(series)
+    if values.dt.tz is not None:
+        values = values.dt.tz_convert(None)
+    return values.dt.normalize()
+
+
+def _as_timestamp(series: pd.Series) -> pd.Series:
+    values = _as_datetime(series, utc=True)
+    return values.dt.tz_localize("UTC") if values.dt.tz is None else values.dt.tz_convert("UTC")
+
+
+def _as_time(series: pd.Series) -> pd.Series:
+    values = pd.to_datetime(_as_string(series), errors="coerce", format="mixed")
+    return pd.Series(values.dt.time.where(values.notna(), None), index=series.index, name=series.name)
+
+
+def _as_bytes(series: pd.Series) -> pd.Series:
+    return _as_string(series).map(lambda value: value.encode("utf-8"), na_action="ignore").astype(object)
+
+
+_CONVERTERS = {
+    "STRING": _as_string,
+    "INT64": _as_int,
+    "FLOAT64": _as_float,
+    "NUMERIC": _as_float,
+    "BOOL": _as_bool,
+    "DATE": _as_date,
+    "DATETIME": _as_datetime,
+    "TIMESTAMP": _as_timestamp,
+    "TIME": _as_time,
+    "BYTES": _as_bytes,
+}
+
+# How converted columns are rendered for JSON-style (pandas) output
+_PANDAS_FORMATS = {
+    "DATE": lambda values: values.dt.strftime("%Y-%m-%d"),
+    "DATETIME": lambda values: values.dt.strftime("%Y-%m-%dT%H:%M:%S"),
+    "TIMESTAMP": lambda values: values.dt.strftime("%Y-%m-%dT%H:%M:%S"),
+    "TIME": lambda values: values.map(lambda value: value.isoformat(), na_action="ignore"),
+}
+
+
+class ConversionPlan:
+    """
+    A BigQuery schema compiled into one vectorized converter per column.
+
+    Build it with compile_schema(), which caches plans by schema, so the type
+    lookups happen once per schema instead of once per chunk. Each apply counts
+    values that were present in the input but could not be coerced (they are
+    loaded as NULL); per-call counts are returned and running totals are kept
+    in failures.
+
+    Usage:
+        plan = compile_schema(schema_fields)
+        table, failed = plan.to_arrow(df_chunk)
+    """
+
+    def __init__(self, fields: tuple):
+        self.fields = fields
+        self.converters = [(name, bq_type, _CONVERTERS[bq_type]) for name, bq_type in fields]
+        self.failures = Counter()
+        self._lock = threading.Lock()
+
+    def _convert(self, df: pd.DataFrame):
+        """Yield (name, bq_type, converted series or None when missing) and collect failure counts."""
+        failed = {}
+        columns = []
+        for name, bq_type, convert in self.converters:
+            if name not in df.columns:
+                logging.debug(f"⚠️ Column {name} missing in DataFrame — filling with NULL")
+                columns.append((name, bq_type, None))
+                continue
+            series = df[name]
+            converted = convert(series)
+            lost = int((converted.isna() & series.notna()).sum())
+            if lost:
+                failed[name] = lost
+            columns.append((name, bq_type, converted))
+
+        if failed:
+            with self._lock:
+                self.failures.update(failed)
+            logging.warning(f"⚠️ Values that could not be coerced to their BigQuery type, loaded as NULL: {failed}")
+        return columns, failed
+
+    def to_pandas(self, df: pd.DataFrame):
+        """
+        Convert schema columns in a shallow copy of df; other columns are kept as they are.
+
+        DATE, DATETIME, TIMESTAMP and TIME columns are rendered as ISO strings
+        for JSON serialization; nulls stay as pandas missing values.
+
+        Returns:
+            tuple: (pd.DataFrame, {column: failed coercions})
+        """
+        columns, failed = self._convert(df)
+        out = df.copy(deep=False)
+        for name, bq_type, values in columns:
+            if values is None:
+                out[name] = pd.NA
+                continue
+            render = _PANDAS_FORMATS.get(bq_type)
+            out[name] = render(values) if render else values
+        return out, failed
+
+    def to_arrow(self, df: pd.DataFrame):
+        """
+        Build an Arrow table with exactly the schema's columns, in schema order.
+
+        Returns:
+            tuple: (pa.Table, {column: failed coercions})
+        """
+        columns, failed = self._convert(df)
+        arrays = []
+        fields = []
+        for name, bq_type, values in columns:
+            arrow_type = BQ_TO_ARROW_TYPES[bq_type]
+            if values is None:
+                array = pa.nulls(len(df), type=arrow_type)
+            elif bq_type == "DATE":
+                array = pa.array(values, from_pandas=True).cast(arrow_type)
+            else:
+                array = pa.array(values, type=arrow_type, from_pandas=True)
+            arrays.append(array)
+            fields.append(pa.field(name, arrow_type, nullable=True))
+        return pa.Table.from_arrays(arrays, schema=pa.schema(fields)), failed
+
+
+_plans = {}
+_plans_lock = threading.Lock()
+
+
+def compile_schema(schema_fields: list) -> ConversionPlan:
+    """Return the cached ConversionPlan for a list of bigquery.SchemaField, compiling it on first use."""
+    fields = tuple((field.name, canonical_type(field.field_type)) for field in schema_fields)
+    with _plans_lock:
+        plan = _plans.get(fields)
+        if plan is None:
+            plan = _plans[fields] = ConversionPlan(fields)
+        return plan
+
+
+def coercion_failures() -> Counter:
+    """Failed coercions per column, summed over every compiled plan since the last reset."""
+    with _plans_lock:
+        plans = list(_plans.values())
+    total = Counter()
+    for plan in plans:
+        total.update(plan.failures)
+    return total
+
+
+def reset_coercion_failures():
+    """Zero every compiled plan's failure counts, e.g. at the start of a run; the plans stay cached."""
+    with _plans_lock:
+        plans = list(_plans.values())
+    for plan in plans:
+        with plan._lock:
+            plan.failures.clear()
+
 
 def align_df_to_bq_schema(df: pd.DataFrame, schema_fields: list) -> pd.DataFrame:
     """
     Align DataFrame column types with BigQuery schema.
-    Adds warnings if dtypes don't match.
+
+    Uses the schema's cached ConversionPlan; values that fail coercion become
+    NULL and are counted in plan.failures.
     """
-    import pandas as pd
-
-    bq_type_map = {
-        "STRING": "object",
-        "INTEGER": "Int64",   # nullable integer
-        "FLOAT": "float64",
-        "BOOLEAN": "boolean",
-        "DATE": "datetime64[ns]",
-        "TIMESTAMP": "datetime64[ns]",
-    }
-
-    for field in schema_fields:
-        col = field.name
-        bq_type = field.field_type.upper()
-
-        if col not in df.columns:
-            logging.debug(f"⚠️ Column {col} missing in DataFrame — filling with NaN")
-            df[col] = pd.NA
-            continue
-
-        # Check if pandas dtype matches expected BigQuery type
-        expected_dtype = bq_type_map.get(bq_type, None)
-        actual_dtype = str(df[col].dtype)
-
-        if expected_dtype and expected_dtype != actual_dtype:
-            logging.debug(f"⚠️ Column {col} expected {bq_type} ({expected_dtype}) "
-                  f"in BQ but got {actual_dtype} in pandas — coercing.")
-
-        # Now coerce to correct dtype
-        if bq_type == "STRING":
-            df[col] = df[col].astype(str).replace("nan", None)
-        elif bq_type == "INTEGER":
-            df[col] = pd.to_numeric(df[col], errors="coerce").astype("Int64")
-        elif bq_type == "FLOAT":
-            df[col] = pd.to_numeric(df[col], errors="coerce").astype("float64")
-        elif bq_type == "BOOLEAN":
-            df[col] = df[col].astype("boolean")
-        elif bq_type in ("DATE", "TIMESTAMP"):
-            df[col] = pd.to_datetime(df[col], errors="coerce")
-
-             # Convert to ISO string for JSON serialization
-            df[col] = df[col].dt.strftime("%Y-%m-%dT%H:%M:%S").replace({pd.NaT: None})
-
-    return df
+    aligned, _ = compile_schema(schema_fields).to_pandas(df)
+    return aligned
 
 def get_field_type(schema: List[bigquery.SchemaField], field_name: str) -> Optional[str]:
     """
@@ -72,3 +295,35 @@ def get_field_type(schema: List[bigquery.SchemaField], field_name: str) -> Optio
     """
     field = next((f for f in schema if f.name == field_name), None)
     return field.field_type if field else None  
+
+
+def df_to_arrow_table(df: pd.DataFrame, schema_fields: list) -> pa.Table:
+    """
+    Build an Arrow table typed from a BigQuery schema.
+
+    Columns missing from the DataFrame become all-null columns; DataFrame
+    columns not in the schema are dropped. Nullable integers keep their nulls
+    and DATE fields are written as Arrow date32.
+
+    Args:
+        df (pd.DataFrame): Cleaned chunk.
+        schema_fields (list): bigquery.SchemaField objects for the target table.
+
+    Returns:
+        pa.Table: Columns in schema order.
+    """
+    table, _ = compile_schema(schema_fields).to_arrow(df)
+    return table
+
+
+def df_to_parquet_buffer(df: pd.DataFrame, schema_fields: list, compression: str = "snappy") -> io.BytesIO:
+    """
+    Serialize a DataFrame into an in-memory Parquet file typed from a BigQuery schema.
+
+    Returns:
+        io.BytesIO: Buffer positioned at 0, ready for load_table_from_file.
+    """
+    buffer = io.BytesIO()
+    pq.write_table(df_to_arrow_table(df, schema_fields), buffer, compression=compression)
+    buffer.seek(0)
+    return buffer
@@ -0,0 +1,120 @@
+import datetime
+import json
+import logging
+import os
+import sqlite3
+import threading
+from typing import List, Optional, Tuple
+
+STATUS_FETCHED = "fetched"
+STATUS_LOADED = "loaded"
+STATUS_FAILED = "failed"
+
+
+class ChunkManifest:
+    """
+    Durable SQLite record of every chunk window a run has fetched and loaded.
+
+    Each (league, start_date, end_date) row carries the chunk's status
+    ("fetched", "loaded" or "failed"), row count, response size and the load
+    job IDs that wrote it. A restarted run with --resume skips windows whose
+    days are all covered by loaded chunks, so only failed or missing windows
+    are fetched again.
+
+    Usage:
+        manifest = ChunkManifest(".statcast_manifest.sqlite")
+        manifest.record("mlb", "2024-04-01", "2024-04-05", STATUS_FETCHED, rows=21000)
+        manifest.record("mlb", "2024-04-01", "2024-04-05", STATUS_LOADED, load_job_ids=["job_1"])
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS chunks (
+                    league TEXT NOT NULL,
+                    start_date TEXT NOT NULL,
+                    end_date TEXT NOT NULL,
+                    status TEXT NOT NULL,
+                    row_count INTEGER,
+                    byte_size INTEGER,
+                    load_job_ids TEXT,
+                    updated_at TEXT NOT NULL,
+                    PRIMARY KEY (league, start_date, end_date)
+                )
+            """)
+
+    def record(self, league: str, start_date: str, end_date: str, status: str,
+               rows: Optional[int] = None, byte_size: Optional[int] = None,
+               load_job_ids: Optional[List[str]] = None):
+        """Insert or update a window; fields left as None keep their stored value."""
+        now = datetime.datetime.now(datetime.timezone.utc).isoformat(timespec="seconds")
+        job_ids = json.dumps(load_job_ids) if load_job_ids is not None else None
+        with self._lock, self._conn:
+            self._conn.execute("""
+                INSERT INTO chunks (league, start_date, end_date, status, row_count, byte_size, load_job_ids, updated_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT (league, start_date, end_date) DO UPDATE SET
+                    status = excluded.status,
+                    row_count = COALESCE(excluded.row_count, chunks.row_count),
+                    byte_size = COALESCE(excluded.byte_size, chunks.byte_size),
+                    load_job_ids = COALESCE(excluded.load_job_ids, chunks.load_job_ids),
+                    updated_at = excluded.updated_at
+            """, (league, start_date, end_date, status, rows, byte_size, job_ids, now))
+
+    def windows(self, league: str, status: Optional[str] = None) -> List[Tuple[str, str, str, Optional[int]]]:
+        """(start_date, end_date, status, row_count) rows for a league, optionally filtered by status."""
+        query = "SELECT start_date, end_date, status, row_count FROM chunks WHERE league = ?"
+        args = [league]
+        if status:
+            query += " AND status = ?"
+            args.append(status)
+        with self._lock:
+            return self._conn.execute(query + " ORDER BY start_date", args).fetchall()
+
+    def loaded_days(self, league: str) -> set:
+        """Every date covered by a loaded window."""
+        days = set()
+        for start, end, _, _ in self.windows(league, STATUS_LOADED):
+            day = datetime.date.fromisoformat(start)
+            last = datetime.date.fromisoformat(end)
+            while day <= last:
+                days.add(day)
+                day += datetime.timedelta(days=1)
+        return days
+
+    @staticmethod
+    def _covered(start: datetime.date, end: datetime.date, loaded: set) -> bool:
+        return all(start + datetime.timedelta(days=n) in loaded for n in range((end - start).days + 1))
+
+    def pending_windows(self, league: str, windows: List[Tuple[datetime.date, datetime.date]]):
+        """Filter (start, end) date windows down to those not fully covered by loaded chunks."""
+        loaded = self.loaded_days(league)
+        pending = [(start, end) for start, end in windows if not self._covered(start, end, loaded)]
+        skipped = len(windows) - len(pending)
+        if skipped:
+            logging.info(f"⏭️ {league}: resuming, skipping {skipped} of {len(windows)} windows already loaded")
+        return pending
+
+    def incomplete_windows(self, league: str) -> List[Tuple[str, str, str, Optional[int]]]:
+        """Fetched or failed windows whose days no loaded chunk covers."""
+        loaded = self.loaded_days(league)
+        return [window for window in self.windows(league)
+                if window[2] != STATUS_LOADED and not self._covered(
+                    datetime.date.fromisoformat(window[0]), datetime.date.fromisoformat(window[1]), loaded)]
+
+    def reset(self, league: str):
+        """Forget every window for a league, e.g. at the start of a fresh full load."""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM chunks WHERE league = ?", (league,))
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,101 @@
+import datetime
+import logging
+from collections import deque
+from typing import Iterable, Optional, Tuple
+
+DATE_FORMAT = "%Y-%m-%d"
+
+
+class ChunkPlanner:
+    """
+    Hands out date windows to the fetch engines and adapts them to the data.
+
+    Savant silently truncates CSV exports at a fixed row count. When a window
+    comes back with row_cap rows or more, the planner rejects it and queues the
+    two halves in its place, recursing until the window is a single day. With
+    grow=True, windows that return fewer than min_rows rows make the planner
+    coalesce the following seeded windows, up to max_days.
+
+    Usage:
+        planner = ChunkPlanner([(start, end) for _, start, end in _daterange(...)])
+        while (window := planner.next_window()) is not None:
+            df = fetch(*window)
+            if planner.record(*window, df):
+                handle(df)
+    """
+
+    def __init__(self, windows: Iterable[Tuple[datetime.date, datetime.date]], row_cap: int = 25000,
+                 grow: bool = False, min_rows: int = 2500, max_days: int = 31):
+        """
+        Args:
+            windows: Seed (start_date, end_date) windows, usually from _daterange.
+            row_cap (int): Row count at which a response is treated as truncated.
+            grow (bool): Coalesce windows after small responses.
+            min_rows (int): Responses below this size grow the next window.
+            max_days (int): Upper bound on a coalesced window.
+        """
+        self._seeds = deque(windows)
+        self._splits = deque()
+        self.row_cap = row_cap
+        self.grow = grow
+        self.min_rows = min_rows
+        self.max_days = max_days
+        self._merge = 1
+        self.issued = 0
+        self.splits = 0
+
+    @property
+    def remaining(self) -> int:
+        """Windows still queued, before any coalescing."""
+        return len(self._seeds) + len(self._splits)
+
+    def next_window(self) -> Optional[Tuple[str, str]]:
+        """Return the next (start_str, end_str) window to fetch, or None when drained."""
+        if self._splits:
+            start, end = self._splits.popleft()
+        elif self._seeds:
+            start, end = self._seeds.popleft()
+            merged = 1
+            while (self._seeds and merged < self._merge
+                   and self._seeds[0][0] == end + datetime.timedelta(days=1)
+                   and (self._seeds[0][1] - start).days + 1 <= self.max_days):
+                _, end = self._seeds.popleft()
+                merged += 1
+        else:
+            return None
+
+        self.issued += 1
+        return start.strftime(DATE_FORMAT), end.strftime(DATE_FORMAT)
+
+    def record(self, start_str: str, end_str: str, df) -> bool:
+        """
+        Report a finished window.
+
+        Returns:
+            bool: True if the result should be kept; False if it was truncated and
+                has been replaced by two half windows.
+        """
+        rows = 0 if df is None else len(df)
+        start = datetime.datetime.strptime(start_str, DATE_FORMAT).date()
+        end = datetime.datetime.strptime(end_str, DATE_FORMAT).date()
+
+        if rows >= self.row_cap:
+            if start == end:
+                logging.warning(f"⚠️ {start_str} returned {rows} rows, at the Savant cap, and cannot be split further")
+                return True
+
+            middle = start + datetime.timedelta(days=(end - start).days // 2)
+            self._splits.appendleft((middle + datetime.timedelta(days=1), end))
+            self._splits.appendleft((start, middle))
+            self._merge = max(1, self._merge // 2)
+            self.splits += 1
+            logging.info(f"✂️ {start_str} to {end_str} hit the {self.row_cap}-row cap; splitting at {middle}")
+            return False
+
+        if self.grow and df is not None:
+            if rows < self.min_rows:
+                self._merge = min(self._merge * 2, self.max_days)
+            elif rows > self.row_cap // 2:
+                self._merge = max(1, self._merge // 2)
+
+        return True
@@ -0,0 +1,210 @@
+import datetime
+import logging
+import os
+import sqlite3
+import threading
+from typing import Callable, Dict, List, Optional, Tuple
+
+import pandas as pd
+
+DATE_FORMAT = "%Y-%m-%d"
+
+
+def _days(start: datetime.date, end: datetime.date):
+    return [start + datetime.timedelta(days=n) for n in range((end - start).days + 1)]
+
+
+class DateIndex:
+    """
+    Durable SQLite record of what each (league, game_date) produced.
+
+    Every fetched window is broken down by game_date: each date stores its row
+    count and its share (by rows) of the response bytes and fetch latency. Dates
+    in a window that returned nothing are stored with 0 rows. Re-fetching a
+    date overwrites its entry, except that a 0 never replaces a positive count,
+    and a date that returns fewer rows than last time is reported as short.
+    Frames without a response_bytes attr (error paths) are not recorded. Since a
+    0 may be a bad response, estimates only trust positive counts, like
+    SeasonCalendar.windows. The index drives --plan, window sizing (through
+    SeasonCalendar) and row-based progress bars.
+
+    Usage:
+        index = DateIndex(".statcast_index.sqlite")
+        index.record("mlb", "2024-06-01", "2024-06-05", df, seconds=4.2)
+        plan = index.estimate("mlb", windows)
+    """
+
+    def __init__(self, path: str, default_bytes_per_row: float = 1400, default_seconds_per_row: float = 0.0005):
+        """
+        Args:
+            path (str): SQLite file holding the index.
+            default_bytes_per_row (float): Used for estimates until a league has history.
+            default_seconds_per_row (float): Fetch seconds per row until a league has history.
+        """
+        self.path = path
+        self.default_bytes_per_row = default_bytes_per_row
+        self.default_seconds_per_row = default_seconds_per_row
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS dates (
+                    league TEXT NOT NULL,
+                    game_date TEXT NOT NULL,
+                    row_count INTEGER NOT NULL,
+                    byte_size INTEGER,
+                    fetch_seconds REAL,
+                    updated_at TEXT NOT NULL,
+                    PRIMARY KEY (league, game_date)
+                )
+            """)
+
+    def record(self, league: str, start_date: str, end_date: str, df: pd.DataFrame,
+               seconds: Optional[float] = None) -> List[str]:
+        """
+        Store a fetched window's per-date rows, bytes and latency.
+
+        Args:
+            df (pd.DataFrame): The window's rows; its response_bytes attr is split across dates.
+            seconds (float, optional): Fetch latency; None (e.g. a cache hit) keeps the stored value.
+
+        Returns:
+            list: Dates that came back with fewer rows than the index had for them.
+        """
+        if "response_bytes" not in df.attrs:
+            logging.debug(f"{league} {start_date} to {end_date} has no response behind it; not indexed")
+            return []
+
+        days = [day.strftime(DATE_FORMAT) for day in
+                _days(datetime.date.fromisoformat(start_date), datetime.date.fromisoformat(end_date))]
+        counts = dict.fromkeys(days, 0)
+        if "game_date" in df.columns and not df.empty:
+            game_dates = pd.to_datetime(df["game_date"], errors="coerce").dt.strftime(DATE_FORMAT)
+            for day, rows in game_dates.value_counts().items():
+                if day in counts:
+                    counts[day] = int(rows)
+
+        total = sum(counts.values())
+        nbytes = df.attrs.get("response_bytes")
+
+        def share(value, rows):
+            if value is None:
+                return None
+            return value * rows / total if total else value / len(days)
+
+        now = datetime.datetime.now(datetime.timezone.utc).isoformat(timespec="seconds")
+        with self._lock, self._conn:
+            previous = dict(self._conn.execute(
+                "SELECT game_date, row_count FROM dates WHERE league = ? AND game_date BETWEEN ? AND ?",
+                (league, start_date, end_date)).fetchall())
+            self._conn.executemany("""
+                INSERT INTO dates (league, game_date, row_count, byte_size, fetch_seconds, updated_at)
+                VALUES (?, ?, ?, ?, ?, ?)
+                ON CONFLICT (league, game_date) DO UPDATE SET
+                    row_count = CASE WHEN excluded.row_count > 0 THEN excluded.row_count ELSE dates.row_count END,
+                    byte_size = COALESCE(excluded.byte_size, dates.byte_size),
+                    fetch_seconds = COALESCE(excluded.fetch_seconds, dates.fetch_seconds),
+                    updated_at = excluded.updated_at
+            """, [(league, day, rows, None if nbytes is None else round(share(nbytes, rows)),
+                   share(seconds, rows), now) for day, rows in counts.items()])
+
+        short = [day for day, rows in counts.items() if rows < previous.get(day, 0)]
+        for day in short:
+            logging.warning(f"⚠️ {league} {day} returned {counts[day]} rows; the index had {previous[day]}")
+        return short
+
+    def rows(self, league: str, start: datetime.date, end: datetime.date) -> Dict[datetime.date, int]:
+        """Indexed row counts for the dates in a range; dates never fetched are absent."""
+        with self._lock:
+            found = self._conn.execute(
+                "SELECT game_date, row_count FROM dates WHERE league = ? AND game_date BETWEEN ? AND ?",
+                (league, start.strftime(DATE_FORMAT), end.strftime(DATE_FORMAT))).fetchall()
+        return {datetime.date.fromisoformat(day): rows for day, rows in found}
+
+    def rates(self, league: str) -> Tuple[float, float]:
+        """(bytes per row, fetch seconds per row) over the league's history, or the defaults."""
+        with self._lock:
+            row_total, byte_total, timed_rows, seconds_total = self._conn.execute("""
+                SELECT SUM(row_count), SUM(byte_size),
+                       SUM(CASE WHEN fetch_seconds IS NOT NULL THEN row_count END), SUM(fetch_seconds)
+                FROM dates WHERE league = ? AND row_count > 0
+            """, (league,)).fetchone()
+        bytes_per_row = byte_total / row_total if row_total and byte_total else self.default_bytes_per_row
+        seconds_per_row = seconds_total / timed_rows if timed_rows and seconds_total else self.default_seconds_per_row
+        return bytes_per_row, seconds_per_row
+
+    def expected_rows(self, league: str, windows: List[Tuple[datetime.date, datetime.date]],
+                      fallback: Optional[Callable[[str, datetime.date], int]] = None
+                      ) -> Optional[Dict[datetime.date, int]]:
+        """
+        Expected rows for every day in windows: positive indexed counts first, then
+        fallback(league, day), then indexed zeros.
+
+        Returns:
+            dict | None: day -> rows, or None when a day is neither indexed nor covered by fallback.
+        """
+        if not windows:
+            return {}
+        indexed = self.rows(league, min(start for start, _ in windows), max(end for _, end in windows))
+        expected = {}
+        for start, end in windows:
+            for day in _days(start, end):
+                if indexed.get(day):
+                    expected[day] = indexed[day]
+                elif fallback is not None:
+                    expected[day] = fallback(league, day)
+                elif day in indexed:
+                    expected[day] = 0
+                else:
+                    return None
+        return expected
+
+    def estimate(self, league: str, windows: List[Tuple[datetime.date, datetime.date]],
+                 fallback: Optional[Callable[[str, datetime.date], int]] = None) -> List[dict]:
+        """
+        Expected rows, bytes and fetch seconds per window, without any network calls.
+
+        Days the index has never seen, or has only seen with 0 rows, use
+        fallback(league, day) rows; without a fallback, unseen days are left out of
+        the totals and zeros are kept. "indexed" counts the days whose indexed
+        entry the estimate actually used.
+
+        Returns:
+            list: {"start", "end", "days", "indexed", "rows", "bytes", "seconds"} per window.
+        """
+        if not windows:
+            return []
+        bytes_per_row, seconds_per_row = self.rates(league)
+        with self._lock:
+            found = self._conn.execute("""
+                SELECT game_date, row_count, byte_size, fetch_seconds FROM dates
+                WHERE league = ? AND game_date BETWEEN ? AND ?
+            """, (league, min(s for s, _ in windows).strftime(DATE_FORMAT),
+                  max(e for _, e in windows).strftime(DATE_FORMAT))).fetchall()
+        indexed = {datetime.date.fromisoformat(day): (rows, nbytes, seconds) for day, rows, nbytes, seconds in found}
+
+        plan = []
+        for start, end in windows:
+            entry = {"start": start, "end": end, "days": (end - start).days + 1, "indexed": 0,
+                     "rows": 0, "bytes": 0.0, "seconds": 0.0}
+            for day in _days(start, end):
+                if day in indexed and (indexed[day][0] or fallback is None):
+                    rows, nbytes, seconds = indexed[day]
+                    entry["indexed"] += 1
+                else:
+                    rows = fallback(league, day) if fallback is not None else 0
+                    nbytes = seconds = None
+                entry["rows"] += rows
+                entry["bytes"] += nbytes if nbytes is not None else rows * bytes_per_row
+                entry["seconds"] += seconds if seconds is not None else rows * seconds_per_row
+            plan.append(entry)
+        return plan
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,200 @@
+import datetime
+import logging
+import threading
+import time
+from typing import Hashable, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+DATE_FORMAT = "%Y-%m-%d"
+HEDGE_MODES = ("duplicate", "split")
+
+
+def split_window(start_str: str, end_str: str) -> Optional[List[Tuple[str, str]]]:
+    """The two halves of a window, or None for a single day."""
+    start = datetime.datetime.strptime(start_str, DATE_FORMAT).date()
+    end = datetime.datetime.strptime(end_str, DATE_FORMAT).date()
+    if start == end:
+        return None
+    middle = start + datetime.timedelta(days=(end - start).days // 2)
+    return [(start_str, middle.strftime(DATE_FORMAT)),
+            ((middle + datetime.timedelta(days=1)).strftime(DATE_FORMAT), end_str)]
+
+
+class HedgePolicy:
+    """
+    When and how often slow chunks get a backup request. Shared by every fetch
+    in a run so latency history and the hedge budget span both leagues.
+
+    A chunk is hedged once it has been in flight longer than `percentile` of the
+    chunk latencies seen so far (and at least min_delay seconds). Hedges are
+    capped at `budget` times the number of chunks requested, so a uniformly
+    slow server costs at most that fraction of extra load.
+
+    Args:
+        mode (str): "duplicate" re-requests the same window; "split" requests its
+            two halves, falling back to a duplicate for single days.
+        percentile (float): Latency percentile that marks a chunk as slow.
+        budget (float): Hedges allowed per chunk requested.
+        min_samples (int): Completed chunks needed before anything is hedged.
+        min_delay (float): Never hedge a chunk younger than this many seconds.
+    """
+
+    def __init__(self, mode: str = "duplicate", percentile: float = 95.0, budget: float = 0.1,
+                 min_samples: int = 8, min_delay: float = 5.0):
+        if mode not in HEDGE_MODES:
+            raise ValueError(f"mode must be one of {HEDGE_MODES}")
+        self.mode = mode
+        self.percentile = percentile
+        self.budget = budget
+        self.min_samples = min_samples
+        self.min_delay = min_delay
+        self.requested = 0
+        self.hedged = 0
+        self.won = 0
+        self._latencies = []
+        self._lock = threading.Lock()
+
+    def observe(self, seconds: float):
+        with self._lock:
+            self._latencies.append(seconds)
+
+    def delay(self) -> Optional[float]:
+        """Age at which a chunk gets hedged, or None until there is enough history."""
+        with self._lock:
+            if len(self._latencies) < self.min_samples:
+                return None
+            return max(self.min_delay, float(np.percentile(self._latencies, self.percentile)))
+
+    def count(self, counter: str):
+        """Increment the requested or won counter."""
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+    def spend(self) -> bool:
+        """Take one hedge from the budget if any is left."""
+        with self._lock:
+            if self.hedged + 1 > self.budget * self.requested:
+                return False
+            self.hedged += 1
+            return True
+
+
+class RequestHedger:
+    """
+    Tracks the requests for each window of one fetch engine run and picks the
+    first complete answer.
+
+    The engine registers each window's primary request with track(), asks
+    due() for windows to hedge, registers the extra requests with add(), and
+    passes every finished request to complete(). Handles are whatever the engine
+    uses for a request (futures, tasks).
+    """
+
+    def __init__(self, policy: HedgePolicy):
+        self.policy = policy
+        self._windows = {}
+        self._owner = {}
+
+    @property
+    def open(self) -> int:
+        """Windows still waiting for an answer."""
+        return len(self._windows)
+
+    def track(self, window: Tuple[str, str], handle: Hashable):
+        """Register a window's primary request."""
+        self._windows[window] = {"started": time.monotonic(), "primary": handle, "attempts": {handle: None},
+                                 "parts": {}, "hedged": False}
+        self._owner[handle] = window
+        self.policy.count("requested")
+
+    def next_check(self) -> Optional[float]:
+        """Seconds until the oldest unhedged window becomes due, or None."""
+        delay = self.policy.delay()
+        pending = [state["started"] for state in self._windows.values() if not state["hedged"]]
+        if delay is None or not pending:
+            return None
+        return max(0.0, min(pending) + delay - time.monotonic())
+
+    def due(self) -> List[Tuple[Tuple[str, str], List[Tuple[str, str]]]]:
+        """
+        Windows past the hedge delay that the budget allows hedging now.
+
+        Returns:
+            list: (window, requests) pairs; requests is [window] for a duplicate
+                or the two halves for a split hedge.
+        """
+        delay = self.policy.delay()
+        if delay is None:
+            return []
+        now = time.monotonic()
+        due = []
+        for window, state in sorted(self._windows.items(), key=lambda item: item[1]["started"]):
+            if state["hedged"] or now - state["started"] < delay:
+                continue
+            if not self.policy.spend():
+                break
+            state["hedged"] = True
+            halves = split_window(*window) if self.policy.mode == "split" else None
+            due.append((window, halves or [window]))
+            logging.info(f"🪁 Hedging {window[0]} to {window[1]} after {now - state['started']:.1f}s "
+                         f"({'split' if halves else 'duplicate'})")
+        return due
+
+    def add(self, window: Tuple[str, str], part: Tuple[str, str], handle: Hashable):
+        """Register a hedge request for window; part is the date range it covers."""
+        state = self._windows[window]
+        state["attempts"][handle] = None if part == window else part
+        self._owner[handle] = window
+
+    def complete(self, handle: Hashable, df) -> Tuple[Optional[tuple], List[Hashable]]:
+        """
+        Report a finished request.
+
+        Returns:
+            tuple: (answer, orphans). answer is (window, df) once the window is
+                answered, or None while it still waits on other requests (or was
+                already answered). orphans are requests whose results are no longer
+                needed, for the engine to cancel.
+        """
+        window = self._owner.pop(handle, None)
+        state = self._windows.get(window)
+        if state is None:
+            return None, []
+        part = state["attempts"].pop(handle)
+
+        if part is None and df is not None:
+            return self._resolve(window, df, hedge_won=handle != state["primary"])
+        if part is not None and df is not None:
+            state["parts"][part] = df
+            if len(state["parts"]) == 2:
+                frames = [state["parts"][p] for p in sorted(state["parts"])]
+                df = pd.concat(frames, ignore_index=True)
+                df.attrs["response_bytes"] = sum(frame.attrs.get("response_bytes", 0) for frame in frames)
+                df.attrs["fetch_seconds"] = max(frame.attrs.get("fetch_seconds", 0.0) for frame in frames)
+                return self._resolve(window, df, hedge_won=True)
+            return None, []
+        orphans = []
+        if part is not None:
+            # A failed half can't complete the split; stop waiting for its sibling
+            for other, other_part in list(state["attempts"].items()):
+                if other_part is not None:
+                    state["attempts"].pop(other)
+                    self._owner.pop(other, None)
+                    orphans.append(other)
+        if state["attempts"]:
+            return None, orphans
+        answer, redundant = self._resolve(window, None, hedge_won=False)
+        return answer, orphans + redundant
+
+    def _resolve(self, window, df, hedge_won):
+        state = self._windows.pop(window)
+        orphans = list(state["attempts"])
+        for handle in orphans:
+            self._owner.pop(handle, None)
+        if df is not None:
+            self.policy.observe(time.monotonic() - state["started"])
+        if hedge_won:
+            self.policy.count("won")
+        return (window, df), orphans
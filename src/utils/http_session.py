@@ -0,0 +1,81 @@
+import logging
+import threading
+from typing import Dict, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+DEFAULT_SESSION_HEADERS = {
+    "Connection": "keep-alive",
+    "Accept-Encoding": "gzip, deflate",
+}
+
+
+class SessionPool:
+    """
+    Thread-safe registry of keep-alive requests.Session objects, one per base URL.
+
+    Each session mounts an HTTPAdapter whose connection pool is sized to the
+    number of workers, so parallel chunk downloads reuse a handful of TCP+TLS
+    connections instead of opening a new one per chunk.
+
+    Usage:
+        with SessionPool(pool_size=8) as pool:
+            session = pool.get(BASE_MLB_URL, MLB_HEADERS)
+            session.get(BASE_MLB_URL, params=params, timeout=180)
+    """
+
+    def __init__(self, pool_size: int = 4):
+        self.pool_size = max(1, int(pool_size))
+        self._sessions: Dict[str, requests.Session] = {}
+        self._lock = threading.Lock()
+
+    def get(self, base_url: str, headers: Optional[dict] = None) -> requests.Session:
+        """
+        Return the shared session for base_url, creating it on first use.
+
+        Args:
+            base_url (str): Endpoint the session will talk to.
+            headers (dict, optional): Default headers for the session. A
+                "Connection: close" header is dropped so keep-alive is not defeated.
+
+        Returns:
+            requests.Session: Session shared by every worker for this base URL.
+        """
+        with self._lock:
+            session = self._sessions.get(base_url)
+            if session is None:
+                session = self._create_session(headers)
+                self._sessions[base_url] = session
+                logging.debug(f"🔌 Created HTTP session for {base_url} (pool size {self.pool_size})")
+            return session
+
+    def _create_session(self, headers: Optional[dict]) -> requests.Session:
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=self.pool_size,
+            pool_block=True,
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+
+        session.headers.update(DEFAULT_SESSION_HEADERS)
+        for key, value in (headers or {}).items():
+            if key.lower() == "connection" and str(value).lower() == "close":
+                continue
+            session.headers[key] = value
+        return session
+
+    def close(self):
+        """Close every pooled session and release its connections."""
+        with self._lock:
+            for session in self._sessions.values():
+                session.close()
+            self._sessions.clear()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
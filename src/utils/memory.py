@@ -0,0 +1,90 @@
+import logging
+import os
+import sys
+import time
+from typing import Callable, Optional
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+
+def current_rss() -> Optional[int]:
+    """Resident set size of this process in bytes, or None if it can't be measured."""
+    if psutil is not None:
+        return psutil.Process().memory_info().rss
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, AttributeError):
+        return peak_rss()
+
+
+def peak_rss() -> Optional[int]:
+    """Peak resident set size of this process in bytes, or None if it can't be measured."""
+    if resource is not None:
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # ru_maxrss is bytes on macOS and kilobytes elsewhere
+        return peak if sys.platform == "darwin" else peak * 1024
+    if psutil is not None:
+        info = psutil.Process().memory_info()
+        return getattr(info, "peak_wset", info.rss)
+    return None
+
+
+class MemoryBudget:
+    """
+    Holds a producer back while the process is over a memory budget.
+
+    wait() blocks while RSS is above limit_bytes and there is still work in
+    flight that will release memory when it finishes. If nothing is in flight
+    the budget can't be met by waiting, so wait() returns and logs a warning
+    instead of deadlocking.
+
+    Usage:
+        budget = MemoryBudget(512 * 1024 ** 2)
+        for item in results:
+            budget.wait(lambda: pipeline.pending)
+            pipeline.put(item)
+    """
+
+    def __init__(self, limit_bytes: int, poll_seconds: float = 0.05):
+        self.limit_bytes = limit_bytes
+        self.poll_seconds = poll_seconds
+        self.waits = 0
+        self._warned = False
+
+    def exceeded(self) -> bool:
+        rss = current_rss()
+        return rss is not None and rss > self.limit_bytes
+
+    def wait(self, in_flight: Callable[[], int], on_exceeded: Callable[[], None] = None):
+        """
+        Block until RSS is under budget or nothing is left in flight.
+
+        Args:
+            in_flight (callable): Returns how many items are still being processed.
+            on_exceeded (callable, optional): Called once when the budget is first
+                exceeded, e.g. to flush buffered writes.
+        """
+        if not self.exceeded():
+            return
+
+        self.waits += 1
+        if on_exceeded:
+            on_exceeded()
+
+        while self.exceeded():
+            if in_flight() <= 0:
+                if not self._warned:
+                    logging.warning(f"⚠️ RSS {current_rss() / 1024 ** 2:.0f} MB is over the "
+                                    f"{self.limit_bytes / 1024 ** 2:.0f} MB budget with nothing in flight")
+                    self._warned = True
+                return
+            time.sleep(self.poll_seconds)
@@ -0,0 +1,112 @@
+import logging
+import queue
+import threading
+from typing import Callable, Dict, List, Tuple
+
+_STOP = object()
+
+
+class StagedPipeline:
+    """
+    Chain of worker pools connected by bounded queues.
+
+    Each stage is (name, func, workers). Items put() into the pipeline are
+    handed to the first stage; whatever a stage's func returns is passed to the
+    next stage, and returning None drops the item. Because every queue is
+    bounded, a slow stage blocks the one before it, and put() blocks the
+    producer, so memory stays bounded while network, CPU and BigQuery work
+    overlap.
+
+    Usage:
+        with StagedPipeline([("clean", clean, 2), ("write", write, 2)], queue_size=4) as pipeline:
+            for item in results:
+                pipeline.put(item)
+        print(pipeline.max_depths)
+    """
+
+    def __init__(self, stages: List[Tuple[str, Callable, int]], queue_size: int = 4):
+        if not stages:
+            raise ValueError("StagedPipeline needs at least one stage")
+
+        self.stage_names = [name for name, _, _ in stages]
+        self._queues = [queue.Queue(maxsize=max(1, queue_size)) for _ in stages]
+        self._threads: List[List[threading.Thread]] = []
+        self._max_depths = {name: 0 for name in self.stage_names}
+        self._depth_lock = threading.Lock()
+        self._pending = 0
+        self._closed = False
+
+        for index, (name, func, workers) in enumerate(stages):
+            threads = []
+            for n in range(max(1, workers)):
+                thread = threading.Thread(target=self._work, args=(index, name, func),
+                                          name=f"statcast-{name}-{n}", daemon=True)
+                thread.start()
+                threads.append(thread)
+            self._threads.append(threads)
+
+    def _put(self, index: int, item):
+        q = self._queues[index]
+        q.put(item)
+        with self._depth_lock:
+            name = self.stage_names[index]
+            self._max_depths[name] = max(self._max_depths[name], q.qsize())
+
+    def _work(self, index: int, name: str, func: Callable):
+        source = self._queues[index]
+        is_last = index == len(self._queues) - 1
+        while True:
+            item = source.get()
+            if item is _STOP:
+                break
+            try:
+                result = func(item)
+            except Exception as e:
+                logging.error(f"💥 Exception in {name} stage: {e}", exc_info=True)
+                result = None
+            # Drop the reference before blocking on the next queue or the next get()
+            item = None
+            if result is not None and not is_last:
+                self._put(index + 1, result)
+            else:
+                with self._depth_lock:
+                    self._pending -= 1
+
+    def put(self, item):
+        """Feed an item to the first stage, blocking while its queue is full."""
+        with self._depth_lock:
+            self._pending += 1
+        self._put(0, item)
+
+    @property
+    def pending(self) -> int:
+        """Items put into the pipeline that haven't finished or been dropped yet."""
+        with self._depth_lock:
+            return self._pending
+
+    def depths(self) -> Dict[str, int]:
+        """Current number of items waiting in front of each stage."""
+        return {name: q.qsize() for name, q in zip(self.stage_names, self._queues)}
+
+    @property
+    def max_depths(self) -> Dict[str, int]:
+        """Deepest each stage's input queue got; a stage that keeps filling up is the bottleneck."""
+        with self._depth_lock:
+            return dict(self._max_depths)
+
+    def close(self):
+        """Drain every stage in order and stop its workers."""
+        if self._closed:
+            return
+        self._closed = True
+        for q, threads in zip(self._queues, self._threads):
+            for _ in threads:
+                q.put(_STOP)
+            for thread in threads:
+                thread.join()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
@@ -0,0 +1,172 @@
+import datetime
+import gzip
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from typing import Optional
+
+
+class ResponseCache:
+    """
+    On-disk, content-addressed cache of raw Savant CSV responses.
+
+    Entries are keyed by the base URL and the full query (including
+    game_date_gt/game_date_lt) and stored gzip-compressed. Windows that end
+    before the current season never expire; recent windows expire after
+    ttl_seconds. When the cache grows past max_bytes, the least recently used
+    entries are evicted.
+
+    Layout:
+        <cache_dir>/<key[:2]>/<key>.csv.gz   (mtime = fetch time, atime = last use)
+
+    Usage:
+        cache = ResponseCache(".statcast_cache", ttl_seconds=86400)
+        content = cache.get(BASE_MLB_URL, params)
+        if content is None:
+            content = requests.get(BASE_MLB_URL, params=params).content
+            cache.put(BASE_MLB_URL, params, content)
+    """
+
+    SUFFIX = ".csv.gz"
+
+    def __init__(self, cache_dir: str, ttl_seconds: int = 86400, max_bytes: int = 2 * 1024 ** 3,
+                 offline: bool = False, refresh: bool = False):
+        """
+        Args:
+            cache_dir (str): Directory holding cached responses.
+            ttl_seconds (int): Lifetime of entries for current-season windows.
+            max_bytes (int): Size budget; LRU entries are evicted beyond it.
+            offline (bool): Serve only from cache; callers must not hit the network.
+                Expired entries are still served, since nothing fresher can be fetched.
+            refresh (bool): Ignore existing entries (but still store new responses).
+        """
+        self.cache_dir = cache_dir
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+        self.offline = offline
+        self.refresh = refresh
+        self._lock = threading.Lock()
+
+        os.makedirs(self.cache_dir, exist_ok=True)
+        self._size = sum(os.path.getsize(path) for path in self._entries())
+        logging.debug(f"🗄️ Response cache at {self.cache_dir} ({self._size / 1024 ** 2:.1f} MB)")
+
+    @staticmethod
+    def key(base_url: str, params: dict) -> str:
+        """Stable content address for a request."""
+        payload = json.dumps({"url": base_url, "params": {k: str(v) for k, v in sorted(params.items())}},
+                             sort_keys=True)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, key[:2], key + self.SUFFIX)
+
+    def _entries(self):
+        for root, _, files in os.walk(self.cache_dir):
+            for name in files:
+                if name.endswith(self.SUFFIX):
+                    yield os.path.join(root, name)
+
+    @staticmethod
+    def _is_final(params: dict) -> bool:
+        """True when the window ends before the current season, so Savant won't change it."""
+        end = params.get("game_date_lt")
+        try:
+            end_date = datetime.datetime.strptime(str(end), "%Y-%m-%d").date()
+        except ValueError:
+            return False
+        return end_date.year < datetime.date.today().year
+
+    def get(self, base_url: str, params: dict) -> Optional[bytes]:
+        """
+        Return the cached raw CSV bytes for a request, or None on a miss.
+
+        Expired entries are treated as misses, except offline where a stale copy
+        beats none. With refresh=True every lookup misses.
+        """
+        if self.refresh:
+            return None
+
+        path = self._path(self.key(base_url, params))
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            return None
+
+        now = time.time()
+        if not self.offline and not self._is_final(params) and now - stat.st_mtime > self.ttl_seconds:
+            logging.debug(f"🗄️ Cache entry expired for {params.get('game_date_gt')} to {params.get('game_date_lt')}")
+            return None
+
+        try:
+            with gzip.open(path, "rb") as f:
+                content = f.read()
+        except (OSError, EOFError) as e:
+            logging.warning(f"⚠️ Discarding unreadable cache entry {path}: {e}")
+            self._remove(path)
+            return None
+
+        # Record the access for LRU eviction, keeping mtime as the fetch time
+        os.utime(path, (now, stat.st_mtime))
+        logging.debug(f"🗄️ Cache hit for {params.get('game_date_gt')} to {params.get('game_date_lt')}")
+        return content
+
+    def put(self, base_url: str, params: dict, content: bytes):
+        """Store raw CSV bytes for a request, then evict LRU entries if over budget."""
+        path = self._path(self.key(base_url, params))
+        directory = os.path.dirname(path)
+        os.makedirs(directory, exist_ok=True)
+
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as raw, gzip.GzipFile(fileobj=raw, mode="wb", mtime=0) as f:
+                f.write(content)
+            new_size = os.path.getsize(tmp_path)
+            with self._lock:
+                old_size = os.path.getsize(path) if os.path.exists(path) else 0
+                os.replace(tmp_path, path)
+                self._size += new_size - old_size
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+        if self._size > self.max_bytes:
+            self.evict()
+
+    def _remove(self, path: str):
+        with self._lock:
+            try:
+                size = os.path.getsize(path)
+                os.remove(path)
+                self._size -= size
+            except FileNotFoundError:
+                pass
+
+    def evict(self):
+        """Delete least recently used entries until the cache fits in max_bytes."""
+        entries = []
+        for path in self._entries():
+            try:
+                stat = os.stat(path)
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_atime, stat.st_size, path))
+
+        with self._lock:
+            self._size = sum(size for _, size, _ in entries)
+        entries.sort()
+
+        evicted = 0
+        for _, _, path in entries:
+            if self._size <= self.max_bytes:
+                break
+            self._remove(path)
+            evicted += 1
+
+        if evicted:
+            logging.debug(f"🗄️ Evicted {evicted} cache entries; size now {self._size / 1024 ** 2:.1f} MB")
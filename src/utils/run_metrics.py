@@ -0,0 +1,157 @@
+import json
+import logging
+import threading
+import time
+from collections import Counter, defaultdict
+from contextlib import contextmanager
+from typing import Optional
+
+import numpy as np
+
+PERCENTILES = (50, 90, 95, 99)
+
+# Stages in pipeline order, so reports read top to bottom like a chunk's journey
+STAGE_ORDER = ("http", "parse", "clean", "csv_write", "parquet_write", "bq_write", "bq_load")
+
+COUNTER_HELP = {
+    "requests": "HTTP requests sent to Savant",
+    "retries": "Failed HTTP requests that were retried or gave up",
+    "throttled": "HTTP 429 responses from Savant",
+    "bytes_downloaded": "Response bytes downloaded from Savant",
+    "cache_hits": "Chunks served from the response cache",
+    "chunks": "Chunks fetched",
+    "chunks_failed": "Chunks whose every retry failed",
+    "rows_fetched": "Rows parsed from Savant responses",
+    "rows_written": "Rows handed to the writers",
+    "short_dates": "Game dates that returned fewer rows than the date index had",
+    "bq_load_jobs": "BigQuery load jobs that completed",
+    "bq_load_failures": "BigQuery load jobs that failed",
+    "bq_rows_loaded": "Rows loaded into BigQuery",
+}
+
+
+class RunMetrics:
+    """
+    Thread-safe stage timings and counters for one download run.
+
+    Every fetch, parse, clean, write and load call records how long it took, so
+    the summary shows whether a slow run was spent waiting on Savant (http),
+    on the CPU (parse/clean) or on BigQuery (bq_load).
+
+    Usage:
+        metrics = RunMetrics()
+        with metrics.timer("clean"):
+            clean_dataframe(df)
+        metrics.add("rows_written", len(df))
+        summary = metrics.summary()
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._samples = defaultdict(list)
+        self._counters = Counter()
+        self._started = time.perf_counter()
+
+    def observe(self, stage: str, seconds: float):
+        """Record one duration for a stage."""
+        with self._lock:
+            self._samples[stage].append(seconds)
+
+    @contextmanager
+    def timer(self, stage: str):
+        """Time the block and record it under stage, even when it raises."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(stage, time.perf_counter() - start)
+
+    def add(self, counter: str, value: int = 1):
+        with self._lock:
+            self._counters[counter] += value
+
+    def summary(self, peak_rss_bytes: Optional[int] = None) -> dict:
+        """
+        Aggregate everything recorded so far.
+
+        Returns:
+            dict: {"elapsed_seconds", "counters", "throughput", "stages"}, where each
+                stage has count, total, mean, max and p50/p90/p95/p99 in seconds.
+        """
+        with self._lock:
+            samples = {stage: list(values) for stage, values in self._samples.items()}
+            counters = dict(self._counters)
+        elapsed = time.perf_counter() - self._started
+
+        ordered = [s for s in STAGE_ORDER if s in samples] + sorted(s for s in samples if s not in STAGE_ORDER)
+        stages = {}
+        for stage in ordered:
+            values = np.asarray(samples[stage])
+            stats = {"count": int(values.size), "total": float(values.sum()),
+                     "mean": float(values.mean()), "max": float(values.max())}
+            for pct, value in zip(PERCENTILES, np.percentile(values, PERCENTILES)):
+                stats[f"p{pct}"] = float(value)
+            stages[stage] = {key: round(value, 4) for key, value in stats.items()}
+
+        summary = {
+            "elapsed_seconds": round(elapsed, 3),
+            "counters": counters,
+            "throughput": {
+                "rows_per_sec": round(counters.get("rows_written", 0) / elapsed, 1) if elapsed else 0.0,
+                "mb_per_sec": round(counters.get("bytes_downloaded", 0) / 1024 ** 2 / elapsed, 3) if elapsed else 0.0,
+            },
+            "stages": stages,
+        }
+        if peak_rss_bytes:
+            summary["peak_rss_bytes"] = peak_rss_bytes
+        return summary
+
+
+def log_summary(summary: dict):
+    """Log one line per stage plus the headline counters."""
+    for stage, stats in summary["stages"].items():
+        logging.info(f"📈 {stage:<14} n={stats['count']:<5} p50={stats['p50']:.3f}s p95={stats['p95']:.3f}s "
+                     f"max={stats['max']:.3f}s total={stats['total']:.1f}s")
+    counters = summary["counters"]
+    logging.info(f"📈 {counters.get('requests', 0)} requests, {counters.get('retries', 0)} retries "
+                 f"({counters.get('throttled', 0)} throttled), "
+                 f"{counters.get('bytes_downloaded', 0) / 1024 ** 2:.1f} MB downloaded, "
+                 f"{counters.get('rows_written', 0)} rows written "
+                 f"({summary['throughput']['rows_per_sec']:.0f} rows/sec)")
+
+
+def write_json_report(summary: dict, path: str):
+    with open(path, "w") as f:
+        json.dump(summary, f, indent=2, default=str)
+    logging.info(f"📈 Run report written to {path}")
+
+
+def prometheus_text(summary: dict, prefix: str = "statcast") -> str:
+    """
+    Render a run summary in the Prometheus text exposition format, e.g. for the
+    node_exporter textfile collector or a Pushgateway.
+    """
+    lines = [
+        f"# HELP {prefix}_stage_seconds Time spent per call in each download stage.",
+        f"# TYPE {prefix}_stage_seconds summary",
+    ]
+    for stage, stats in summary["stages"].items():
+        for pct in PERCENTILES:
+            lines.append(f'{prefix}_stage_seconds{{stage="{stage}",quantile="{pct / 100:g}"}} {stats[f"p{pct}"]}')
+        lines.append(f'{prefix}_stage_seconds_sum{{stage="{stage}"}} {stats["total"]}')
+        lines.append(f'{prefix}_stage_seconds_count{{stage="{stage}"}} {stats["count"]}')
+
+    for counter, value in sorted(summary["counters"].items()):
+        name = f"{prefix}_{counter}_total"
+        lines.append(f"# HELP {name} {COUNTER_HELP.get(counter, counter.replace('_', ' '))}.")
+        lines.append(f"# TYPE {name} counter")
+        lines.append(f"{name} {value}")
+
+    gauges = [("run_seconds", "Wall time of the run.", summary["elapsed_seconds"]),
+              ("rows_per_second", "Rows written per second of wall time.", summary["throughput"]["rows_per_sec"])]
+    if summary.get("peak_rss_bytes"):
+        gauges.append(("peak_rss_bytes", "Peak resident memory of the run.", summary["peak_rss_bytes"]))
+    for name, help_text, value in gauges:
+        lines += [f"# HELP {prefix}_{name} {help_text}", f"# TYPE {prefix}_{name} gauge", f"{prefix}_{name} {value}"]
+
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,155 @@
+import datetime
+import json
+import logging
+import os
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+import requests
+
+DATE_FORMAT = "%Y-%m-%d"
+SKIPPED_STATES = {"Postponed", "Cancelled"}
+
+
+class SeasonCalendar:
+    """
+    Local, cached calendar of game dates per league, used to plan date windows.
+
+    Each (league, season) schedule is read once from the MLB Stats API and kept
+    in a JSON file: past seasons never expire, the current one is re-read after
+    ttl_seconds. A day's expected rows are its games times rows_per_game, so
+    windows() can skip days without games (offseason, All-Star break) and cut the
+    rest into windows holding about the same number of pitches. Seasons whose
+    schedule can't be read count every day as a full slate. With a DateIndex,
+    the rows earlier runs actually saw replace the estimate for those days.
+
+    Layout:
+        {"mlb": {"2024": {"fetched": 1717000000.0, "games": {"2024-03-20": 1, ...}}}}
+
+    Usage:
+        calendar = SeasonCalendar(".statcast_calendar.json", SCHEDULE_URL, {"mlb": [1]})
+        windows = calendar.windows("mlb", start_date, end_date, target_rows=20000)
+    """
+
+    def __init__(self, path: str, schedule_url: str, sport_ids: Dict[str, List[int]],
+                 game_types: Optional[List[str]] = None, rows_per_game: Optional[Dict[str, int]] = None,
+                 full_slate_games: Optional[Dict[str, int]] = None, ttl_seconds: int = 86400,
+                 offline: bool = False, index=None):
+        """
+        Args:
+            path (str): JSON file holding cached schedules.
+            schedule_url (str): Stats API schedule endpoint.
+            sport_ids (dict): League -> Stats API sport IDs whose games Savant tracks.
+            game_types (list, optional): Stats API game types to count (R, F, D, L, W, A, S...).
+            rows_per_game (dict, optional): League -> typical pitches per game.
+            full_slate_games (dict, optional): League -> games assumed per day when
+                the schedule is unknown.
+            ttl_seconds (int): Lifetime of the current season's schedule.
+            offline (bool): Never call the Stats API; use only cached schedules.
+            index (DateIndex, optional): Observed rows per date from earlier runs.
+        """
+        self.path = path
+        self.schedule_url = schedule_url
+        self.sport_ids = sport_ids
+        self.game_types = game_types or ["R", "F", "D", "L", "W", "A"]
+        self.rows_per_game = rows_per_game or {}
+        self.full_slate_games = full_slate_games or {}
+        self.ttl_seconds = ttl_seconds
+        self.offline = offline
+        self.index = index
+        self._lock = threading.Lock()
+        self._seasons = {}
+        self._unavailable = set()
+        if os.path.exists(path):
+            with open(path, "r", encoding="utf-8") as f:
+                self._seasons = json.load(f)
+
+    def season(self, league: str, year: int) -> Optional[Dict[str, int]]:
+        """Games per date for one season, or None when its schedule is unavailable."""
+        with self._lock:
+            entry = self._seasons.get(league, {}).get(str(year))
+            if entry is not None and (year < datetime.date.today().year
+                                      or time.time() - entry["fetched"] < self.ttl_seconds):
+                return entry["games"]
+            if self.offline or (league, year) in self._unavailable:
+                return entry["games"] if entry else None
+
+            try:
+                games = self._fetch_season(league, year)
+            except (requests.exceptions.RequestException, ValueError, KeyError) as e:
+                self._unavailable.add((league, year))
+                logging.warning(f"⚠️ Could not read the {year} {league} schedule ({e}); "
+                                f"{'using the cached copy' if entry else 'assuming a game every day'}")
+                return entry["games"] if entry else None
+
+            self._seasons.setdefault(league, {})[str(year)] = {"fetched": time.time(), "games": games}
+            self._save()
+            logging.info(f"📅 Cached the {year} {league} schedule: {len(games)} game dates")
+            return games
+
+    def _fetch_season(self, league: str, year: int) -> Dict[str, int]:
+        params = {"sportId": self.sport_ids[league], "gameType": self.game_types,
+                  "startDate": f"{year}-01-01", "endDate": f"{year}-12-31"}
+        response = requests.get(self.schedule_url, params=params, timeout=30)
+        response.raise_for_status()
+        games = {}
+        for date in response.json().get("dates", []):
+            played = [game for game in date.get("games", [])
+                      if game.get("status", {}).get("detailedState") not in SKIPPED_STATES]
+            if played:
+                games[date["date"]] = len(played)
+        return games
+
+    def _save(self):
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self._seasons, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, self.path)
+
+    def expected_rows(self, league: str, day: datetime.date) -> int:
+        """Pitches expected on one day; 0 for days without games."""
+        games = self.season(league, day.year)
+        count = self.full_slate_games.get(league, 15) if games is None else games.get(day.strftime(DATE_FORMAT), 0)
+        return count * self.rows_per_game.get(league, 300)
+
+    def windows(self, league: str, start_date: datetime.date, end_date: datetime.date,
+                target_rows: int = 20000, max_days: int = 31) -> List[Tuple[datetime.date, datetime.date]]:
+        """
+        Cut a date range, across any number of seasons, into windows of about target_rows.
+
+        Windows start and end on game days and may span days without games, so
+        the offseason and other dead days are never requested on their own.
+
+        Returns:
+            list: (window_start, window_end) dates in order.
+        """
+        # A date indexed with 0 rows may have been a bad response, so only positive counts override the schedule
+        observed = self.index.rows(league, start_date, end_date) if self.index is not None else {}
+        windows = []
+        window_start = last_game_day = None
+        window_rows = live_days = 0
+        day = start_date
+        while day <= end_date:
+            rows = observed.get(day) or self.expected_rows(league, day)
+            if rows:
+                if window_start is not None and (window_rows + rows > target_rows
+                                                 or (day - window_start).days + 1 > max_days):
+                    windows.append((window_start, last_game_day))
+                    window_start = None
+                if window_start is None:
+                    window_start, window_rows = day, 0
+                window_rows += rows
+                last_game_day = day
+                live_days += 1
+            day += datetime.timedelta(days=1)
+        if window_start is not None:
+            windows.append((window_start, last_game_day))
+
+        total_days = (end_date - start_date).days + 1
+        logging.info(f"📅 {league}: {live_days} of {total_days} days have games; "
+                     f"{len(windows)} windows of about {target_rows} rows")
+        return windows
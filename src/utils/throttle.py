@@ -0,0 +1,215 @@
+import asyncio
+import logging
+import random
+import threading
+import time
+from collections import Counter
+from contextlib import asynccontextmanager, contextmanager
+from typing import Optional
+
+# Responses this small say nothing about how loaded Savant is
+MIN_LATENCY_SAMPLE_BYTES = 256 * 1024
+
+CONGESTION_STATUSES = {429, 500, 502, 503, 504}
+
+
+def decorrelated_jitter(previous: float, base: float, cap: float, rng=random) -> float:
+    """
+    Next retry delay using "decorrelated jitter": uniform between base and three
+    times the previous delay, capped. Workers that failed together spread their
+    retries out instead of hitting the server again at the same moment.
+
+    Args:
+        previous (float): Delay used for the previous attempt (base for the first retry).
+        base (float): Smallest delay in seconds.
+        cap (float): Largest delay in seconds.
+
+    Returns:
+        float: Seconds to sleep before the next attempt.
+    """
+    return min(cap, rng.uniform(base, max(base, previous * 3)))
+
+
+def retry_after_seconds(headers) -> Optional[float]:
+    """Seconds from a Retry-After header given in seconds, or None."""
+    value = (headers or {}).get("Retry-After")
+    try:
+        return max(0.0, float(value)) if value is not None else None
+    except (TypeError, ValueError):
+        return None
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket shared by every worker.
+
+    reserve() takes a token and returns how long the caller has to wait for it,
+    so threads can sleep() and coroutines can asyncio.sleep() on the same bucket.
+    Tokens may go negative: each caller queues behind the earlier reservations.
+    """
+
+    def __init__(self, rate_per_sec: float, burst: int = 1):
+        if rate_per_sec <= 0:
+            raise ValueError("rate_per_sec must be positive")
+        self.rate = float(rate_per_sec)
+        self.burst = max(1, int(burst))
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Take one token and return the seconds to wait before using it."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            return 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+
+
+class AdaptiveThrottle:
+    """
+    AIMD concurrency limit plus an optional shared request rate for the fetch engines.
+
+    At most `limit` requests are in flight: every request, retries included,
+    holds a slot() while it talks to Savant. Every healthy response
+    adds 1/limit to the limit (about one more slot per round of requests), as
+    long as Savant's time per MB stays within latency_tolerance of the best seen.
+    A 429, 5xx, timeout or dropped connection multiplies the limit by decrease,
+    at most once per typical request duration, because every request sent at the
+    old limit tends to fail together.
+
+    One throttle is shared by every league in a run, so its limit is the run's
+    global worker budget; endpoint_limits additionally caps the slots a single
+    endpoint (base URL) may hold.
+
+    Usage:
+        throttle = AdaptiveThrottle(initial=4, max_limit=16, rate_per_sec=2)
+        sleep(throttle.reserve())
+        with throttle.slot():
+            ... request ...
+        throttle.on_success(seconds, len(content))  # or throttle.on_congestion()
+    """
+
+    def __init__(self, initial: int = 4, min_limit: int = 1, max_limit: int = 16, adaptive: bool = True,
+                 rate_per_sec: Optional[float] = None, burst: int = 4, decrease: float = 0.5,
+                 latency_tolerance: float = 2.0, endpoint_limits: Optional[dict] = None):
+        """
+        Args:
+            initial (int): Starting in-flight limit.
+            min_limit (int): The limit never drops below this.
+            max_limit (int): The limit never rises above this; engines size their pools to it.
+            adaptive (bool): When False the limit stays at initial and only the
+                rate limit applies.
+            rate_per_sec (float, optional): Requests per second shared by every worker.
+            burst (int): Requests allowed back to back before the rate applies.
+            decrease (float): Factor applied to the limit on congestion.
+            latency_tolerance (float): Seconds per MB above this multiple of the
+                best observed stop the limit from growing.
+            endpoint_limits (dict, optional): base URL -> most slots that endpoint may hold.
+        """
+        self.min_limit = max(1, int(min_limit))
+        self.max_limit = max(self.min_limit, int(max_limit))
+        self.adaptive = adaptive
+        self.decrease = decrease
+        self.latency_tolerance = latency_tolerance
+        self.bucket = TokenBucket(rate_per_sec, burst) if rate_per_sec else None
+        self._limit = float(min(self.max_limit, max(self.min_limit, initial)))
+        self._best_seconds_per_mb = None
+        self._typical_seconds = 1.0
+        self._last_decrease = 0.0
+        self._lock = threading.Lock()
+        self._slots_free = threading.Condition(self._lock)
+        self._in_use = 0
+        self._in_use_by = Counter()
+        self.endpoint_limits = {url: int(n) for url, n in (endpoint_limits or {}).items() if n}
+        self.low_water = self.high_water = self.limit
+
+    @property
+    def limit(self) -> int:
+        """Requests the engines may keep in flight right now."""
+        return int(self._limit)
+
+    def reserve(self) -> float:
+        """Seconds to wait before the next request under the shared rate limit."""
+        return self.bucket.reserve() if self.bucket else 0.0
+
+    def limit_for(self, endpoint: Optional[str] = None) -> int:
+        """Requests one endpoint may keep in flight right now."""
+        return min(self.limit, self.endpoint_limits.get(endpoint, self.limit))
+
+    def _try_acquire(self, endpoint) -> bool:
+        if self._in_use < self.limit and self._in_use_by[endpoint] < self.endpoint_limits.get(endpoint, self.limit):
+            self._in_use += 1
+            self._in_use_by[endpoint] += 1
+            return True
+        return False
+
+    def _release(self, endpoint):
+        with self._lock:
+            self._in_use -= 1
+            self._in_use_by[endpoint] -= 1
+            self._slots_free.notify_all()
+
+    @contextmanager
+    def slot(self, endpoint: Optional[str] = None):
+        """Hold one of the `limit` request slots, waiting for one to free up."""
+        with self._lock:
+            self._slots_free.wait_for(lambda: self._try_acquire(endpoint))
+        try:
+            yield
+        finally:
+            self._release(endpoint)
+
+    @asynccontextmanager
+    async def async_slot(self, endpoint: Optional[str] = None, poll_seconds: float = 0.05):
+        """slot() for coroutines; polls so the event loop is never blocked."""
+        while True:
+            with self._lock:
+                if self._try_acquire(endpoint):
+                    break
+            await asyncio.sleep(poll_seconds)
+        try:
+            yield
+        finally:
+            self._release(endpoint)
+
+    def on_success(self, seconds: float, nbytes: int):
+        """Record a healthy response and grow the limit if latency allows."""
+        if not self.adaptive:
+            return
+        with self._lock:
+            self._typical_seconds = 0.8 * self._typical_seconds + 0.2 * seconds
+            if nbytes >= MIN_LATENCY_SAMPLE_BYTES:
+                seconds_per_mb = seconds / (nbytes / 1024 ** 2)
+                best = self._best_seconds_per_mb
+                self._best_seconds_per_mb = seconds_per_mb if best is None else min(best, seconds_per_mb)
+                if best is not None and seconds_per_mb > best * self.latency_tolerance:
+                    return
+            self._set_limit(min(self.max_limit, self._limit + 1 / self._limit), "latency is healthy")
+            self._slots_free.notify_all()
+
+    def on_congestion(self, reason: str = "throttled"):
+        """Cut the limit after a 429, 5xx, timeout or dropped connection."""
+        if not self.adaptive:
+            return
+        with self._lock:
+            now = time.monotonic()
+            if now - self._last_decrease < self._typical_seconds:
+                return
+            self._last_decrease = now
+            self._set_limit(max(self.min_limit, self._limit * self.decrease), reason)
+
+    def _set_limit(self, value: float, reason: str):
+        before = self.limit
+        self._limit = value
+        if self.limit != before:
+            self.low_water = min(self.low_water, self.limit)
+            self.high_water = max(self.high_water, self.limit)
+            log = logging.info if self.limit < before else logging.debug
+            log(f"🚦 Concurrency {before} → {self.limit} ({reason})")
+
+    @staticmethod
+    def is_congestion(status: Optional[int] = None, timeout: bool = False) -> bool:
+        """True for responses that mean Savant is overloaded rather than the request being wrong."""
+        return timeout or status in CONGESTION_STATUSES
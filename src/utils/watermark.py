@@ -0,0 +1,77 @@
+import datetime
+import json
+import os
+import threading
+from typing import Optional
+
+from google.cloud import bigquery
+
+from src.utils.bq_client import TABLE_METADATA
+
+
+def read_table_watermark(client: bigquery.Client, table_ref: str) -> Optional[datetime.date]:
+    """
+    Return max(game_date) from a BigQuery table, or None if the table is missing or empty.
+    """
+    if not TABLE_METADATA.exists(client, table_ref):
+        return None
+
+    rows = list(client.query(f"SELECT MAX(game_date) AS watermark FROM `{table_ref}`").result())
+    watermark = rows[0]["watermark"] if rows else None
+    if isinstance(watermark, datetime.datetime):
+        watermark = watermark.date()
+    elif isinstance(watermark, str):
+        watermark = datetime.datetime.strptime(watermark[:10], "%Y-%m-%d").date()
+    return watermark
+
+
+class WatermarkState:
+    """
+    Local JSON record of the newest game_date loaded per league.
+
+    Layout:
+        {"mlb": "2025-07-01", "milb": "2025-06-30"}
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._state = {}
+        if os.path.exists(path):
+            with open(path, "r", encoding="utf-8") as f:
+                self._state = json.load(f)
+
+    def get(self, league: str) -> Optional[datetime.date]:
+        value = self._state.get(league)
+        return datetime.datetime.strptime(value, "%Y-%m-%d").date() if value else None
+
+    def set(self, league: str, watermark: datetime.date):
+        """Advance a league's watermark and persist the file atomically."""
+        with self._lock:
+            current = self.get(league)
+            if current and current >= watermark:
+                return
+            self._state[league] = watermark.strftime("%Y-%m-%d")
+
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            tmp_path = self.path + ".tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(self._state, f, indent=2, sort_keys=True)
+            os.replace(tmp_path, self.path)
+
+
+def incremental_start(start_date: datetime.date, end_date: datetime.date,
+                      watermark: Optional[datetime.date], lookback_days: int) -> Optional[datetime.date]:
+    """
+    Pick where an incremental run should begin.
+
+    Starts lookback_days before the watermark so late Savant corrections are
+    picked up, but never before start_date. Returns None when there is nothing
+    to fetch.
+    """
+    if watermark is None:
+        return start_date
+    start = max(start_date, watermark - datetime.timedelta(days=lookback_days))
+    return start if start <= end_date else None
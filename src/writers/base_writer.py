@@ -5,4 +5,8 @@ import pandas as pd
 class DataWriter(ABC):
     @abstractmethod
     def write(self, df: pd.DataFrame, file_name: str):
-        pass
\ No newline at end of file
+        pass
+
+    def flush(self, *args, **kwargs):
+        """Write out anything buffered. Unbuffered writers have nothing to do."""
+        pass
@@ -0,0 +1,136 @@
+# writers/batching_writer.py
+import logging
+import threading
+import time
+import pandas as pd
+from src.writers.base_writer import DataWriter
+
+
+class BatchingBQWriter(DataWriter):
+    """
+    Buffers cleaned chunks in front of a BQWriter and loads them as one job.
+
+    Chunks are held per league until the buffer reaches max_rows rows or about
+    max_bytes bytes (each chunk's response size, or its shallow memory usage),
+    or has been open for max_seconds. The age limit runs on a timer, so a
+    half-full batch is loaded even while the fetches behind it are stalled.
+    flush() loads whatever is left and must be called at the end of a run.
+
+    Usage:
+        writer = BatchingBQWriter(BQWriter(...), max_rows=250_000)
+        writer.write(df_chunk, "mlb", schema_fields, truncate_table)
+        ...
+        writer.flush()
+    """
+
+    def __init__(self, writer, max_rows: int = 250_000, max_bytes: int = 100 * 1024 ** 2,
+                 max_seconds: float = 300):
+        self.writer = writer
+        self.max_rows = max_rows
+        self.max_bytes = max_bytes
+        self.max_seconds = max_seconds
+        self._lock = threading.Lock()
+        self._loads_done = threading.Condition(self._lock)
+        self._loading = {}
+        self._buffers = {}
+        self.jobs = 0
+
+    @property
+    def write_mode(self) -> str:
+        return self.writer.write_mode
+
+    def table_id(self, league: str) -> str:
+        return self.writer.table_id(league)
+
+    def replace_from(self, league: str, start_date):
+        self.writer.replace_from(league, start_date)
+
+    def start_run(self):
+        self.writer.start_run()
+
+    def write(self, df: pd.DataFrame, league: str, schema_fields: list, truncate_table: bool = False,
+              on_loaded=None):
+        """
+        Buffer a chunk, loading the league's batch if a target has been reached.
+
+        on_loaded, if given, is called with the batch's load job IDs once the
+        load containing this chunk succeeds.
+        """
+        if df.empty:
+            if on_loaded:
+                on_loaded([])
+            return
+
+        with self._lock:
+            buffer = self._buffers.get(league)
+            if buffer is None:
+                buffer = self._buffers[league] = {
+                    "frames": [], "rows": 0, "bytes": 0, "started": time.monotonic(),
+                    "truncate": truncate_table, "schema": schema_fields, "callbacks": [], "timer": None,
+                }
+                if self.max_seconds > 0:
+                    buffer["timer"] = threading.Timer(self.max_seconds, self._flush_expired, (league, buffer))
+                    buffer["timer"].daemon = True
+                    buffer["timer"].start()
+            buffer["frames"].append(df)
+            if on_loaded:
+                buffer["callbacks"].append(on_loaded)
+            buffer["rows"] += len(df)
+            buffer["bytes"] += df.attrs.get("response_bytes") or int(df.memory_usage(deep=False).sum())
+            buffer["schema"] = schema_fields
+
+            ready = (buffer["rows"] >= self.max_rows
+                     or buffer["bytes"] >= self.max_bytes
+                     or time.monotonic() - buffer["started"] >= self.max_seconds)
+            batch = self._take(league) if ready else None
+
+        if batch:
+            self._load(league, batch)
+
+    def _take(self, league: str) -> dict:
+        """Remove a league's batch from the buffers (caller holds the lock) and stop its timer."""
+        batch = self._buffers.pop(league)
+        if batch["timer"] is not None:
+            batch["timer"].cancel()
+        self._loading[league] = self._loading.get(league, 0) + 1
+        return batch
+
+    def _flush_expired(self, league: str, buffer: dict):
+        """Timer callback: load the batch if it is still the one the timer was started for."""
+        with self._lock:
+            batch = self._take(league) if self._buffers.get(league) is buffer else None
+        if batch:
+            logging.debug(f"⏰ {league} batch reached {self.max_seconds}s; loading it")
+            self._load(league, batch)
+
+    def flush(self, league: str = None):
+        """
+        Load buffered chunks for one league, or for every league when league is None,
+        and wait for loads other threads (e.g. the age timer) already started.
+        """
+        with self._lock:
+            leagues = [league] if league else list(self._buffers)
+            batches = [(name, self._take(name)) for name in leagues if name in self._buffers]
+
+        for name, batch in batches:
+            self._load(name, batch)
+
+        with self._lock:
+            self._loads_done.wait_for(lambda: not any(self._loading.get(name) for name in
+                                                      ([league] if league else list(self._loading))))
+
+    def _load(self, league: str, batch: dict):
+        frames = batch["frames"]
+        df = frames[0] if len(frames) == 1 else pd.concat(frames, ignore_index=True)
+        logging.debug(f"📦 Loading batch of {len(frames)} chunks ({batch['rows']} rows, "
+                      f"{batch['bytes'] / 1024 ** 2:.1f} MB) for {league}")
+        try:
+            job_ids = self.writer.write(df, league, batch["schema"], batch["truncate"])
+            self.jobs += 1
+            if job_ids is not None:
+                for on_loaded in batch["callbacks"]:
+                    on_loaded(job_ids)
+        finally:
+            with self._lock:
+                self._loading[league] -= 1
+                self._loads_done.notify_all()
@@ -1,6 +1,8 @@
 import logging
 import threading
-from src.utils.bq_schema_helper import align_df_to_bq_schema
+import time
+from src.utils.bq_schema_helper import df_to_parquet_buffer
+from src.utils.bq_client import get_bigquery_client, TABLE_METADATA
 from src.writers.base_writer import DataWriter
 from google.cloud import bigquery
 from google.api_core.exceptions import (
@@ -15,21 +17,95 @@ import numpy as np
 
 class BQWriter(DataWriter):
 
-    _lock = threading.Lock()
-    _first_write_done = False
+    LOAD_FORMATS = ("json", "parquet")
+    WRITE_MODES = ("truncate", "append", "partition")
 
-    def __init__(self, project_id: str, dataset_id: str, table_prefix: str):
-        self.client = bigquery.Client(project=project_id)
+    def __init__(self, project_id: str, dataset_id: str, table_prefix: str, load_format: str = "json",
+                 write_mode: str = "truncate", metrics=None):
+        """
+        Args:
+            load_format (str): "json" sends rows through load_table_from_json;
+                "parquet" ships each chunk as a Parquet buffer typed from the schema.
+            write_mode (str): "truncate" replaces the table on the first write;
+                "append" never truncates and only deletes rows registered with
+                replace_from() before the league's first load; "partition"
+                overwrites only the game_date partitions present in each write.
+            metrics (RunMetrics, optional): Records each load job's duration under
+                "bq_load" plus job, failure and row counts.
+        """
+        if load_format not in self.LOAD_FORMATS:
+            raise ValueError(f"load_format must be one of {self.LOAD_FORMATS}")
+        if write_mode not in self.WRITE_MODES:
+            raise ValueError(f"write_mode must be one of {self.WRITE_MODES}")
+
+        self.client = get_bigquery_client(project_id)
         self.dataset_id = dataset_id
         self.table_prefix = table_prefix
+        self.load_format = load_format
+        self.write_mode = write_mode
+        self._replace_from = {}
+        self._append_ready = {}
+        self._append_lock = threading.Lock()
+        # table_id -> Event set once that table's truncating load has finished
+        self._first_writes = {}
+        self._first_lock = threading.Lock()
+        self.metrics = metrics
+
+    def start_run(self):
+        """
+        Forget the previous run's first writes and pending deletes, so a writer reused
+        in a warm process truncates (or deletes before appending) again.
+        """
+        with self._first_lock:
+            self._first_writes.clear()
+        with self._append_lock:
+            self._append_ready.clear()
+            self._replace_from.clear()
+
+    def table_id(self, league: str) -> str:
+        """Fully qualified table for a league, e.g. crzzpy.test.statcast_2025_mlb."""
+        current_year = datetime.now().year
+        return f"{self.client.project}.{self.dataset_id}.{self.table_prefix}_{current_year}_{league}"
+
+    def replace_from(self, league: str, start_date):
+        """
+        In append mode, delete the league's rows with game_date >= start_date
+        right before its first load, so re-fetched days aren't duplicated.
+        """
+        self._replace_from[league] = start_date
+
+    def _prepare_append(self, league: str, table_id: str):
+        """Run the league's pending delete once; other writers wait until it is done."""
+        with self._append_lock:
+            ready = self._append_ready.get(league)
+            owner = ready is None
+            if owner:
+                ready = threading.Event()
+                self._append_ready[league] = ready
+
+        if not owner:
+            ready.wait()
+            return
 
-    def _truncate_table(self, table_id: str):
         try:
-            self.client.get_table(table_id)  # Check if table exists
-            logging.debug(f"Table {table_id} does exist.", exc_info=True)
-        except NotFound:
-            logging.debug(f"Table {table_id} does not exist, skipping truncate.", exc_info=True)
+            start_date = self._replace_from.get(league)
+            if start_date is not None and TABLE_METADATA.exists(self.client, table_id):
+                logging.info(f"Deleting rows from {table_id} with game_date >= {start_date} before appending")
+                job = self.client.query(
+                    f"DELETE FROM `{table_id}` WHERE game_date >= @start_date",
+                    job_config=bigquery.QueryJobConfig(query_parameters=[
+                        bigquery.ScalarQueryParameter("start_date", "DATE", start_date),
+                    ]),
+                )
+                job.result()
+        finally:
+            ready.set()
+
+    def _truncate_table(self, table_id: str):
+        if not TABLE_METADATA.exists(self.client, table_id):  # Check if table exists
+            logging.debug(f"Table {table_id} does not exist, skipping truncate.")
             return
+        logging.debug(f"Table {table_id} does exist.")
         
         logging.info(f"Manually truncating BigQuery table {table_id}")
         query = f"TRUNCATE TABLE `{table_id}`"
@@ -37,29 +113,116 @@ class BQWriter(DataWriter):
         job.result()  # Wait for completion
         logging.info(f"Table {table_id} truncated successfully")    
 
-    def write(self, df: pd.DataFrame, league: str, schema_fields: list, truncate_table: bool = False):
+    def _load_json(self, df: pd.DataFrame, table_id: str, bq_config: bigquery.LoadJobConfig):
+        """
+        Start a load job from a list of row dicts.
+
+        Rows are sent as cleaned; the compiled ConversionPlan (and its coercion
+        counts) only applies to Parquet loads, and BigQuery coerces JSON values itself.
+        """
+
+        #print("🔎 Debugging `game_date` column:")
+        #print(df["game_date"].dtype)
+        #
+        # 
+        # 
+        # print(df["game_date"].unique()[:10])  # peek at first 10 unique values    
+
+        # Align df to table schema
+        #df_aligned = align_df_to_bq_schema(df, schema_fields)
+
+        # ✅ Convert DataFrame to list of dictionary records
+        #rows = df_aligned.to_dict(orient="records")
+        # Cleaned chunks keep NaN / <NA> for nulls; JSON needs None
+        rows = df.astype(object).where(df.notna(), None).to_dict(orient="records")
+
+
+        #+++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+        logging.debug(f"After call to df.to_dict")
+        # Get all game_date values into a list
+        game_dates = [row.get("game_date") for row in rows]
+
+        # Print the first 10
+        logging.debug(game_dates[:10])                
+
+        #+++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+        # Load from list of dicts using load_table_from_json
+        logging.debug(f"Loading BigQuery table - load_table_from_json(): {table_id}")
+        #print(df_aligned.dtypes)
+        return self.client.load_table_from_json(rows, table_id, job_config=bq_config)
+
+    def _load_parquet(self, df: pd.DataFrame, table_id: str, schema_fields: list,
+                      bq_config: bigquery.LoadJobConfig):
+        """Start a load job from a Parquet buffer typed from schema_fields."""
+        buffer = df_to_parquet_buffer(df, schema_fields)
+        logging.debug(f"Loading BigQuery table - load_table_from_file(): {table_id} "
+                      f"({buffer.getbuffer().nbytes / 1024:.0f} KB parquet)")
+
+        bq_config.source_format = bigquery.SourceFormat.PARQUET
+        bq_config.schema = schema_fields
+        return self.client.load_table_from_file(buffer, table_id, job_config=bq_config, rewind=True)
+
+    def write(self, df: pd.DataFrame, league: str, schema_fields: list, truncate_table: bool = False,
+              on_loaded=None):
         """
         Upload the entire DataFrame to BigQuery.
         If truncate_table=True, truncates the table; otherwise, appends data.
+        In "append" write mode the table is never truncated.
 
         Only one thread will ever get WRITE_TRUNCATE.
         All others automatically switch to WRITE_APPEND, even if they were called with truncate_table=True.
         Works in parallel ThreadPoolExecutor or multi-threaded scenarios.
+
+        Args:
+            on_loaded (callable, optional): Called with the list of load job IDs
+                once the rows are in the table. Not called when the load fails.
+
+        Returns:
+            list | None: Load job IDs, or None when the load failed.
         """
 
         logging.debug(f"Writing data to  BigQuery table") 
 
-        current_year = datetime.now().year
-        table_name = f"{self.table_prefix}_{current_year}_{league}"
-        table_id = f"{self.client.project}.{self.dataset_id}.{table_name}"
-        
-        # Ensure truncate happens only once
-        with BQWriter._lock:
-            if not BQWriter._first_write_done:
-                do_truncate  = True
-                BQWriter._first_write_done = True
-            else:
-                do_truncate  = False
+        table_id = self.table_id(league)
+
+        if self.write_mode == "append":
+            self._prepare_append(league, table_id)
+            job_ids = self._write(df, table_id, schema_fields, False, False)
+        elif self.write_mode == "partition":
+            job_ids = self._write_partitions(df, table_id, schema_fields)
+        else:
+            job_ids = self._write_first_truncating(df, table_id, schema_fields, truncate_table)
+
+        if job_ids is not None and on_loaded:
+            on_loaded(job_ids)
+        return job_ids
+
+    def _write_first_truncating(self, df: pd.DataFrame, table_id: str, schema_fields: list, truncate_table: bool):
+        """
+        Truncate mode: the first write to each table in the run (see start_run)
+        replaces it, later writes append. Leagues are fetched concurrently, so this
+        is tracked per table.
+        """
+
+        # Ensure truncate happens only once per table
+        with self._first_lock:
+            first_write_complete = self._first_writes.get(table_id)
+            do_truncate = first_write_complete is None
+            if do_truncate:
+                first_write_complete = self._first_writes[table_id] = threading.Event()
+
+        if do_truncate:
+            try:
+                return self._write(df, table_id, schema_fields, truncate_table, do_truncate)
+            finally:
+                first_write_complete.set()
+        else:
+            # Appends running on other threads must not land before the truncating load
+            first_write_complete.wait()
+            return self._write(df, table_id, schema_fields, truncate_table, do_truncate)
+
+    def _write(self, df: pd.DataFrame, table_id: str, schema_fields: list, truncate_table: bool, do_truncate: bool):
 
         if df.empty:
             if do_truncate:
@@ -67,7 +230,7 @@ class BQWriter(DataWriter):
                 self._truncate_table(table_id)
             else:
                 logging.warning(f"Empty DataFrame with no truncate for table {table_id}; skipping upload.")
-            return
+            return []
        
         # For non-empty DF, use WRITE_TRUNCATE on first write, else append
         write_disposition = (
@@ -86,50 +249,126 @@ class BQWriter(DataWriter):
 
         #load_job = self.client.load_table_from_dataframe(df, table_id, job_config=bq_config)
         load_job = None
+        load_start = time.perf_counter()
         try:
             
-            #print("🔎 Debugging `game_date` column:")
-            #print(df["game_date"].dtype)
-            #
-            # 
-            # 
-            # print(df["game_date"].unique()[:10])  # peek at first 10 unique values    
+            if self.load_format == "parquet":
+                load_job = self._load_parquet(df, table_id, schema_fields, bq_config)
+            else:
+                load_job = self._load_json(df, table_id, bq_config)
 
-            # Align df to table schema
-            #df_aligned = align_df_to_bq_schema(df, schema_fields)
+            load_job.result()  # Wait for completion
 
-            # ✅ Convert DataFrame to list of dictionary records
-            #rows = df_aligned.to_dict(orient="records")
-            rows = df.to_dict(orient="records")
+        except (NotFound, Conflict, BadRequest, Forbidden) as e:
+            logging.error(f"Known BigQuery error: {e}", exc_info=True)
+            self._record_load(load_start, None)
+            return None
+        except (ServiceUnavailable, InternalServerError, DeadlineExceeded) as e:
+            logging.error(f"Transient error – consider retrying: {e}", exc_info=True)
+            self._record_load(load_start, None)
+            return None
+        except Exception as e:
+            logging.error(f"Unexpected error: {e}", exc_info=True)
+            self._record_load(load_start, None)
+            return None
+        finally:
+            if load_job:
+                logging.debug(f"Load job ID: {load_job.job_id}")
+            else:
+                logging.debug("No load_job was created; skipping job ID log")
+        
+        logging.debug(f"Upload complete to BigQuery: {len(df)} rows to {table_id}")
+        self._record_load(load_start, len(df))
+        return [load_job.job_id]
+
+    def _record_load(self, load_start: float, rows, jobs: int = 1):
+        """Record a load's duration; rows is None when it failed."""
+        if self.metrics is None:
+            return
+        self.metrics.observe("bq_load", time.perf_counter() - load_start)
+        if rows is None:
+            self.metrics.add("bq_load_failures")
+        else:
+            self.metrics.add("bq_load_jobs", jobs)
+            self.metrics.add("bq_rows_loaded", rows)
+
+    def _delete_dates(self, table_id: str, game_dates: list):
+        """Delete every row whose game_date is in game_dates."""
+        job = self.client.query(
+            f"DELETE FROM `{table_id}` WHERE game_date IN UNNEST(@game_dates)",
+            job_config=bigquery.QueryJobConfig(query_parameters=[
+                bigquery.ArrayQueryParameter("game_dates", "DATE", game_dates),
+            ]),
+        )
+        job.result()
 
+    def _write_partitions(self, df: pd.DataFrame, table_id: str, schema_fields: list):
+        """
+        Overwrite only the game_date partitions present in df.
 
-            #+++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
-            logging.debug(f"After call to df.to_dict")
-            # Get all game_date values into a list
-            game_dates = [row.get("game_date") for row in rows]
+        Each date is loaded with WRITE_TRUNCATE into its partition decorator
+        (table$YYYYMMDD), so re-running a date range replaces exactly those days
+        and is safe to repeat. Tables created before partitioning fall back to a
+        DELETE of those dates followed by an append.
+        """
+        if df.empty:
+            return []
 
-            # Print the first 10
-            logging.debug(game_dates[:10])                
+        table = TABLE_METADATA.get(self.client, table_id)
+        if table is None:
+            logging.error(f"Table {table_id} does not exist; cannot overwrite partitions.")
+            return None
 
-            #+++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+        missing_date = df["game_date"].isna()
+        if missing_date.any():
+            logging.warning(f"Skipping {int(missing_date.sum())} rows without game_date for {table_id}")
+            df = df[~missing_date]
 
-            # Load from list of dicts using load_table_from_json
-            logging.debug(f"Loading BigQuery table - load_table_from_json(): {table_id}")
-            #print(df_aligned.dtypes)
-            load_job = self.client.load_table_from_json(rows, table_id, job_config=bq_config)
+        game_dates = sorted(df["game_date"].astype(str).unique())
 
-            load_job.result()  # Wait for completion
+        if not table.time_partitioning or table.time_partitioning.field != "game_date":
+            logging.warning(f"Table {table_id} is not partitioned on game_date; replacing "
+                            f"{len(game_dates)} dates with DELETE + append. Recreate it to get partition overwrites.")
+            try:
+                self._delete_dates(table_id, game_dates)
+            except Exception as e:
+                logging.error(f"Unexpected error: {e}", exc_info=True)
+                return None
+            return self._write(df, table_id, schema_fields, False, False)
+
+        load_jobs = []
+        load_start = time.perf_counter()
+        try:
+            # Start every partition load before waiting so they run concurrently
+            for game_date, part in df.groupby(df["game_date"].astype(str), sort=True):
+                partition_id = f"{table_id}${game_date.replace('-', '')}"
+                bq_config = bigquery.LoadJobConfig(
+                    write_disposition=bigquery.WriteDisposition.WRITE_TRUNCATE,
+                    autodetect=False,
+                )
+                if self.load_format == "parquet":
+                    load_jobs.append(self._load_parquet(part, partition_id, schema_fields, bq_config))
+                else:
+                    load_jobs.append(self._load_json(part, partition_id, bq_config))
+
+            for load_job in load_jobs:
+                load_job.result()
 
         except (NotFound, Conflict, BadRequest, Forbidden) as e:
             logging.error(f"Known BigQuery error: {e}", exc_info=True)
+            self._record_load(load_start, None)
+            return None
         except (ServiceUnavailable, InternalServerError, DeadlineExceeded) as e:
             logging.error(f"Transient error – consider retrying: {e}", exc_info=True)
+            self._record_load(load_start, None)
+            return None
         except Exception as e:
             logging.error(f"Unexpected error: {e}", exc_info=True)
+            self._record_load(load_start, None)
+            return None
         finally:
-            if load_job:
-                logging.debug(f"Load job ID: {load_job.job_id}")
-            else:
-                logging.debug("No load_job was created; skipping job ID log")
-        
-        logging.debug(f"Upload complete to BigQuery: {len(df)} rows to {table_id}")
\ No newline at end of file
+            logging.debug(f"Load job IDs: {[load_job.job_id for load_job in load_jobs]}")
+
+        logging.debug(f"Overwrote {len(load_jobs)} partitions ({game_dates[0]} to {game_dates[-1]}) of {table_id}")
+        self._record_load(load_start, len(df), jobs=len(load_jobs))
+        return [load_job.job_id for load_job in load_jobs]
@@ -1,31 +1,129 @@
 # writers/csv_writer.py
 from src.writers.base_writer import DataWriter
-import csv
-from tqdm import tqdm
+import threading
 import pandas as pd
 import os
 import logging
 
+try:
+    import zstandard  # noqa: F401
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+
+
 class CSVWriter(DataWriter):
+    """
+    Writes whole chunks to CSV with one vectorized to_csv call each.
+
+    shard="chunk" writes every chunk to its own file (statcast_mlb_2024-04-01_2024-04-05.csv),
+    so any number of write workers can run without coordination. shard="league"
+    appends every chunk of a league to one file. Either way rows go to a .part
+    file that is renamed into place only when it is complete: right after the
+    chunk, or on flush() for league files. Compressed output appends one gzip
+    member or zstd frame per chunk, which standard readers decode as one stream.
+
+    Usage:
+        writer = CSVWriter("csv_data", compression="gzip", shard="league")
+        writer.write(df_chunk, "statcast_mlb.csv", "2024-04-01", "2024-04-05")
+        ...
+        writer.flush("statcast_mlb.csv")
+    """
+
+    COMPRESSIONS = (None, "gzip", "zstd")
+    SHARDS = ("chunk", "league")
+    _EXTENSIONS = {None: "", "gzip": ".gz", "zstd": ".zst"}
+
+    def __init__(self, output_dir="csv_data", compression=None, shard="chunk"):
+        if compression not in self.COMPRESSIONS:
+            raise ValueError(f"compression must be one of {self.COMPRESSIONS}")
+        if shard not in self.SHARDS:
+            raise ValueError(f"shard must be one of {self.SHARDS}")
+        if compression == "zstd" and not ZSTD_AVAILABLE:
+            raise ImportError("zstd compression requires the 'zstandard' package")
 
-    def __init__(self, output_dir="csv_data"):
         self.output_dir = output_dir
+        self.compression = compression
+        self.shard = shard
+        self._locks = {}
+        self._locks_lock = threading.Lock()
+        self._open_files = {}
         os.makedirs(self.output_dir, exist_ok=True)
         logging.debug(f"CSVWriter output directory set to: {self.output_dir}")
 
-    def open(self, file_name: str, append=False):
-        """Open CSV file for writing/appending, return (file_handle, csv_writer, header_needed)."""
-        file_path = os.path.join(self.output_dir, file_name)
-        mode = 'a' if append and os.path.exists(file_path) else 'w'
-        f = open(file_path, mode=mode, newline='', encoding='utf-8')
-        writer = csv.writer(f)
-        header_needed = (mode == 'w')
-        return f, writer, header_needed    
-
-    def write(self, csv_writer, df: pd.DataFrame, header_needed: bool = False):
-        """Write DataFrame rows to CSV file."""
-        if header_needed:
-            csv_writer.writerow(df.columns)
-        for row in tqdm(df.itertuples(index=False, name=None),
-                        total=len(df), desc="Saving to CSV", unit="row"):
-            csv_writer.writerow(row)
+    def path(self, file_name: str, start_date: str = None, end_date: str = None) -> str:
+        """Final path of a league file, or of one chunk's shard when dates are given in chunk mode."""
+        if self.shard == "chunk" and start_date and end_date:
+            stem, ext = os.path.splitext(file_name)
+            file_name = f"{stem}_{start_date}_{end_date}{ext or '.csv'}"
+        return os.path.join(self.output_dir, file_name + self._EXTENSIONS[self.compression])
+
+    def _lock_for(self, path: str) -> threading.Lock:
+        with self._locks_lock:
+            return self._locks.setdefault(path, threading.Lock())
+
+    def _append(self, df: pd.DataFrame, part_path: str, header: bool, mode: str = "a"):
+        df.to_csv(part_path, mode=mode, header=header, index=False,
+                  compression={"method": self.compression} if self.compression else None)
+
+    def write(self, df: pd.DataFrame, file_name: str, start_date: str = None, end_date: str = None,
+              on_loaded=None):
+        """
+        Write one chunk.
+
+        Args:
+            df (pd.DataFrame): Cleaned chunk.
+            file_name (str): League file name, e.g. "statcast_mlb.csv".
+            start_date (str): Chunk window start, used to name chunk shards.
+            end_date (str): Chunk window end.
+            on_loaded (callable, optional): Called with an empty list once the
+                rows are in a renamed, complete file.
+        """
+        if df.empty:
+            if on_loaded:
+                on_loaded([])
+            return
+
+        final_path = self.path(file_name, start_date, end_date)
+        part_path = final_path + ".part"
+
+        if self.shard == "chunk" and start_date and end_date:
+            # "w" discards any part left behind by an interrupted run
+            self._append(df, part_path, header=True, mode="w")
+            os.replace(part_path, final_path)
+            logging.debug(f"💾 Wrote {len(df)} rows to {final_path}")
+            if on_loaded:
+                on_loaded([])
+            return
+
+        with self._lock_for(final_path):
+            entry = self._open_files.get(final_path)
+            if entry is None:
+                if os.path.exists(part_path):
+                    os.remove(part_path)  # left behind by an interrupted run
+                entry = {"part": part_path, "callbacks": []}
+                self._open_files[final_path] = entry
+                header = True
+            else:
+                header = False
+            self._append(df, part_path, header=header)
+            if on_loaded:
+                entry["callbacks"].append(on_loaded)
+
+    def flush(self, file_name: str = None):
+        """Rename league files that are complete into place; every open file when file_name is None."""
+        with self._locks_lock:
+            if file_name is None:
+                paths = list(self._open_files)
+            else:
+                paths = [self.path(file_name)]
+
+        for final_path in paths:
+            with self._lock_for(final_path):
+                entry = self._open_files.pop(final_path, None)
+                if entry is None:
+                    continue
+                os.replace(entry["part"], final_path)
+                logging.info(f"💾 Saved {final_path}")
+            for on_loaded in entry["callbacks"]:
+                on_loaded([])
@@ -0,0 +1,138 @@
+# writers/parquet_writer.py
+import glob
+import logging
+import os
+import threading
+import uuid
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+from google.cloud import bigquery
+from src.config.config import KNOWN_COLUMN_TYPES
+from src.utils.bq_schema_helper import df_to_arrow_table
+from src.writers.base_writer import DataWriter
+
+
+class ParquetWriter(DataWriter):
+    """
+    Writes typed, compressed Parquet files into a hive-style dataset:
+
+        parquet_data/league=mlb/game_date=2024-04-01/part-<id>.parquet
+
+    Column types come from column_types.yaml (unknown columns are strings).
+    league and game_date are encoded in the directory names and not stored in
+    the files, so readers such as pyarrow.dataset, DuckDB or Spark recover
+    them from the path. Each file is written under a hidden temporary name
+    and renamed into place, so readers never see a partial file.
+
+    In "replace" mode (the default) writing a day replaces whatever that
+    game_date partition held, so new days are appended and re-fetched days are
+    overwritten. In "append" mode files are added next to the existing ones;
+    compact() later merges a partition's files into one.
+
+    Usage:
+        writer = ParquetWriter("parquet_data")
+        writer.write(df_chunk, "mlb")
+        ...
+        writer.compact("mlb")
+    """
+
+    MODES = ("replace", "append")
+
+    def __init__(self, output_dir: str = "parquet_data", compression: str = "zstd", mode: str = "replace"):
+        if mode not in self.MODES:
+            raise ValueError(f"mode must be one of {self.MODES}")
+        self.output_dir = output_dir
+        self.compression = compression
+        self.mode = mode
+        self._lock = threading.Lock()
+        self._partition_locks = {}
+        os.makedirs(self.output_dir, exist_ok=True)
+        logging.debug(f"ParquetWriter output directory set to: {self.output_dir}")
+
+    @staticmethod
+    def schema_fields(columns) -> list:
+        """SchemaFields for the given columns, typed from column_types.yaml."""
+        return [bigquery.SchemaField(col, KNOWN_COLUMN_TYPES.get(col, "STRING")) for col in columns]
+
+    def partition_dir(self, league: str, game_date: str) -> str:
+        return os.path.join(self.output_dir, f"league={league}", f"game_date={game_date}")
+
+    def _partition_lock(self, path: str) -> threading.Lock:
+        with self._lock:
+            return self._partition_locks.setdefault(path, threading.Lock())
+
+    def _write_file(self, table: pa.Table, directory: str) -> str:
+        """Write table atomically as a new part file in directory and return its path."""
+        os.makedirs(directory, exist_ok=True)
+        name = f"part-{uuid.uuid4().hex}.parquet"
+        tmp_path = os.path.join(directory, f".{name}.tmp")
+        pq.write_table(table, tmp_path, compression=self.compression)
+        path = os.path.join(directory, name)
+        os.replace(tmp_path, path)
+        return path
+
+    def write(self, df: pd.DataFrame, league: str, on_loaded=None):
+        """
+        Write a chunk, one file per game_date it contains.
+
+        Args:
+            df (pd.DataFrame): Cleaned chunk with a game_date column.
+            league (str): "mlb" or "milb".
+            on_loaded (callable, optional): Called with an empty list once every
+                file is in place.
+        """
+        if df.empty:
+            if on_loaded:
+                on_loaded([])
+            return
+
+        game_dates = pd.to_datetime(df["game_date"], errors="coerce").dt.strftime("%Y-%m-%d")
+        missing_date = game_dates.isna()
+        if missing_date.any():
+            logging.warning(f"Skipping {int(missing_date.sum())} rows without game_date for {league} Parquet")
+
+        fields = self.schema_fields([col for col in df.columns if col != "game_date"])
+        for game_date, part in df.groupby(game_dates[~missing_date], sort=True):
+            directory = self.partition_dir(league, game_date)
+            table = df_to_arrow_table(part, fields)
+            with self._partition_lock(directory):
+                existing = glob.glob(os.path.join(directory, "*.parquet"))
+                self._write_file(table, directory)
+                if self.mode == "replace":
+                    for path in existing:
+                        os.remove(path)
+
+        logging.debug(f"💾 Wrote {len(df)} rows to Parquet for {league}")
+        if on_loaded:
+            on_loaded([])
+
+    def compact(self, league: str = None, min_files: int = 2) -> int:
+        """
+        Merge every partition holding at least min_files files into a single file.
+
+        Args:
+            league (str, optional): Only compact this league.
+            min_files (int): Partitions with fewer files are left alone.
+
+        Returns:
+            int: Number of partitions compacted.
+        """
+        league_glob = f"league={league}" if league else "league=*"
+        compacted = 0
+        for directory in sorted(glob.glob(os.path.join(self.output_dir, league_glob, "game_date=*"))):
+            with self._partition_lock(directory):
+                paths = sorted(glob.glob(os.path.join(directory, "*.parquet")))
+                if len(paths) < min_files:
+                    continue
+                tables = [pq.read_table(path) for path in paths]
+                merged = pa.concat_tables(tables, promote_options="permissive")
+                self._write_file(merged, directory)
+                for path in paths:
+                    os.remove(path)
+                compacted += 1
+                logging.debug(f"🗜️ Compacted {len(paths)} files ({merged.num_rows} rows) in {directory}")
+
+        if compacted:
+            logging.info(f"🗜️ Compacted {compacted} Parquet partitions under {self.output_dir}")
+        return compacted
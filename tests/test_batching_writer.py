@@ -0,0 +1,125 @@
+import unittest
+import time
+import pandas as pd
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.writers.batching_writer import BatchingBQWriter
+
+
+class RecordingWriter:
+    def __init__(self):
+        self.calls = []
+
+    def write(self, df, league, schema_fields, truncate_table=False):
+        self.calls.append((league, len(df), truncate_table))
+        return [f"job_{len(self.calls)}"]
+
+
+def _chunk(rows):
+    return pd.DataFrame({"pitch_type": ["FF"] * rows})
+
+
+class TestBatchingBQWriter(unittest.TestCase):
+
+    def test_buffers_until_row_target(self):
+        inner = RecordingWriter()
+        writer = BatchingBQWriter(inner, max_rows=10, max_seconds=3600)
+
+        writer.write(_chunk(4), "mlb", [], True)
+        writer.write(_chunk(4), "mlb", [], False)
+        self.assertEqual(inner.calls, [])
+
+        writer.write(_chunk(4), "mlb", [], False)
+        self.assertEqual(inner.calls, [("mlb", 12, True)])
+
+    def test_flush_loads_remainder_per_league(self):
+        inner = RecordingWriter()
+        writer = BatchingBQWriter(inner, max_rows=100, max_seconds=3600)
+
+        writer.write(_chunk(3), "mlb", [], True)
+        writer.write(_chunk(5), "milb", [], True)
+        writer.flush("mlb")
+        self.assertEqual(inner.calls, [("mlb", 3, True)])
+
+        writer.flush()
+        self.assertEqual(inner.calls, [("mlb", 3, True), ("milb", 5, True)])
+        writer.flush()
+        self.assertEqual(len(inner.calls), 2)
+
+    def test_time_limit_flushes(self):
+        inner = RecordingWriter()
+        writer = BatchingBQWriter(inner, max_rows=100, max_seconds=0)
+        writer.write(_chunk(2), "mlb", [], True)
+        self.assertEqual(inner.calls, [("mlb", 2, True)])
+
+    def test_age_limit_flushes_without_another_chunk(self):
+        inner = RecordingWriter()
+        writer = BatchingBQWriter(inner, max_rows=100, max_seconds=0.2)
+        writer.write(_chunk(2), "mlb", [], True)
+        self.assertEqual(inner.calls, [])
+
+        time.sleep(0.6)
+        self.assertEqual(inner.calls, [("mlb", 2, True)])
+        writer.flush()
+        self.assertEqual(len(inner.calls), 1)
+
+    def test_flush_waits_for_a_timer_load_in_progress(self):
+        inner = RecordingWriter()
+        record = inner.write
+
+        def slow_write(*args):
+            time.sleep(0.5)
+            return record(*args)
+
+        inner.write = slow_write
+        writer = BatchingBQWriter(inner, max_rows=100, max_seconds=0.1)
+        writer.write(_chunk(2), "mlb", [], True)
+        time.sleep(0.3)  # The timer's load has started and is still running
+
+        writer.flush("mlb")
+        self.assertEqual(inner.calls, [("mlb", 2, True)])
+
+    def test_byte_limit_uses_response_size(self):
+        inner = RecordingWriter()
+        writer = BatchingBQWriter(inner, max_rows=100, max_bytes=1000, max_seconds=3600)
+        chunk = _chunk(2)
+        chunk.attrs["response_bytes"] = 600
+
+        writer.write(chunk, "mlb", [], True)
+        self.assertEqual(inner.calls, [])
+        writer.write(chunk, "mlb", [], False)
+        self.assertEqual(inner.calls, [("mlb", 4, True)])
+
+    def test_empty_chunks_are_ignored(self):
+        inner = RecordingWriter()
+        writer = BatchingBQWriter(inner, max_rows=1)
+        writer.write(pd.DataFrame(), "mlb", [], True)
+        writer.flush()
+        self.assertEqual(inner.calls, [])
+
+    def test_on_loaded_called_after_batch_load(self):
+        inner = RecordingWriter()
+        writer = BatchingBQWriter(inner, max_rows=100, max_seconds=3600)
+        loaded = []
+
+        writer.write(_chunk(3), "mlb", [], True, on_loaded=lambda ids: loaded.append(("a", ids)))
+        writer.write(_chunk(3), "mlb", [], False, on_loaded=lambda ids: loaded.append(("b", ids)))
+        self.assertEqual(loaded, [])
+
+        writer.flush()
+        self.assertEqual(loaded, [("a", ["job_1"]), ("b", ["job_1"])])
+
+    def test_on_loaded_skipped_when_load_fails(self):
+        inner = RecordingWriter()
+        inner.write = lambda *args, **kwargs: None
+        writer = BatchingBQWriter(inner, max_rows=1)
+        loaded = []
+
+        writer.write(_chunk(2), "mlb", [], True, on_loaded=loaded.append)
+        self.assertEqual(loaded, [])
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,70 @@
+import unittest
+import threading
+import time
+from unittest.mock import MagicMock
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from google.api_core.exceptions import NotFound
+from src.utils.bq_client import TableMetadataCache
+
+TABLE_REF = "crzzpy.test.statcast_2025_mlb"
+
+
+class TestTableMetadataCache(unittest.TestCase):
+
+    def test_lookup_happens_once(self):
+        client = MagicMock()
+        cache = TableMetadataCache()
+
+        for _ in range(5):
+            self.assertTrue(cache.exists(client, TABLE_REF))
+        client.get_table.assert_called_once_with(TABLE_REF)
+
+    def test_missing_tables_are_cached_until_created(self):
+        client = MagicMock()
+        client.get_table.side_effect = NotFound("missing")
+        cache = TableMetadataCache()
+
+        self.assertFalse(cache.exists(client, TABLE_REF))
+        self.assertFalse(cache.exists(client, TABLE_REF))
+        self.assertEqual(client.get_table.call_count, 1)
+
+        created = MagicMock(project="crzzpy", dataset_id="test", table_id="statcast_2025_mlb")
+        cache.put(created)
+        self.assertIs(cache.get(client, TABLE_REF), created)
+        self.assertEqual(client.get_table.call_count, 1)
+
+    def test_invalidate_forces_refetch(self):
+        client = MagicMock()
+        cache = TableMetadataCache()
+        cache.get(client, TABLE_REF)
+        cache.invalidate(TABLE_REF)
+        cache.get(client, TABLE_REF)
+        self.assertEqual(client.get_table.call_count, 2)
+
+    def test_lookups_of_different_tables_run_in_parallel(self):
+        cache = TableMetadataCache()
+        started = threading.Barrier(2, timeout=2)
+
+        def get_table(table_ref):
+            started.wait()  # Times out (BrokenBarrierError) if lookups were serialized
+            return MagicMock()
+
+        client = MagicMock()
+        client.get_table.side_effect = get_table
+        threads = [threading.Thread(target=cache.get, args=(client, ref))
+                   for ref in (TABLE_REF, "crzzpy.test.statcast_2025_milb")]
+        start = time.monotonic()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertLess(time.monotonic() - start, 1.5)
+        self.assertEqual(cache.lookups, 2)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,127 @@
+import unittest
+import datetime
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from google.cloud import bigquery
+from src.utils.bq_schema_helper import (
+    df_to_arrow_table, df_to_parquet_buffer, compile_schema, canonical_type, align_df_to_bq_schema,
+    coercion_failures, reset_coercion_failures
+)
+
+SCHEMA = [
+    bigquery.SchemaField("game_date", "DATE"),
+    bigquery.SchemaField("pitch_type", "STRING"),
+    bigquery.SchemaField("release_speed", "FLOAT64"),
+    bigquery.SchemaField("hit_location", "INT64"),
+    bigquery.SchemaField("arm_angle", "FLOAT64"),
+]
+
+
+class TestArrowConversion(unittest.TestCase):
+
+    def setUp(self):
+        # Untyped object columns with None for nulls must still convert cleanly
+        self.df = pd.DataFrame({
+            "game_date": ["2024-04-01", "2024-04-02"],
+            "pitch_type": ["FF", None],
+            "release_speed": ["95.1", None],
+            "hit_location": [7, None],
+            "extra": ["dropped", "dropped"],
+        }, dtype=object)
+
+    def test_types_follow_schema(self):
+        table = df_to_arrow_table(self.df, SCHEMA)
+
+        self.assertEqual(table.column_names, [f.name for f in SCHEMA])
+        self.assertEqual(table.schema.field("game_date").type, pa.date32())
+        self.assertEqual(table.schema.field("pitch_type").type, pa.string())
+        self.assertEqual(table.schema.field("release_speed").type, pa.float64())
+        self.assertEqual(table.schema.field("hit_location").type, pa.int64())
+
+    def test_nulls_are_preserved(self):
+        table = df_to_arrow_table(self.df, SCHEMA)
+
+        self.assertEqual(table.column("game_date").to_pylist(),
+                         [datetime.date(2024, 4, 1), datetime.date(2024, 4, 2)])
+        self.assertEqual(table.column("hit_location").to_pylist(), [7, None])
+        self.assertEqual(table.column("pitch_type").to_pylist(), ["FF", None])
+        self.assertEqual(table.column("arm_angle").null_count, 2)
+
+    def test_parquet_buffer_round_trip(self):
+        buffer = df_to_parquet_buffer(self.df, SCHEMA)
+        table = pq.read_table(buffer)
+        self.assertEqual(table.num_rows, 2)
+        self.assertEqual(table.schema.field("hit_location").type, pa.int64())
+
+
+class TestConversionPlan(unittest.TestCase):
+
+    def test_plans_are_cached_per_schema(self):
+        self.assertIs(compile_schema(SCHEMA), compile_schema(list(SCHEMA)))
+        self.assertIsNot(compile_schema(SCHEMA), compile_schema(SCHEMA[:2]))
+
+    def test_type_aliases(self):
+        for alias in ("INT64", "INTEGER", "BIGINT", "SMALLINT", "BYTEINT"):
+            self.assertEqual(canonical_type(alias), "INT64")
+        self.assertEqual(canonical_type("float"), "FLOAT64")
+        self.assertEqual(canonical_type("BIGNUMERIC"), "NUMERIC")
+        self.assertEqual(canonical_type("BOOLEAN"), "BOOL")
+        self.assertEqual(canonical_type("GEOGRAPHY"), "STRING")
+
+    def test_failed_coercions_are_counted(self):
+        schema = [
+            bigquery.SchemaField("game_date", "DATE"),
+            bigquery.SchemaField("hit_location", "INTEGER"),
+            bigquery.SchemaField("is_home", "BOOL"),
+        ]
+        df = pd.DataFrame({
+            "game_date": ["2024-04-01", "soon", None],
+            "hit_location": ["7", "7.5", None],
+            "is_home": ["true", "F", "maybe"],
+        })
+        plan = compile_schema(schema)
+        before = plan.failures.copy()
+
+        table, failed = plan.to_arrow(df)
+
+        self.assertEqual(failed, {"game_date": 1, "hit_location": 1, "is_home": 1})
+        self.assertEqual(table.column("hit_location").to_pylist(), [7, None, None])
+        self.assertEqual(table.column("is_home").to_pylist(), [True, False, None])
+        self.assertEqual(plan.failures - before, failed)
+
+    def test_reset_scopes_failure_counts_to_a_run(self):
+        schema = [bigquery.SchemaField("hit_location", "INTEGER")]
+        plan = compile_schema(schema)
+        plan.to_arrow(pd.DataFrame({"hit_location": ["7.5"]}))
+        self.assertGreaterEqual(coercion_failures()["hit_location"], 1)
+
+        reset_coercion_failures()
+        self.assertEqual(coercion_failures(), {})
+        self.assertIs(compile_schema(schema), plan)
+
+        plan.to_arrow(pd.DataFrame({"hit_location": ["x", "y"]}))
+        self.assertEqual(coercion_failures(), {"hit_location": 2})
+
+    def test_align_renders_dates_and_keeps_extra_columns(self):
+        df = pd.DataFrame({
+            "game_date": ["2024-04-01", "2024-04-02"],
+            "pitch_type": ["FF", None],
+            "release_speed": [95.1, None],
+            "hit_location": [7.0, None],
+            "extra": ["kept", "kept"],
+        })
+        aligned = align_df_to_bq_schema(df, SCHEMA)
+
+        self.assertEqual(aligned["game_date"].tolist(), ["2024-04-01", "2024-04-02"])
+        self.assertEqual(aligned["hit_location"].dtype, "Int64")
+        self.assertIn("extra", aligned.columns)
+        self.assertTrue(aligned["arm_angle"].isna().all())
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,116 @@
+import unittest
+from unittest.mock import patch, MagicMock
+import pandas as pd
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from google.cloud import bigquery
+from src.statcast_fetch import run_statcast_download
+from src.utils.bq_client import TABLE_METADATA
+from src.writers.bq_writer import BQWriter
+
+SCHEMA = [bigquery.SchemaField("game_date", "DATE"), bigquery.SchemaField("pitcher", "INT64")]
+
+
+class TestJsonLoad(unittest.TestCase):
+
+    def setUp(self):
+        self.client = MagicMock()
+        self.client.project = "crzzpy"
+        patcher = patch("src.writers.bq_writer.get_bigquery_client", return_value=self.client)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_typed_nulls_become_none(self):
+        writer = BQWriter("crzzpy", "test", "statcast", write_mode="append")
+        df = pd.DataFrame({
+            "game_date": ["2024-04-01", None],
+            "pitcher": pd.array([543037, None], dtype="Int64"),
+            "release_speed": [95.1, float("nan")],
+        })
+
+        writer._load_json(df, "crzzpy.test.statcast_mlb", bigquery.LoadJobConfig())
+
+        rows = self.client.load_table_from_json.call_args.args[0]
+        self.assertEqual(rows, [
+            {"game_date": "2024-04-01", "pitcher": 543037, "release_speed": 95.1},
+            {"game_date": None, "pitcher": None, "release_speed": None},
+        ])
+
+
+class TestPartitionWrites(unittest.TestCase):
+
+    def setUp(self):
+        TABLE_METADATA.invalidate()
+        self.addCleanup(TABLE_METADATA.invalidate)
+
+        self.client = MagicMock()
+        self.client.project = "crzzpy"
+        patcher = patch("src.writers.bq_writer.get_bigquery_client", return_value=self.client)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.writer = BQWriter("crzzpy", "test", "statcast", write_mode="partition")
+        self.df = pd.DataFrame({
+            "game_date": ["2024-04-01", "2024-04-01", "2024-04-02", None],
+            "pitcher": [1, 2, 3, 4],
+        })
+
+    def test_each_date_overwrites_its_partition(self):
+        table = MagicMock()
+        table.time_partitioning = bigquery.TimePartitioning(field="game_date")
+        self.client.get_table.return_value = table
+
+        self.writer.write(self.df, "mlb", SCHEMA)
+
+        calls = self.client.load_table_from_json.call_args_list
+        destinations = [c.args[1] for c in calls]
+        table_id = self.writer.table_id("mlb")
+        self.assertEqual(destinations, [f"{table_id}$20240401", f"{table_id}$20240402"])
+        self.assertEqual([len(c.args[0]) for c in calls], [2, 1])
+        for c in calls:
+            self.assertEqual(c.kwargs["job_config"].write_disposition, bigquery.WriteDisposition.WRITE_TRUNCATE)
+        self.client.query.assert_not_called()
+
+    def test_unpartitioned_table_falls_back_to_delete_and_append(self):
+        table = MagicMock()
+        table.time_partitioning = None
+        self.client.get_table.return_value = table
+
+        self.writer.write(self.df, "mlb", SCHEMA)
+
+        self.client.query.assert_called_once()
+        self.assertIn("DELETE FROM", self.client.query.call_args.args[0])
+        load = self.client.load_table_from_json.call_args
+        self.assertEqual(load.args[1], self.writer.table_id("mlb"))
+        self.assertEqual(load.kwargs["job_config"].write_disposition, bigquery.WriteDisposition.WRITE_APPEND)
+
+
+class TestRepeatedRuns(unittest.TestCase):
+
+    def setUp(self):
+        self.client = MagicMock()
+        self.client.project = "crzzpy"
+        patcher = patch("src.writers.bq_writer.get_bigquery_client", return_value=self.client)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    @patch("src.statcast_fetch.table_exists", return_value=True)
+    @patch("src.statcast_fetch._fetch_chunk")
+    def test_each_run_truncates_again(self, mock_fetch_chunk, mock_table_exists):
+        mock_fetch_chunk.side_effect = lambda start, end, *args, **kwargs: pd.DataFrame({"game_date": [start]})
+        writer = BQWriter("crzzpy", "test", "statcast")
+
+        for _ in range(2):
+            run_statcast_download("2024-04-01", "2024-04-04", bq_writer=writer, league="mlb", chunk_size=2,
+                                  max_workers=1, write_workers=1, progress=False)
+
+        dispositions = [call.kwargs["job_config"].write_disposition
+                        for call in self.client.load_table_from_json.call_args_list]
+        first_run = [bigquery.WriteDisposition.WRITE_TRUNCATE, bigquery.WriteDisposition.WRITE_APPEND]
+        self.assertEqual(dispositions, first_run * 2)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
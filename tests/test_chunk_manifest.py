@@ -0,0 +1,154 @@
+import unittest
+import datetime
+import os
+import shutil
+import sys
+import tempfile
+import threading
+from http.server import ThreadingHTTPServer
+from unittest import mock
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import src.statcast_fetch as statcast_fetch
+from src.utils.chunk_manifest import ChunkManifest, STATUS_FETCHED, STATUS_LOADED, STATUS_FAILED
+from src.writers.base_writer import DataWriter
+from src.writers.bq_writer import BQWriter
+from tests.test_fetch_engines import _CsvHandler
+
+
+def _date(value):
+    return datetime.date.fromisoformat(value)
+
+
+class RecordingWriter(DataWriter):
+    def __init__(self):
+        self.windows = []
+
+    def write(self, df, league, schema_fields, truncate_table=False, on_loaded=None):
+        self.windows.append(df["game_date"].min())
+        if on_loaded:
+            on_loaded([f"job_{len(self.windows)}"])
+        return [f"job_{len(self.windows)}"]
+
+
+class TestChunkManifest(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.manifest = ChunkManifest(os.path.join(self.tmp, "manifest.sqlite"))
+
+    def tearDown(self):
+        self.manifest.close()
+        shutil.rmtree(self.tmp)
+
+    def test_record_keeps_earlier_fields_on_update(self):
+        self.manifest.record("mlb", "2024-04-01", "2024-04-05", STATUS_FETCHED, rows=120, byte_size=4096)
+        self.manifest.record("mlb", "2024-04-01", "2024-04-05", STATUS_LOADED, load_job_ids=["job_1"])
+
+        row = self.manifest._conn.execute(
+            "SELECT status, row_count, byte_size, load_job_ids FROM chunks").fetchone()
+        self.assertEqual(row, (STATUS_LOADED, 120, 4096, '["job_1"]'))
+
+    def test_pending_windows_skip_loaded_days(self):
+        self.manifest.record("mlb", "2024-04-01", "2024-04-02", STATUS_LOADED)
+        self.manifest.record("mlb", "2024-04-03", "2024-04-03", STATUS_LOADED)
+        self.manifest.record("mlb", "2024-04-04", "2024-04-06", STATUS_FAILED)
+        self.manifest.record("milb", "2024-04-07", "2024-04-08", STATUS_LOADED)
+
+        windows = [(_date("2024-04-01"), _date("2024-04-03")),
+                   (_date("2024-04-04"), _date("2024-04-06")),
+                   (_date("2024-04-07"), _date("2024-04-08"))]
+        self.assertEqual(self.manifest.pending_windows("mlb", windows), windows[1:])
+        self.assertEqual([w[:2] for w in self.manifest.incomplete_windows("mlb")], [("2024-04-04", "2024-04-06")])
+
+    def test_reset_is_per_league(self):
+        self.manifest.record("mlb", "2024-04-01", "2024-04-02", STATUS_LOADED)
+        self.manifest.record("milb", "2024-04-01", "2024-04-02", STATUS_LOADED)
+        self.manifest.reset("mlb")
+        self.assertEqual(self.manifest.windows("mlb"), [])
+        self.assertEqual(len(self.manifest.windows("milb")), 1)
+
+
+class TestResume(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), _CsvHandler)
+        cls.base_url = f"http://127.0.0.1:{cls.server.server_address[1]}/statcast_search/csv"
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.manifest = ChunkManifest(os.path.join(self.tmp, "manifest.sqlite"))
+
+    def tearDown(self):
+        self.manifest.close()
+        shutil.rmtree(self.tmp)
+
+    def _run(self, writer, resume):
+        with mock.patch.object(statcast_fetch, "table_exists", return_value=True):
+            return statcast_fetch._fetch_data_in_parallel(
+                "2024-04-01", "2024-04-09", self.base_url, {}, {"type": "details"}, "unused.csv", "mlb",
+                chunk_size=3, max_workers=2, bqwriter=writer, progress=False,
+                manifest=self.manifest, resume=resume)
+
+    def test_resume_fetches_only_unloaded_windows(self):
+        self.manifest.record("mlb", "2024-04-01", "2024-04-03", STATUS_LOADED)
+        self.manifest.record("mlb", "2024-04-04", "2024-04-06", STATUS_FAILED)
+
+        writer = RecordingWriter()
+        result = self._run(writer, resume=True)
+
+        self.assertEqual(sorted(writer.windows), ["2024-04-04", "2024-04-07"])
+        self.assertEqual(result["rows"], 4)
+        loaded = self.manifest.windows("mlb", STATUS_LOADED)
+        self.assertEqual([w[:2] for w in loaded], [
+            ("2024-04-01", "2024-04-03"), ("2024-04-04", "2024-04-06"), ("2024-04-07", "2024-04-09"),
+        ])
+        self.assertEqual(loaded[1][3], 2)
+
+    def test_fresh_run_resets_manifest(self):
+        self.manifest.record("mlb", "2024-04-01", "2024-04-03", STATUS_LOADED)
+
+        writer = RecordingWriter()
+        self._run(writer, resume=False)
+
+        self.assertEqual(len(writer.windows), 3)
+
+    def _download(self, write_mode):
+        client = mock.MagicMock()
+        client.project = "crzzpy"
+        with mock.patch("src.writers.bq_writer.get_bigquery_client", return_value=client), \
+                mock.patch.object(statcast_fetch, "BASE_MLB_URL", self.base_url), \
+                mock.patch.object(statcast_fetch, "table_exists", return_value=True):
+            writer = BQWriter("crzzpy", "test", "statcast", write_mode=write_mode)
+            statcast_fetch.run_statcast_download("2024-04-01", "2024-04-09", bq_writer=writer, league="mlb",
+                                                 chunk_size=3, max_workers=2, progress=False,
+                                                 manifest=self.manifest, resume=True)
+        return client
+
+    def test_resume_refuses_a_truncating_writer(self):
+        self.manifest.record("mlb", "2024-04-01", "2024-04-03", STATUS_LOADED)
+
+        with self.assertRaises(ValueError):
+            self._download("truncate")
+        self.assertEqual(self.manifest.windows("mlb", STATUS_LOADED)[0][:2], ("2024-04-01", "2024-04-03"))
+
+    def test_resume_appends_remaining_windows(self):
+        self.manifest.record("mlb", "2024-04-01", "2024-04-03", STATUS_LOADED)
+
+        client = self._download("append")
+
+        client.query.assert_not_called()
+        loads = client.load_table_from_json.call_args_list
+        self.assertEqual(len(loads), 2)
+        self.assertEqual({call.kwargs["job_config"].write_disposition for call in loads}, {"WRITE_APPEND"})
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
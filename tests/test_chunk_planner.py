@@ -0,0 +1,62 @@
+import unittest
+import datetime
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.utils.chunk_planner import ChunkPlanner
+
+
+def _day(n):
+    return datetime.date(2024, 4, n)
+
+
+def _rows(n):
+    return [None] * n
+
+
+class TestChunkPlanner(unittest.TestCase):
+
+    def test_seed_windows_pass_through(self):
+        planner = ChunkPlanner([(_day(1), _day(3)), (_day(4), _day(6))])
+        self.assertEqual(planner.next_window(), ("2024-04-01", "2024-04-03"))
+        self.assertEqual(planner.next_window(), ("2024-04-04", "2024-04-06"))
+        self.assertIsNone(planner.next_window())
+
+    def test_capped_window_is_bisected(self):
+        planner = ChunkPlanner([(_day(1), _day(5)), (_day(6), _day(10))], row_cap=100)
+        window = planner.next_window()
+
+        self.assertFalse(planner.record(*window, _rows(100)))
+        self.assertEqual(planner.next_window(), ("2024-04-01", "2024-04-03"))
+        self.assertEqual(planner.next_window(), ("2024-04-04", "2024-04-05"))
+        self.assertEqual(planner.next_window(), ("2024-04-06", "2024-04-10"))
+        self.assertEqual(planner.splits, 1)
+
+    def test_single_day_at_cap_is_kept(self):
+        planner = ChunkPlanner([(_day(1), _day(1))], row_cap=100)
+        window = planner.next_window()
+        self.assertTrue(planner.record(*window, _rows(100)))
+        self.assertIsNone(planner.next_window())
+
+    def test_small_payloads_grow_windows(self):
+        seeds = [(_day(n), _day(n)) for n in range(1, 11)]
+        planner = ChunkPlanner(seeds, row_cap=100, grow=True, min_rows=10, max_days=3)
+
+        window = planner.next_window()
+        self.assertEqual(window, ("2024-04-01", "2024-04-01"))
+        planner.record(*window, _rows(1))
+        self.assertEqual(planner.next_window(), ("2024-04-02", "2024-04-03"))
+
+        planner.record("2024-04-02", "2024-04-03", _rows(1))
+        self.assertEqual(planner.next_window(), ("2024-04-04", "2024-04-06"))
+
+    def test_no_growth_without_flag(self):
+        seeds = [(_day(n), _day(n)) for n in range(1, 4)]
+        planner = ChunkPlanner(seeds, row_cap=100, min_rows=10)
+        planner.record(*planner.next_window(), _rows(1))
+        self.assertEqual(planner.next_window(), ("2024-04-02", "2024-04-02"))
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,46 @@
+import unittest
+import numpy as np
+import pandas as pd
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.statcast_fetch import clean_dataframe
+
+
+class TestCleanDataframe(unittest.TestCase):
+
+    def setUp(self):
+        self.df = pd.DataFrame({
+            "game_date": ["2024-04-01", "2024/04/02", None, "not a date"],
+            "pitcher": pd.array([543037, None, 1, 2], dtype="Int64"),
+            "release_speed": [95.1, np.nan, 88.0, 90.0],
+            "updated": pd.to_datetime(["2024-04-01 19:05:00"] * 4),
+        })
+
+    def test_dates_and_timestamps_become_strings(self):
+        cleaned = clean_dataframe(self.df)
+
+        self.assertEqual(cleaned["game_date"].tolist()[:2], ["2024-04-01", "2024-04-02"])
+        self.assertTrue(cleaned["game_date"].iloc[2:].isna().all())
+        self.assertEqual(cleaned["updated"].iloc[0], "2024-04-01 19:05:00")
+
+    def test_nulls_stay_typed(self):
+        cleaned = clean_dataframe(self.df)
+
+        self.assertEqual(cleaned["pitcher"].dtype, "Int64")
+        self.assertEqual(cleaned["release_speed"].dtype, "float64")
+        self.assertTrue(pd.isna(cleaned["pitcher"].iloc[1]))
+        self.assertTrue(np.isnan(cleaned["release_speed"].iloc[1]))
+
+    def test_input_untouched_unless_inplace(self):
+        clean_dataframe(self.df)
+        self.assertEqual(self.df["game_date"].iloc[1], "2024/04/02")
+
+        cleaned = clean_dataframe(self.df, inplace=True)
+        self.assertIs(cleaned, self.df)
+        self.assertEqual(self.df["game_date"].iloc[1], "2024-04-02")
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
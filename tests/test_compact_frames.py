@@ -0,0 +1,40 @@
+import unittest
+import pandas as pd
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.statcast_fetch import _parse_csv, clean_dataframe
+
+CSV = (
+    b"pitch_type,game_date,release_speed,batter,hit_location,des,stand\n"
+    b"FF,2024-04-01,95.1,543037,7,Single to left,R\n"
+    b"SL,2024-04-01,,660271,,Strikeout,L\n"
+    b",2024-04-01,88.0,543037,3,,R\n"
+)
+
+
+class TestCompactFrames(unittest.TestCase):
+
+    def test_compact_dtypes(self):
+        df = _parse_csv(CSV, "2024-04-01", "2024-04-01", compact=True)
+
+        self.assertIsInstance(df["pitch_type"].dtype, pd.CategoricalDtype)
+        self.assertIsInstance(df["stand"].dtype, pd.CategoricalDtype)
+        self.assertIsInstance(df["des"].dtype, pd.StringDtype)
+        self.assertEqual(df["hit_location"].dtype, "Int8")
+        self.assertEqual(df["batter"].dtype, "Int32")
+        self.assertEqual(df["release_speed"].dtype, "float64")
+
+    def test_same_values_as_default_parse(self):
+        default = clean_dataframe(_parse_csv(CSV, "2024-04-01", "2024-04-01"))
+        compact = clean_dataframe(_parse_csv(CSV, "2024-04-01", "2024-04-01", compact=True))
+
+        for col in default.columns:
+            expected = default[col].astype(object).where(default[col].notna(), None).tolist()
+            actual = compact[col].astype(object).where(compact[col].notna(), None).tolist()
+            self.assertEqual(actual, expected, col)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
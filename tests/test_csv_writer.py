@@ -0,0 +1,73 @@
+import unittest
+import os
+import shutil
+import sys
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+import pandas as pd
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.writers.csv_writer import CSVWriter
+
+
+def _chunk(day, rows=3):
+    return pd.DataFrame({"game_date": [day] * rows, "pitch_type": ["FF"] * rows,
+                         "release_speed": [95.1, None, 88.0][:rows]})
+
+
+class TestCSVWriter(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp)
+
+    def test_chunk_shards_are_complete_files(self):
+        writer = CSVWriter(self.tmp, shard="chunk")
+        loaded = []
+        writer.write(_chunk("2024-04-01"), "statcast_mlb.csv", "2024-04-01", "2024-04-02", on_loaded=loaded.append)
+
+        path = os.path.join(self.tmp, "statcast_mlb_2024-04-01_2024-04-02.csv")
+        self.assertEqual(os.listdir(self.tmp), [os.path.basename(path)])
+        pd.testing.assert_frame_equal(pd.read_csv(path), _chunk("2024-04-01"))
+        self.assertEqual(loaded, [[]])
+
+    def test_chunk_shard_replaces_stale_part(self):
+        path = os.path.join(self.tmp, "statcast_mlb_2024-04-01_2024-04-02.csv")
+        _chunk("2024-04-01").to_csv(path + ".part", index=False)
+
+        CSVWriter(self.tmp, shard="chunk").write(_chunk("2024-04-01"), "statcast_mlb.csv", "2024-04-01", "2024-04-02")
+
+        pd.testing.assert_frame_equal(pd.read_csv(path), _chunk("2024-04-01"))
+
+    def test_league_file_renamed_on_flush(self):
+        writer = CSVWriter(self.tmp, compression="gzip", shard="league")
+        loaded = []
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            for day in range(1, 9):
+                for name in ("statcast_mlb.csv", "statcast_milb.csv"):
+                    executor.submit(writer.write, _chunk(f"2024-04-{day:02d}"), name,
+                                    on_loaded=loaded.append)
+
+        self.assertEqual(sorted(os.listdir(self.tmp)),
+                         ["statcast_milb.csv.gz.part", "statcast_mlb.csv.gz.part"])
+        self.assertEqual(loaded, [])
+
+        writer.flush("statcast_mlb.csv")
+        writer.flush()
+        for name in ("statcast_mlb.csv.gz", "statcast_milb.csv.gz"):
+            df = pd.read_csv(os.path.join(self.tmp, name))
+            self.assertEqual(len(df), 24)
+            self.assertEqual(df["game_date"].nunique(), 8)
+        self.assertEqual(len(loaded), 16)
+
+    def test_rejects_unknown_options(self):
+        with self.assertRaises(ValueError):
+            CSVWriter(self.tmp, compression="bz2")
+        with self.assertRaises(ValueError):
+            CSVWriter(self.tmp, shard="season")
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,126 @@
+import unittest
+import datetime
+import io
+import shutil
+import sys
+import os
+import tempfile
+from unittest.mock import patch
+import pandas as pd
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from benchmarks.savant_stub import SavantStub, rows_for_day
+from src.statcast_fetch import plan_statcast_download, run_statcast_download
+from src.utils.date_index import DateIndex
+from src.utils.season_calendar import SeasonCalendar
+from src.writers.csv_writer import CSVWriter
+
+
+def _window(rows_by_date, nbytes):
+    df = pd.DataFrame({"game_date": [day for day, rows in rows_by_date.items() for _ in range(rows)]})
+    df.attrs["response_bytes"] = nbytes
+    return df
+
+
+class TestDateIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.tmp)
+        self.index = DateIndex(os.path.join(self.tmp, "index.sqlite"), default_bytes_per_row=100,
+                               default_seconds_per_row=0.01)
+        self.addCleanup(self.index.close)
+
+    def test_record_splits_window_by_date_and_flags_short_dates(self):
+        df = _window({"2024-06-01": 30, "2024-06-03": 10}, nbytes=4000)
+
+        self.assertEqual(self.index.record("mlb", "2024-06-01", "2024-06-03", df, seconds=2.0), [])
+
+        self.assertEqual(self.index.rows("mlb", datetime.date(2024, 6, 1), datetime.date(2024, 6, 3)),
+                         {datetime.date(2024, 6, 1): 30, datetime.date(2024, 6, 2): 0, datetime.date(2024, 6, 3): 10})
+        self.assertEqual(self.index.rates("mlb"), (100.0, 0.05))
+        self.assertEqual(self.index.rates("milb"), (100, 0.01))
+
+        with self.assertLogs(level="WARNING"):
+            short = self.index.record("mlb", "2024-06-03", "2024-06-03", _window({"2024-06-03": 4}, 400))
+        self.assertEqual(short, ["2024-06-03"])
+
+    def test_estimate_uses_history_then_fallback(self):
+        self.index.record("mlb", "2024-06-01", "2024-06-02", _window({"2024-06-01": 20, "2024-06-02": 20}, 2000),
+                          seconds=1.0)
+        windows = [(datetime.date(2024, 6, 1), datetime.date(2024, 6, 2)),
+                   (datetime.date(2024, 6, 3), datetime.date(2024, 6, 4))]
+
+        known, new = self.index.estimate("mlb", windows, lambda league, day: 10)
+
+        self.assertEqual((known["rows"], known["bytes"], known["seconds"], known["indexed"]), (40, 2000, 1.0, 2))
+        self.assertEqual((new["rows"], new["bytes"], new["indexed"]), (20, 1000, 0))
+        self.assertAlmostEqual(new["seconds"], 0.5)
+        self.assertIsNone(self.index.expected_rows("mlb", windows))
+        self.assertEqual(sum(self.index.expected_rows("mlb", windows[:1]).values()), 40)
+
+    def test_error_frames_and_zeros_never_erase_counts(self):
+        self.index.record("mlb", "2024-06-01", "2024-06-02", _window({"2024-06-01": 30, "2024-06-02": 20}, 5000))
+
+        self.assertEqual(self.index.record("mlb", "2024-06-01", "2024-06-02", pd.DataFrame()), [])
+        with self.assertLogs(level="WARNING"):
+            short = self.index.record("mlb", "2024-06-02", "2024-06-02", _window({}, 0))
+        self.assertEqual(short, ["2024-06-02"])
+
+        self.assertEqual(self.index.rows("mlb", datetime.date(2024, 6, 1), datetime.date(2024, 6, 2)),
+                         {datetime.date(2024, 6, 1): 30, datetime.date(2024, 6, 2): 20})
+
+    def test_estimates_use_fallback_for_zero_days(self):
+        self.index.record("mlb", "2024-06-01", "2024-06-02", _window({"2024-06-01": 30}, 3000))
+        windows = [(datetime.date(2024, 6, 1), datetime.date(2024, 6, 2))]
+
+        self.assertEqual(self.index.expected_rows("mlb", windows, lambda league, day: 10),
+                         {datetime.date(2024, 6, 1): 30, datetime.date(2024, 6, 2): 10})
+        self.assertEqual(self.index.expected_rows("mlb", windows),
+                         {datetime.date(2024, 6, 1): 30, datetime.date(2024, 6, 2): 0})
+        window, = self.index.estimate("mlb", windows, lambda league, day: 10)
+        self.assertEqual((window["rows"], window["indexed"]), (40, 1))
+
+    def test_calendar_prefers_observed_rows(self):
+        self.index.record("mlb", "2024-06-01", "2024-06-01", _window({"2024-06-01": 950}, 0))
+        calendar = SeasonCalendar(os.path.join(self.tmp, "calendar.json"), "http://127.0.0.1:9/schedule",
+                                  {"mlb": [1]}, rows_per_game={"mlb": 100}, full_slate_games={"mlb": 1},
+                                  offline=True, index=self.index)
+
+        windows = calendar.windows("mlb", datetime.date(2024, 6, 1), datetime.date(2024, 6, 3), target_rows=1000)
+
+        self.assertEqual(windows, [(datetime.date(2024, 6, 1), datetime.date(2024, 6, 1)),
+                                   (datetime.date(2024, 6, 2), datetime.date(2024, 6, 3))])
+
+
+class TestPlan(unittest.TestCase):
+
+    def test_download_fills_index_and_plan_needs_no_network(self):
+        stub = SavantStub(rows_per_day={"mlb": 200}).start()
+        self.addCleanup(stub.stop)
+        tmp = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmp)
+        index = DateIndex(os.path.join(tmp, "index.sqlite"))
+        self.addCleanup(index.close)
+
+        with patch("src.statcast_fetch.BASE_MLB_URL", stub.mlb_url):
+            run_statcast_download("2024-06-03", "2024-06-09", csv_writer=CSVWriter(tmp), league="mlb",
+                                  chunk_size=3, progress=False, date_index=index)
+        requests_made = stub.stats["requests"]
+
+        out = io.StringIO()
+        plan = plan_statcast_download("2024-06-03", "2024-06-09", league="mlb", chunk_size=7, max_workers=2,
+                                      date_index=index, out=out)
+
+        self.assertEqual(stub.stats["requests"], requests_made)
+        observed = index.rows("mlb", datetime.date(2024, 6, 3), datetime.date(2024, 6, 9))
+        self.assertEqual(observed, {day: rows_for_day("mlb", day, 200) for day in observed})
+        window, = plan["leagues"]["mlb"]
+        self.assertEqual((window["rows"], window["indexed"]), (stub.expected_rows("mlb", "2024-06-03", "2024-06-09"), 7))
+        self.assertAlmostEqual(window["bytes"], stub.stats["bytes"], delta=7)
+        self.assertGreater(plan["eta_seconds"], 0)
+        self.assertIn("ETA about", out.getvalue())
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -3,7 +3,7 @@ import datetime
 import sys
 import os
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
-from statcast_fetch import _daterange  # Replace with your actual module name if different
+from src.statcast_fetch import _daterange
 
 class TestDateRange(unittest.TestCase):
 
@@ -0,0 +1,84 @@
+import unittest
+import threading
+import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
+import pandas as pd
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.statcast_fetch import _iter_chunks_threaded, _parse_csv
+from src.utils.async_fetch import iter_chunks_async
+from src.utils.chunk_planner import ChunkPlanner
+
+
+def _planner(windows, **kwargs):
+    as_dates = [(datetime.date.fromisoformat(start), datetime.date.fromisoformat(end)) for start, end in windows]
+    return ChunkPlanner(as_dates, **kwargs)
+
+
+class _CsvHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        query = parse_qs(urlparse(self.path).query)
+        start = query["game_date_gt"][0]
+        end = query["game_date_lt"][0]
+        body = f"game_date,pitch_type,release_speed\n{start},FF,95.1\n{end},SL,\n".encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/csv")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class TestFetchEngines(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), _CsvHandler)
+        cls.base_url = f"http://127.0.0.1:{cls.server.server_address[1]}/statcast_search/csv"
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def _collect(self, results):
+        return {(start, end): df for start, end, df in results}
+
+    def test_engines_produce_identical_frames(self):
+        windows = [("2024-04-01", "2024-04-02"), ("2024-04-03", "2024-04-04"), ("2024-04-05", "2024-04-05")]
+        params = {"type": "details"}
+
+        threaded = self._collect(_iter_chunks_threaded(
+            _planner(windows), self.base_url, {"Connection": "close"}, params, max_workers=2))
+        asynced = self._collect(iter_chunks_async(
+            _planner(windows), self.base_url, {"Connection": "close"}, params, _parse_csv, max_in_flight=2))
+
+        self.assertEqual(set(threaded), set(windows))
+        self.assertEqual(set(asynced), set(windows))
+        for window in windows:
+            pd.testing.assert_frame_equal(threaded[window], asynced[window])
+
+    def test_capped_windows_are_split(self):
+        # Every response has two rows, so a cap of 2 forces splitting down to single days
+        windows = [("2024-04-01", "2024-04-04")]
+        params = {"type": "details"}
+
+        for results in (
+            _iter_chunks_threaded(_planner(windows, row_cap=2), self.base_url, {}, params, max_workers=2),
+            iter_chunks_async(_planner(windows, row_cap=2), self.base_url, {}, params, _parse_csv, max_in_flight=2),
+        ):
+            collected = self._collect(results)
+            self.assertEqual(sorted(collected), [
+                ("2024-04-01", "2024-04-01"), ("2024-04-02", "2024-04-02"),
+                ("2024-04-03", "2024-04-03"), ("2024-04-04", "2024-04-04"),
+            ])
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
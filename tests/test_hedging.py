@@ -0,0 +1,208 @@
+import unittest
+import datetime
+import sys
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock, patch
+import pandas as pd
+import requests
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.config.config import PARAMS_DICT
+from src.statcast_fetch import _fetch_chunk, _iter_chunks_threaded
+from src.utils.run_metrics import RunMetrics
+from src.utils.throttle import AdaptiveThrottle
+from src.utils.chunk_planner import ChunkPlanner
+from src.utils.hedging import HedgePolicy, RequestHedger, split_window
+
+
+def _policy(mode="duplicate", **kwargs):
+    settings = {"percentile": 90, "budget": 0.5, "min_samples": 2, "min_delay": 0.0}
+    settings.update(kwargs)
+    return HedgePolicy(mode, **settings)
+
+
+def _warm(hedger):
+    for n in range(2):
+        hedger.policy.observe(1.0)
+        hedger.policy.count("requested")
+
+
+class StragglerSession:
+    """Answers every request at once, except the first one for straggler, which waits for release."""
+
+    def __init__(self, straggler):
+        self.straggler = straggler
+        self.release = threading.Event()
+        self.events = []
+        self._seen = set()
+        self._lock = threading.Lock()
+
+    def get(self, url, params=None, timeout=None):
+        day = params["game_date_gt"]
+        with self._lock:
+            first = day not in self._seen
+            self._seen.add(day)
+        if day == self.straggler and first:
+            self.release.wait(timeout=10)
+            time.sleep(0.2)  # Still reading the response when the run ends
+            self.events.append("straggler returned")
+        return MagicMock(content=f"game_date\n{day}\n".encode())
+
+
+class FakeSessionPool:
+    def __init__(self, session):
+        self.session = session
+
+    def get(self, base_url, headers=None):
+        return self.session
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.session.events.append("session closed")
+
+
+@patch("src.utils.hedging.time.monotonic")
+class TestRequestHedger(unittest.TestCase):
+
+    def test_split_window(self, _):
+        self.assertEqual(split_window("2024-06-01", "2024-06-05"),
+                         [("2024-06-01", "2024-06-03"), ("2024-06-04", "2024-06-05")])
+        self.assertIsNone(split_window("2024-06-01", "2024-06-01"))
+
+    def test_duplicate_hedge_first_answer_wins(self, monotonic):
+        hedger = RequestHedger(_policy())
+        _warm(hedger)
+        window = ("2024-06-01", "2024-06-02")
+        monotonic.return_value = 100.0
+        hedger.track(window, "primary")
+        self.assertEqual(hedger.due(), [])
+        self.assertAlmostEqual(hedger.next_check(), 1.0)
+
+        monotonic.return_value = 101.5
+        (due_window, parts), = hedger.due()
+        self.assertEqual(parts, [window])
+        hedger.add(due_window, parts[0], "hedge")
+        self.assertEqual(hedger.due(), [])
+
+        (window_out, df), redundant = hedger.complete("hedge", pd.DataFrame({"a": [1]}))
+        self.assertEqual((window_out, len(df), redundant), (window, 1, ["primary"]))
+        self.assertEqual(hedger.complete("primary", pd.DataFrame({"a": [1]})), (None, []))
+        self.assertEqual((hedger.policy.hedged, hedger.policy.won), (1, 1))
+
+    def test_split_hedge_combines_halves_and_waits_out_failures(self, monotonic):
+        hedger = RequestHedger(_policy("split"))
+        _warm(hedger)
+        window = ("2024-06-01", "2024-06-04")
+        monotonic.return_value = 100.0
+        hedger.track(window, "primary")
+        monotonic.return_value = 102.0
+        (_, parts), = hedger.due()
+        for n, part in enumerate(parts):
+            hedger.add(window, part, f"half{n}")
+
+        self.assertEqual(hedger.complete("primary", None), (None, []))
+        self.assertEqual(hedger.complete("half1", pd.DataFrame({"game_date": ["2024-06-03"]})), (None, []))
+        (_, df), redundant = hedger.complete("half0", pd.DataFrame({"game_date": ["2024-06-01"]}))
+        self.assertEqual(df["game_date"].tolist(), ["2024-06-01", "2024-06-03"])
+        self.assertEqual(redundant, [])
+
+    def test_failed_half_orphans_its_sibling(self, monotonic):
+        hedger = RequestHedger(_policy("split"))
+        _warm(hedger)
+        window = ("2024-06-01", "2024-06-04")
+        monotonic.return_value = 100.0
+        hedger.track(window, "primary")
+        monotonic.return_value = 102.0
+        (_, parts), = hedger.due()
+        for n, part in enumerate(parts):
+            hedger.add(window, part, f"half{n}")
+
+        self.assertEqual(hedger.complete("half0", None), (None, ["half1"]))
+        self.assertEqual(hedger.complete("half1", pd.DataFrame({"game_date": ["2024-06-03"]})), (None, []))
+        (window_out, df), redundant = hedger.complete("primary", pd.DataFrame({"game_date": ["2024-06-01"]}))
+        self.assertEqual((window_out, len(df), redundant), (window, 1, []))
+
+    def test_budget_caps_hedges(self, monotonic):
+        hedger = RequestHedger(_policy(budget=0.25))
+        _warm(hedger)
+        monotonic.return_value = 100.0
+        for n in range(6):
+            hedger.track((f"2024-06-0{n + 1}",) * 2, n)
+        monotonic.return_value = 110.0
+
+        self.assertEqual(len(hedger.due()), 2)
+
+
+class TestHedgedFetch(unittest.TestCase):
+
+    def test_straggler_is_answered_by_hedge(self):
+        day = datetime.date(2024, 6, 1)
+        planner = ChunkPlanner([(day + datetime.timedelta(days=n),) * 2 for n in range(12)])
+        session = StragglerSession("2024-06-07")
+        policy = _policy(min_samples=4)
+
+        chunks = []
+        with patch("src.statcast_fetch.SessionPool", lambda pool_size: FakeSessionPool(session)):
+            for chunk in _iter_chunks_threaded(planner, "http://fake-url.com", {}, PARAMS_DICT, max_workers=2,
+                                               hedge_policy=policy):
+                chunks.append(chunk)
+                if chunk[0] == session.straggler:
+                    session.events.append("straggler answered")
+                    session.release.set()
+
+        # The straggler's primary was still blocked when its window was answered, and the
+        # engine waited for it before closing the session
+        self.assertEqual(session.events, ["straggler answered", "straggler returned", "session closed"])
+        self.assertEqual(sorted(chunk[0] for chunk in chunks),
+                         [(day + datetime.timedelta(days=n)).isoformat() for n in range(12)])
+        self.assertTrue(all(len(df) > 0 for _, _, df in chunks))
+        self.assertGreaterEqual(policy.won, 1)
+
+    def test_hedge_skips_the_busy_concurrency_slot(self):
+        throttle = AdaptiveThrottle(initial=1, max_limit=1, adaptive=False)
+        session = MagicMock()
+        session.get.return_value.content = b"game_date\n2024-06-01\n"
+
+        def fetch(hedge):
+            return _fetch_chunk("2024-06-01", "2024-06-01", "http://fake-url.com", {}, PARAMS_DICT,
+                                session=session, throttle=throttle, hedge=hedge)
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            with throttle.slot("http://fake-url.com"):  # Held by the straggling primary
+                primary = executor.submit(fetch, False)
+                df = executor.submit(fetch, True).result(timeout=2)
+                primary_waited = not primary.done()
+            self.assertEqual(len(primary.result(timeout=2)), 1)
+
+        self.assertEqual(df["game_date"].tolist(), ["2024-06-01"])
+        self.assertTrue(primary_waited)
+
+    def test_cancelled_request_ends_without_reporting(self):
+        cancelled = threading.Event()
+        metrics = RunMetrics()
+        throttle = MagicMock()
+        throttle.reserve.return_value = 0
+
+        def closed_under_request(*args, **kwargs):
+            cancelled.set()  # The window was answered by its hedge and the session closed
+            raise requests.exceptions.ConnectionError("connection pool is closed")
+
+        session = MagicMock()
+        session.get.side_effect = closed_under_request
+
+        df = _fetch_chunk("2024-06-01", "2024-06-01", "http://fake-url.com", {}, PARAMS_DICT, session=session,
+                          metrics=metrics, throttle=throttle, cancelled=cancelled)
+
+        self.assertIsNone(df)
+        session.get.assert_called_once()
+        throttle.on_congestion.assert_not_called()
+        self.assertNotIn("retries", metrics.summary()["counters"])
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,36 @@
+import unittest
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.utils.http_session import SessionPool
+
+
+class TestSessionPool(unittest.TestCase):
+
+    def test_one_session_per_base_url(self):
+        with SessionPool(pool_size=4) as pool:
+            first = pool.get("https://example.com/a")
+            second = pool.get("https://example.com/a")
+            other = pool.get("https://example.com/b")
+
+            self.assertIs(first, second)
+            self.assertIsNot(first, other)
+
+    def test_adapter_sized_to_pool(self):
+        with SessionPool(pool_size=6) as pool:
+            session = pool.get("https://example.com/a")
+            adapter = session.get_adapter("https://example.com/a")
+            self.assertEqual(adapter._pool_maxsize, 6)
+
+    def test_connection_close_header_dropped(self):
+        headers = {"User-Agent": "Mozilla/5.0", "Connection": "close"}
+        with SessionPool() as pool:
+            session = pool.get("https://example.com/a", headers)
+            self.assertEqual(session.headers["Connection"], "keep-alive")
+            self.assertEqual(session.headers["User-Agent"], "Mozilla/5.0")
+            self.assertIn("gzip", session.headers["Accept-Encoding"])
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,86 @@
+import unittest
+import shutil
+import sys
+import os
+import tempfile
+import threading
+import time
+from unittest.mock import patch
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from benchmarks.savant_stub import SavantStub
+from src.statcast_fetch import run_statcast_download
+from src.utils.throttle import AdaptiveThrottle
+from src.writers.csv_writer import CSVWriter
+
+
+class TestEndpointLimits(unittest.TestCase):
+
+    def test_endpoint_limit_caps_one_endpoint_within_global_budget(self):
+        throttle = AdaptiveThrottle(initial=3, max_limit=3, adaptive=False, endpoint_limits={"milb": 1})
+        self.assertEqual((throttle.limit_for("mlb"), throttle.limit_for("milb")), (3, 1))
+
+        acquired = []
+
+        def take(endpoint):
+            with throttle.slot(endpoint):
+                acquired.append(endpoint)
+                release.wait(5)
+
+        release = threading.Event()
+        threads = [threading.Thread(target=take, args=(endpoint,)) for endpoint in ("milb", "milb", "mlb", "mlb")]
+        for thread in threads:
+            thread.start()
+        time.sleep(0.2)
+        # The second MiLB request waits on its endpoint limit; the second MLB one on the global budget
+        self.assertEqual(sorted(acquired), ["milb", "mlb", "mlb"])
+
+        release.set()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(len(acquired), 4)
+
+
+class TestConcurrentLeagues(unittest.TestCase):
+
+    def setUp(self):
+        # The stub answers 429 past 4 concurrent requests, so any breach of the shared budget shows up
+        self.stub = SavantStub(rows_per_day={"mlb": 100, "milb": 50}, latency=0.5, max_concurrent=4).start()
+        self.addCleanup(self.stub.stop)
+        self.csv_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.csv_dir)
+
+    def _download(self, **kwargs):
+        start = time.monotonic()
+        with patch("src.statcast_fetch.BASE_MLB_URL", self.stub.mlb_url), \
+                patch("src.statcast_fetch.BASE_MiLB_URL", self.stub.milb_url):
+            summary = run_statcast_download("2024-06-04", "2024-06-09", csv_writer=CSVWriter(self.csv_dir),
+                                            league="both", chunk_size=1, max_workers=4, progress=False,
+                                            **kwargs)
+        return summary, time.monotonic() - start
+
+    def test_both_leagues_share_one_worker_budget(self):
+        sequential, sequential_seconds = self._download(concurrent_leagues=False)
+        concurrent, concurrent_seconds = self._download()
+
+        # Six one-day windows per league: 2 + 2 rounds of 4 one after the other, 3 rounds together
+        self.assertLess(concurrent_seconds, sequential_seconds - 0.3)
+        self.assertEqual(self.stub.stats["throttled"], 0)
+        for league in ("mlb", "milb"):
+            self.assertEqual(concurrent["leagues"][league]["rows"], sequential["leagues"][league]["rows"])
+            self.assertEqual(concurrent["leagues"][league]["rows"],
+                             self.stub.expected_rows(league, "2024-06-04", "2024-06-09"))
+
+    def test_league_workers_limit_an_endpoint(self):
+        throttle = AdaptiveThrottle(initial=4, max_limit=4, adaptive=False)
+
+        summary, _ = self._download(throttle=throttle, league_workers={"milb": 1})
+
+        self.assertEqual(throttle.limit_for(self.stub.milb_url), 1)
+        self.assertEqual(throttle.limit_for(self.stub.mlb_url), 4)
+        self.assertEqual(summary["counters"]["requests"], 12)
+        self.assertEqual(self.stub.stats["throttled"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,81 @@
+import unittest
+import glob
+import os
+import shutil
+import sys
+import tempfile
+import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.writers.parquet_writer import ParquetWriter
+
+
+def _chunk(days, speed=95.1):
+    return pd.DataFrame({
+        "game_date": [day for day in days for _ in range(2)],
+        "pitch_type": ["FF", None] * len(days),
+        "release_speed": [speed, None] * len(days),
+        "pitcher": [543037, 543037] * len(days),
+    })
+
+
+class TestParquetWriter(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp)
+
+    def _read(self):
+        return ds.dataset(self.tmp, format="parquet", partitioning="hive").to_table().to_pandas()
+
+    def _files(self, league, game_date):
+        return glob.glob(os.path.join(self.tmp, f"league={league}", f"game_date={game_date}", "*.parquet"))
+
+    def test_hive_layout_and_types(self):
+        writer = ParquetWriter(self.tmp)
+        loaded = []
+        writer.write(_chunk(["2024-04-01", "2024-04-02"]), "mlb", on_loaded=loaded.append)
+        writer.write(_chunk(["2024-04-01"]), "milb")
+
+        self.assertEqual(len(self._files("mlb", "2024-04-01")), 1)
+        self.assertEqual(len(self._files("mlb", "2024-04-02")), 1)
+        self.assertEqual(loaded, [[]])
+
+        schema = ds.dataset(self._files("mlb", "2024-04-01")[0], format="parquet").schema
+        self.assertEqual(schema.field("pitcher").type, pa.int64())
+        self.assertEqual(schema.field("release_speed").type, pa.float64())
+        self.assertEqual(schema.field("pitch_type").type, pa.string())
+        self.assertNotIn("game_date", schema.names)
+
+        df = self._read()
+        self.assertEqual(len(df), 6)
+        self.assertEqual(sorted(df["league"].astype(str).unique()), ["milb", "mlb"])
+
+    def test_replace_mode_overwrites_refetched_days(self):
+        writer = ParquetWriter(self.tmp)
+        writer.write(_chunk(["2024-04-01", "2024-04-02"]), "mlb")
+        writer.write(_chunk(["2024-04-02", "2024-04-03"], speed=90.0), "mlb")
+
+        df = self._read()
+        self.assertEqual(len(df), 6)
+        self.assertEqual(len(self._files("mlb", "2024-04-02")), 1)
+        self.assertEqual(df.loc[df["game_date"].astype(str) == "2024-04-02", "release_speed"].max(), 90.0)
+
+    def test_append_then_compact(self):
+        writer = ParquetWriter(self.tmp, mode="append")
+        writer.write(_chunk(["2024-04-01"]), "mlb")
+        writer.write(_chunk(["2024-04-01"]), "mlb")
+        writer.write(_chunk(["2024-04-02"]), "mlb")
+        self.assertEqual(len(self._files("mlb", "2024-04-01")), 2)
+
+        self.assertEqual(writer.compact("mlb"), 1)
+        self.assertEqual(len(self._files("mlb", "2024-04-01")), 1)
+        self.assertEqual(len(self._read()), 6)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
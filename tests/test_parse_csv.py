@@ -0,0 +1,69 @@
+import unittest
+from unittest.mock import patch
+import logging
+import pandas as pd
+import sys
+import os
+
+# Make sure we can import from ../src
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.statcast_fetch import _csv_dtypes, _parse_csv
+
+
+class TestParseCsv(unittest.TestCase):
+
+    def test_csv_dtypes_maps_known_types(self):
+        dtypes = _csv_dtypes(["release_speed", "batter", "game_date", "not_a_statcast_column"])
+
+        self.assertEqual(dtypes, {"release_speed": "float64", "batter": "float64",
+                                  "game_date": str, "not_a_statcast_column": str})
+
+    def test_whole_int_columns_narrow_to_int64(self):
+        csv_data = b"game_date,batter,hit_location,release_speed\n2024-04-01,1,,95.1\n2024-04-01,2,7,\n"
+
+        df = _parse_csv(csv_data, "2024-04-01", "2024-04-01")
+
+        self.assertEqual(str(df["batter"].dtype), "Int64")
+        self.assertEqual(str(df["hit_location"].dtype), "Int64")
+        self.assertTrue(pd.isna(df["hit_location"].iloc[0]))
+        self.assertEqual(df["release_speed"].dtype, "float64")
+        self.assertEqual(df["game_date"].tolist(), ["2024-04-01", "2024-04-01"])
+        self.assertEqual(df.attrs["response_bytes"], len(csv_data))
+
+    def test_int_column_with_fractions_stays_float64(self):
+        csv_data = b"batter,hit_location\n1,1.5\n2,3\n"
+
+        df = _parse_csv(csv_data, "2024-04-01", "2024-04-01")
+
+        self.assertEqual(df["hit_location"].dtype, "float64")
+        self.assertEqual(df["hit_location"].tolist(), [1.5, 3.0])
+        self.assertEqual(str(df["batter"].dtype), "Int64")
+
+    def test_bad_numeric_value_falls_back_to_strings(self):
+        csv_data = b"batter,release_speed\n1,fast\n2,95.1\n"
+
+        with self.assertLogs(level="WARNING") as logs:
+            df = _parse_csv(csv_data, "2024-04-01", "2024-04-01")
+
+        self.assertIn("reading as strings", "\n".join(logs.output))
+        self.assertEqual(df["release_speed"].tolist(), ["fast", "95.1"])
+        self.assertEqual(df["batter"].tolist(), ["1", "2"])
+
+    def test_game_date_sample_only_at_debug(self):
+        csv_data = b"game_date,batter\n2024-04-01,1\n"
+
+        root = logging.getLogger()
+        self.addCleanup(root.setLevel, root.level)
+        root.setLevel(logging.INFO)
+        with patch("src.statcast_fetch.logging.debug") as debug:
+            _parse_csv(csv_data, "2024-04-01", "2024-04-01")
+        self.assertFalse(any(isinstance(call.args[0], list) for call in debug.call_args_list))
+
+        with self.assertLogs(level="DEBUG") as logs:
+            _parse_csv(csv_data, "2024-04-01", "2024-04-01")
+        self.assertIn("['2024-04-01']", "\n".join(logs.output))
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
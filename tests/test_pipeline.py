@@ -0,0 +1,76 @@
+import unittest
+import threading
+import time
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.utils.pipeline import StagedPipeline
+
+
+class TestStagedPipeline(unittest.TestCase):
+
+    def test_items_flow_through_every_stage(self):
+        written = []
+        lock = threading.Lock()
+
+        def write(item):
+            with lock:
+                written.append(item)
+
+        with StagedPipeline([("double", lambda x: x * 2, 3), ("write", write, 2)], queue_size=2) as pipeline:
+            for n in range(20):
+                pipeline.put(n)
+
+        self.assertEqual(sorted(written), [n * 2 for n in range(20)])
+
+    def test_none_and_errors_drop_items(self):
+        written = []
+
+        def clean(x):
+            if x == 1:
+                raise ValueError("bad chunk")
+            return None if x == 2 else x
+
+        with StagedPipeline([("clean", clean, 1), ("write", written.append, 1)]) as pipeline:
+            for n in range(4):
+                pipeline.put(n)
+
+        self.assertEqual(written, [0, 3])
+
+    def test_bounded_queue_applies_backpressure(self):
+        release = threading.Event()
+
+        def slow(item):
+            release.wait()
+
+        pipeline = StagedPipeline([("slow", slow, 1)], queue_size=1)
+        pipeline.put(1)  # taken by the worker
+        time.sleep(0.05)
+        pipeline.put(2)  # fills the queue
+
+        blocked = threading.Thread(target=pipeline.put, args=(3,))
+        blocked.start()
+        blocked.join(timeout=0.1)
+        self.assertTrue(blocked.is_alive())
+        self.assertEqual(pipeline.depths(), {"slow": 1})
+
+        release.set()
+        blocked.join()
+        pipeline.close()
+        self.assertEqual(pipeline.max_depths["slow"], 1)
+
+    def test_pending_counts_unfinished_items(self):
+        release = threading.Event()
+        pipeline = StagedPipeline([("clean", lambda x: x, 1), ("write", lambda x: release.wait(), 1)])
+        pipeline.put(1)
+        pipeline.put(2)
+        self.assertEqual(pipeline.pending, 2)
+
+        release.set()
+        pipeline.close()
+        self.assertEqual(pipeline.pending, 0)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
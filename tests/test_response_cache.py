@@ -0,0 +1,86 @@
+import unittest
+import datetime
+import tempfile
+import time
+import os
+import sys
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.utils.response_cache import ResponseCache
+
+URL = "https://baseballsavant.mlb.com/statcast_search/csv"
+
+
+def _params(start, end):
+    return {"all": "true", "type": "details", "game_date_gt": start, "game_date_lt": end}
+
+
+class TestResponseCache(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+
+    def test_round_trip(self):
+        cache = ResponseCache(self.tmp.name)
+        params = _params("2023-04-01", "2023-04-05")
+        self.assertIsNone(cache.get(URL, params))
+
+        cache.put(URL, params, b"game_date\n2023-04-01\n")
+        self.assertEqual(cache.get(URL, params), b"game_date\n2023-04-01\n")
+        self.assertIsNone(cache.get(URL, _params("2023-04-06", "2023-04-10")))
+
+    def test_recent_entries_expire_but_past_seasons_do_not(self):
+        cache = ResponseCache(self.tmp.name, ttl_seconds=60)
+        today = datetime.date.today().strftime("%Y-%m-%d")
+        recent = _params(today, today)
+        past = _params("2021-04-01", "2021-04-05")
+        cache.put(URL, recent, b"recent")
+        cache.put(URL, past, b"past")
+
+        stale = time.time() - 3600
+        for params in (recent, past):
+            os.utime(cache._path(cache.key(URL, params)), (stale, stale))
+
+        self.assertIsNone(cache.get(URL, recent))
+        self.assertEqual(cache.get(URL, past), b"past")
+
+    def test_offline_serves_expired_entries(self):
+        today = datetime.date.today().strftime("%Y-%m-%d")
+        recent = _params(today, today)
+        cache = ResponseCache(self.tmp.name, ttl_seconds=60, offline=True)
+        cache.put(URL, recent, b"recent")
+        stale = time.time() - 3600
+        os.utime(cache._path(cache.key(URL, recent)), (stale, stale))
+
+        self.assertEqual(cache.get(URL, recent), b"recent")
+
+    def test_refresh_skips_reads(self):
+        params = _params("2023-04-01", "2023-04-05")
+        ResponseCache(self.tmp.name).put(URL, params, b"old")
+
+        cache = ResponseCache(self.tmp.name, refresh=True)
+        self.assertIsNone(cache.get(URL, params))
+
+    def test_lru_eviction(self):
+        cache = ResponseCache(self.tmp.name)
+        payload = os.urandom(4096)  # incompressible, so each entry is ~4 KB on disk
+        first, second = _params("2023-04-01", "2023-04-01"), _params("2023-04-02", "2023-04-02")
+        cache.put(URL, first, payload)
+        cache.put(URL, second, payload)
+
+        # Touch the first entry so the second becomes least recently used
+        old = time.time() - 100
+        os.utime(cache._path(cache.key(URL, second)), (old, old))
+        cache.get(URL, first)
+
+        cache.max_bytes = 9000
+        cache.put(URL, _params("2023-04-03", "2023-04-03"), payload)
+
+        self.assertIsNone(cache.get(URL, second))
+        self.assertEqual(cache.get(URL, first), payload)
+        self.assertLessEqual(cache._size, cache.max_bytes)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
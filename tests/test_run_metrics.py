@@ -0,0 +1,85 @@
+import unittest
+import shutil
+import sys
+import os
+import tempfile
+import threading
+from unittest.mock import patch
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from benchmarks.savant_stub import SavantStub
+from src.statcast_fetch import run_statcast_download
+from src.utils.run_metrics import RunMetrics, prometheus_text
+from src.writers.csv_writer import CSVWriter
+
+
+class TestRunMetrics(unittest.TestCase):
+
+    def test_percentiles_and_counters(self):
+        metrics = RunMetrics()
+
+        def record(offset):
+            for n in range(1, 51):
+                metrics.observe("http", (offset + n) / 100)
+                metrics.add("requests")
+
+        threads = [threading.Thread(target=record, args=(offset,)) for offset in (0, 50)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        with metrics.timer("clean"):
+            pass
+
+        summary = metrics.summary(peak_rss_bytes=1024)
+        http = summary["stages"]["http"]
+        self.assertEqual(list(summary["stages"]), ["http", "clean"])
+        self.assertEqual(http["count"], 100)
+        self.assertAlmostEqual(http["p50"], 0.505, places=3)
+        self.assertAlmostEqual(http["p99"], 0.9901, places=3)
+        self.assertEqual(http["max"], 1.0)
+        self.assertEqual(summary["counters"]["requests"], 100)
+        self.assertEqual(summary["peak_rss_bytes"], 1024)
+
+    def test_prometheus_text(self):
+        metrics = RunMetrics()
+        metrics.observe("bq_load", 2.5)
+        metrics.add("retries", 3)
+
+        text = prometheus_text(metrics.summary())
+
+        self.assertIn("# TYPE statcast_stage_seconds summary", text)
+        self.assertIn('statcast_stage_seconds{stage="bq_load",quantile="0.95"} 2.5', text)
+        self.assertIn('statcast_stage_seconds_count{stage="bq_load"} 1', text)
+        self.assertIn("# TYPE statcast_retries_total counter\nstatcast_retries_total 3", text)
+        self.assertTrue(text.endswith("\n"))
+
+
+class TestRunSummary(unittest.TestCase):
+
+    def setUp(self):
+        self.stub = SavantStub(rows_per_day={"mlb": 200, "milb": 100}).start()
+        self.addCleanup(self.stub.stop)
+        self.csv_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.csv_dir)
+
+    def test_download_returns_stage_summary(self):
+        with patch("src.statcast_fetch.BASE_MLB_URL", self.stub.mlb_url), \
+                patch("src.statcast_fetch.BASE_MiLB_URL", self.stub.milb_url):
+            summary = run_statcast_download("2024-06-04", "2024-06-07", csv_writer=CSVWriter(self.csv_dir),
+                                            league="both", chunk_size=2, progress=False)
+
+        expected_rows = (self.stub.expected_rows("mlb", "2024-06-04", "2024-06-07")
+                         + self.stub.expected_rows("milb", "2024-06-04", "2024-06-07"))
+        self.assertEqual(summary["counters"]["rows_written"], expected_rows)
+        self.assertEqual(summary["counters"]["requests"], 4)
+        self.assertEqual(summary["counters"]["bytes_downloaded"], self.stub.stats["bytes"])
+        self.assertEqual(summary["stages"]["http"]["count"], 4)
+        self.assertEqual(summary["stages"]["csv_write"]["count"], 4)
+        self.assertIn("parse", summary["stages"])
+        self.assertIn("clean", summary["stages"])
+        self.assertEqual(summary["leagues"]["milb"]["max_game_date"], "2024-06-07")
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
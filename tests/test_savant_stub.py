@@ -0,0 +1,69 @@
+import unittest
+import io
+import sys
+import os
+import threading
+import pandas as pd
+import requests
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from benchmarks.run_benchmarks import compare
+from benchmarks.savant_stub import SavantStub
+from src.config.config import KNOWN_COLUMN_TYPES, PARAMS_DICT
+from src.statcast_fetch import _fetch_chunk
+
+
+class TestSavantStub(unittest.TestCase):
+
+    def setUp(self):
+        self.stub = SavantStub(rows_per_day={"mlb": 100, "milb": 50}, row_cap=250).start()
+        self.addCleanup(self.stub.stop)
+
+    def _get(self, url, start, end):
+        return requests.get(url, params={"game_date_gt": start, "game_date_lt": end}, timeout=10)
+
+    def test_serves_every_known_column_per_day(self):
+        # 2024-06-03 is a Monday, a light day
+        df = pd.read_csv(io.BytesIO(self._get(self.stub.mlb_url, "2024-06-03", "2024-06-04").content))
+
+        self.assertTrue(set(KNOWN_COLUMN_TYPES) <= set(df.columns))
+        self.assertEqual(df["game_date"].value_counts().to_dict(), {"2024-06-04": 100, "2024-06-03": 60})
+
+    def test_offseason_and_minors(self):
+        offseason = self._get(self.stub.mlb_url, "2024-12-01", "2024-12-05")
+        self.assertEqual(len(offseason.content.splitlines()), 1)
+
+        self.assertEqual(self.stub.expected_rows("milb", "2024-06-04", "2024-06-05"), 100)
+        df = _fetch_chunk("2024-06-04", "2024-06-05", self.stub.milb_url, {}, PARAMS_DICT)
+        self.assertEqual(len(df), 100)
+
+    def test_truncates_at_row_cap(self):
+        df = _fetch_chunk("2024-06-04", "2024-06-08", self.stub.mlb_url, {}, PARAMS_DICT)
+
+        self.assertEqual(len(df), 250)
+        self.assertEqual(self.stub.stats["truncated"], 1)
+
+    def test_throttles_beyond_max_concurrent(self):
+        stub = SavantStub(rows_per_day={"mlb": 10}, latency=0.3, max_concurrent=1).start()
+        self.addCleanup(stub.stop)
+        statuses = []
+        threads = [threading.Thread(target=lambda: statuses.append(
+            self._get(stub.mlb_url, "2024-06-04", "2024-06-04").status_code)) for _ in range(3)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(sorted(statuses), [200, 429, 429])
+        self.assertEqual(stub.stats["throttled"], 2)
+
+    def test_compare_flags_regressions(self):
+        baseline = {"fetch_chunk": {"rows_per_sec": 1000.0}, "clean_dataframe": {"rows_per_sec": 1000.0}}
+        results = {"fetch_chunk": {"rows_per_sec": 700.0}, "clean_dataframe": {"rows_per_sec": 900.0},
+                   "csv_writer": {"rows_per_sec": 1.0}}
+
+        self.assertEqual(compare(results, baseline, 0.2), ["fetch_chunk"])
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,91 @@
+import unittest
+import datetime
+import shutil
+import sys
+import os
+import tempfile
+from unittest.mock import patch
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from benchmarks.savant_stub import SavantStub, rows_for_day
+from src.statcast_fetch import run_statcast_download
+from src.utils.season_calendar import SeasonCalendar
+from src.writers.csv_writer import CSVWriter
+
+SPORT_IDS = {"mlb": [1], "milb": [11, 14]}
+ROWS_PER_GAME = {"mlb": 300, "milb": 150}
+
+
+class TestSeasonCalendar(unittest.TestCase):
+
+    def setUp(self):
+        self.stub = SavantStub().start()
+        self.addCleanup(self.stub.stop)
+        self.tmp = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.tmp)
+        self.path = os.path.join(self.tmp, "calendar.json")
+
+    def _calendar(self, schedule_url=None, **kwargs):
+        return SeasonCalendar(self.path, schedule_url or self.stub.schedule_url, SPORT_IDS,
+                              rows_per_game=ROWS_PER_GAME, **kwargs)
+
+    def test_windows_skip_the_offseason_and_balance_rows(self):
+        start, end = datetime.date(2023, 9, 20), datetime.date(2024, 4, 10)
+
+        windows = self._calendar().windows("mlb", start, end, target_rows=20000)
+
+        self.assertEqual(self.stub.stats["schedule_requests"], 2)
+        self.assertEqual({window_start.year for window_start, _ in windows}, {2023, 2024})
+        for window_start, window_end in windows:
+            self.assertGreater(rows_for_day("mlb", window_start), 0)
+            self.assertGreater(rows_for_day("mlb", window_end), 0)
+            rows = sum(rows_for_day("mlb", window_start + datetime.timedelta(days=n))
+                       for n in range((window_end - window_start).days + 1))
+            self.assertLessEqual(rows, 20000)
+        covered = sum(rows_for_day("mlb", s + datetime.timedelta(days=n))
+                      for s, e in windows for n in range((e - s).days + 1))
+        self.assertEqual(covered, sum(rows_for_day("mlb", start + datetime.timedelta(days=n))
+                                      for n in range((end - start).days + 1)))
+
+    def test_schedules_are_cached_on_disk(self):
+        self._calendar().windows("milb", datetime.date(2024, 1, 1), datetime.date(2024, 12, 31))
+
+        calendar = self._calendar(offline=True)
+
+        self.assertEqual(calendar.expected_rows("milb", datetime.date(2024, 6, 4)), 3000)
+        self.assertEqual(calendar.expected_rows("milb", datetime.date(2024, 12, 4)), 0)
+        self.assertIsNone(calendar.season("mlb", 2024))
+        self.assertEqual(self.stub.stats["schedule_requests"], 1)
+
+    def test_unreadable_schedule_counts_every_day_once(self):
+        calendar = self._calendar(self.stub.base_url + "/missing", full_slate_games={"mlb": 10})
+
+        windows = calendar.windows("mlb", datetime.date(2024, 1, 1), datetime.date(2024, 1, 20),
+                                   target_rows=6000)
+
+        self.assertEqual(self.stub.stats["requests"], 1)
+        self.assertEqual(len(windows), 10)
+        self.assertEqual(windows[0], (datetime.date(2024, 1, 1), datetime.date(2024, 1, 2)))
+
+
+class TestCalendarDownload(unittest.TestCase):
+
+    def test_download_requests_only_game_days(self):
+        stub = SavantStub(rows_per_day={"mlb": 300}).start()
+        self.addCleanup(stub.stop)
+        tmp = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmp)
+        calendar = SeasonCalendar(os.path.join(tmp, "calendar.json"), stub.schedule_url, SPORT_IDS,
+                                  rows_per_game={"mlb": 20})
+
+        with patch("src.statcast_fetch.BASE_MLB_URL", stub.mlb_url):
+            summary = run_statcast_download("2023-10-20", "2024-03-31", csv_writer=CSVWriter(tmp),
+                                            league="mlb", chunk_size=5, progress=False, calendar=calendar)
+
+        # 12 game days at the end of 2023 and 12 at the start of 2024, 20000-row windows
+        self.assertEqual(stub.stats["requests"], 2)
+        self.assertEqual(summary["leagues"]["mlb"]["rows"], stub.expected_rows("mlb", "2023-10-20", "2024-03-31"))
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
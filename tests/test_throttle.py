@@ -0,0 +1,103 @@
+import unittest
+import datetime
+import random
+import sys
+import os
+from unittest.mock import patch
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from benchmarks.savant_stub import SavantStub
+from src.config.config import PARAMS_DICT
+from src.statcast_fetch import _iter_chunks_threaded
+from src.utils.chunk_planner import ChunkPlanner
+from src.utils.throttle import AdaptiveThrottle, TokenBucket, decorrelated_jitter, retry_after_seconds
+
+
+class TestBackoff(unittest.TestCase):
+
+    def test_decorrelated_jitter_stays_in_bounds(self):
+        rng = random.Random(7)
+        delay, delays = 2, []
+        for _ in range(50):
+            delay = decorrelated_jitter(delay, 2, 60, rng=rng)
+            delays.append(delay)
+
+        self.assertTrue(all(2 <= d <= 60 for d in delays))
+        self.assertGreater(len(set(delays)), 40)
+        self.assertEqual(max(delays), 60)
+
+    def test_retry_after(self):
+        self.assertEqual(retry_after_seconds({"Retry-After": "3"}), 3.0)
+        self.assertIsNone(retry_after_seconds({"Retry-After": "Wed, 21 Oct 2026 07:28:00 GMT"}))
+        self.assertIsNone(retry_after_seconds(None))
+
+
+class TestTokenBucket(unittest.TestCase):
+
+    @patch("src.utils.throttle.time.monotonic", return_value=100.0)
+    def test_burst_then_queue(self, _):
+        bucket = TokenBucket(rate_per_sec=2, burst=2)
+
+        waits = [bucket.reserve() for _ in range(4)]
+
+        self.assertEqual(waits, [0.0, 0.0, 0.5, 1.0])
+
+
+class TestAdaptiveThrottle(unittest.TestCase):
+
+    MB = 1024 ** 2
+
+    def test_grows_while_healthy_and_holds_when_slow(self):
+        throttle = AdaptiveThrottle(initial=2, max_limit=8)
+        for _ in range(10):
+            throttle.on_success(1.0, self.MB)
+        grown = throttle.limit
+        self.assertGreaterEqual(grown, 4)
+
+        for _ in range(10):
+            throttle.on_success(5.0, self.MB)
+        self.assertEqual(throttle.limit, grown)
+
+    @patch("src.utils.throttle.time.monotonic")
+    def test_congestion_halves_once_per_round(self, monotonic):
+        throttle = AdaptiveThrottle(initial=8, max_limit=16)
+        monotonic.return_value = 100.0
+        for _ in range(5):
+            throttle.on_congestion()
+        self.assertEqual(throttle.limit, 4)
+
+        monotonic.return_value = 102.0
+        throttle.on_congestion()
+        self.assertEqual(throttle.limit, 2)
+        self.assertEqual((throttle.low_water, throttle.high_water), (2, 8))
+
+    def test_fixed_limit_when_not_adaptive(self):
+        throttle = AdaptiveThrottle(initial=4, max_limit=4, adaptive=False)
+        throttle.on_congestion()
+        throttle.on_success(0.1, self.MB)
+        self.assertEqual(throttle.limit, 4)
+        self.assertTrue(AdaptiveThrottle.is_congestion(503))
+        self.assertTrue(AdaptiveThrottle.is_congestion(timeout=True))
+        self.assertFalse(AdaptiveThrottle.is_congestion(404))
+
+
+class TestThrottledFetch(unittest.TestCase):
+
+    @patch("src.statcast_fetch.RETRY_BACKOFF_CAP", 0.5)
+    def test_backs_off_to_what_the_server_allows(self):
+        stub = SavantStub(rows_per_day={"mlb": 50}, latency=0.2, max_concurrent=2).start()
+        self.addCleanup(stub.stop)
+        day = datetime.date(2024, 6, 1)
+        planner = ChunkPlanner([(day + datetime.timedelta(days=n),) * 2 for n in range(12)])
+        throttle = AdaptiveThrottle(initial=8, max_limit=8)
+
+        chunks = list(_iter_chunks_threaded(planner, stub.mlb_url, {}, PARAMS_DICT, throttle=throttle))
+
+        self.assertEqual(len(chunks), 12)
+        self.assertTrue(all(df is not None and len(df) > 0 for _, _, df in chunks))
+        self.assertGreater(stub.stats["throttled"], 0)
+        self.assertLess(throttle.low_water, 8)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
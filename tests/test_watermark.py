@@ -0,0 +1,140 @@
+import unittest
+import datetime
+import tempfile
+from unittest.mock import MagicMock, patch
+import pandas as pd
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.statcast_fetch import run_statcast_download
+from src.utils.watermark import WatermarkState, incremental_start
+from src.writers.bq_writer import BQWriter
+
+
+class FlakyBQWriter:
+    """Loads every chunk except those holding fail_date, for which write returns None like BQWriter."""
+
+    def __init__(self, fail_date):
+        self.fail_date = fail_date
+        self.loaded = []
+
+    def write(self, df, league, schema, truncate, on_loaded=None):
+        if self.fail_date in df["game_date"].values:
+            return None
+        self.loaded.extend(df["game_date"])
+        if on_loaded:
+            on_loaded(["job"])
+        return ["job"]
+
+    def flush(self, league=None):
+        pass
+
+
+def _fake_chunk(start_date_str, end_date_str, *args, **kwargs):
+    return pd.DataFrame({"game_date": [start_date_str, end_date_str], "pitch_type": ["FF", "SL"]})
+
+
+@patch("src.statcast_fetch.table_exists", return_value=True)
+@patch("src.statcast_fetch._fetch_chunk", side_effect=_fake_chunk)
+def _download(writer, state, mock_fetch_chunk, mock_table_exists, **kwargs):
+    return run_statcast_download("2025-07-01", "2025-07-06", bq_writer=writer, league="mlb", chunk_size=2,
+                                 max_workers=1, progress=False, watermark_state=state, **kwargs)
+
+
+class TestIncrementalStart(unittest.TestCase):
+
+    def setUp(self):
+        self.season_start = datetime.date(2025, 3, 27)
+        self.today = datetime.date(2025, 7, 10)
+
+    def test_no_watermark_fetches_everything(self):
+        self.assertEqual(incremental_start(self.season_start, self.today, None, 3), self.season_start)
+
+    def test_starts_lookback_days_before_watermark(self):
+        start = incremental_start(self.season_start, self.today, datetime.date(2025, 7, 9), 3)
+        self.assertEqual(start, datetime.date(2025, 7, 6))
+
+    def test_never_before_start_date(self):
+        start = incremental_start(self.season_start, self.today, datetime.date(2025, 3, 28), 7)
+        self.assertEqual(start, self.season_start)
+
+    def test_nothing_to_fetch(self):
+        start = incremental_start(self.season_start, self.today, datetime.date(2025, 7, 20), 3)
+        self.assertIsNone(start)
+
+
+class TestWatermarkState(unittest.TestCase):
+
+    def test_persists_and_only_moves_forward(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "state", "watermarks.json")
+            state = WatermarkState(path)
+            self.assertIsNone(state.get("mlb"))
+
+            state.set("mlb", datetime.date(2025, 7, 9))
+            state.set("mlb", datetime.date(2025, 7, 1))
+            self.assertEqual(WatermarkState(path).get("mlb"), datetime.date(2025, 7, 9))
+            self.assertIsNone(WatermarkState(path).get("milb"))
+
+    def test_set_from_confirmed_loads_only(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            state = WatermarkState(os.path.join(tmp, "watermarks.json"))
+
+            _download(FlakyBQWriter(fail_date="never"), state)
+            self.assertEqual(state.get("mlb"), datetime.date(2025, 7, 6))
+
+    def test_failed_load_holds_watermark_before_it(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            state = WatermarkState(os.path.join(tmp, "watermarks.json"))
+            writer = FlakyBQWriter(fail_date="2025-07-03")
+
+            with self.assertLogs(level="WARNING") as logs:
+                _download(writer, state)
+
+            self.assertIn("2025-07-06", writer.loaded)
+            self.assertEqual(state.get("mlb"), datetime.date(2025, 7, 2))
+            self.assertIn("holding the watermark at 2025-07-02", "\n".join(logs.output))
+
+
+class TestIncrementalRun(unittest.TestCase):
+
+    def setUp(self):
+        self.client = MagicMock()
+        self.client.project = "crzzpy"
+        patcher = patch("src.writers.bq_writer.get_bigquery_client", return_value=self.client)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.state = WatermarkState(os.path.join(tmp.name, "watermarks.json"))
+        self.state.set("mlb", datetime.date(2025, 7, 4))
+
+    def test_truncating_writer_is_refused(self):
+        writer = BQWriter("crzzpy", "test", "statcast", write_mode="truncate")
+
+        with self.assertRaises(ValueError):
+            _download(writer, self.state, incremental=True, lookback_days=1)
+
+        self.client.load_table_from_json.assert_not_called()
+        self.client.query.assert_not_called()
+
+    def test_append_writer_deletes_refetched_days_and_appends(self):
+        writer = BQWriter("crzzpy", "test", "statcast", write_mode="append")
+
+        _download(writer, self.state, incremental=True, lookback_days=1)
+
+        delete_sql, = [call.args[0] for call in self.client.query.call_args_list]
+        self.assertIn("DELETE FROM", delete_sql)
+        self.assertEqual(self.client.query.call_args.kwargs["job_config"].query_parameters[0].value,
+                         datetime.date(2025, 7, 3))
+        dispositions = {call.kwargs["job_config"].write_disposition
+                        for call in self.client.load_table_from_json.call_args_list}
+        self.assertEqual(dispositions, {"WRITE_APPEND"})
+        loaded = sorted(row["game_date"] for call in self.client.load_table_from_json.call_args_list
+                        for row in call.args[0])
+        self.assertEqual(loaded[0], "2025-07-03")
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)